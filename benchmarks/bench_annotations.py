@@ -0,0 +1,97 @@
+"""Compares deserializing v2 tasks whose annotations are dispatched on
+their `type`, with the previous JSON round trip through `from_json`
+and a validated assignment of each annotation.
+
+    $ python benchmarks/bench_annotations.py --turns 20 --annotations 50
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import make_v2_task  # noqa: E402
+from scaleapi.api_client.v2.models import Annotation, Task  # noqa: E402
+from scaleapi.api_client.v2.models.annotation import (  # noqa: E402
+    ANNOTATION_TYPE_CLASSES,
+)
+
+# Values of the annotation types, others are sent without a value
+VALUES = {
+    "integer": 4,
+    "boolean": True,
+    "text": "The response answers the question.",
+    "category": "helpful",
+    "category_multiple": ["accurate", "concise"],
+    "ranked_choices": ["b", "a", "c"],
+    "ranked_groups": [["b"], ["a", "c"]],
+}
+
+
+def make_task(task_id: str, turns: int, annotations: int) -> dict:
+    """Returns a v2 task with `annotations` annotations of every
+    type on each turn"""
+    task = make_v2_task(task_id, turns=turns)
+    types = list(ANNOTATION_TYPE_CLASSES)
+    for turn in task["threads"][0]["turns"]:
+        turn["annotations"] = [
+            {
+                "id": f"{turn['id']}_a{i}",
+                "key": f"question_{i}",
+                "type": types[i % len(types)],
+                "value": VALUES.get(types[i % len(types)]),
+            }
+            for i in range(annotations)
+        ]
+    return task
+
+
+def from_dict_round_trip(cls, obj):
+    """Previous `Annotation.from_dict()`, serializing the annotation
+    to JSON and validating its assignment to `actual_instance`"""
+    json_str = json.dumps(obj)
+    data = json.loads(json_str)
+    instance = cls.model_construct()
+    instance.actual_instance = ANNOTATION_TYPE_CLASSES[data["type"]].from_json(json_str)
+    return instance
+
+
+def timed(tasks, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for task in tasks:
+            Task.from_dict(task)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--annotations", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    tasks = [
+        make_task(f"task_{i}", args.turns, args.annotations) for i in range(args.tasks)
+    ]
+    count = args.tasks * args.turns * args.annotations
+
+    dispatch = timed(tasks, args.repeat)
+    with mock.patch.object(Annotation, "from_dict", classmethod(from_dict_round_trip)):
+        round_trip = timed(tasks, args.repeat)
+
+    for name, elapsed in (("round trip", round_trip), ("dispatch", dispatch)):
+        print(
+            f"{name:<12} {elapsed * 1e3:8.1f} ms  "
+            f"{elapsed / count * 1e6:6.1f} us/annotation  "
+            f"{round_trip / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
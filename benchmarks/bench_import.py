@@ -0,0 +1,100 @@
+"""Measures the cold import time of `scaleapi` with
+`python -X importtime`, and the time of the first `ScaleClient.v2`
+access which imports the generated v2 client and its models.
+
+    $ python benchmarks/bench_import.py --json import.json
+    $ python benchmarks/bench_import.py --baseline import.json
+
+Each sample runs in a new interpreter. With `--baseline`, the script
+exits with an error if a median grew more than `--tolerance`.
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative microseconds of an import in `-X importtime` output
+IMPORTTIME = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+V2_ACCESS = """
+import time, scaleapi
+client = scaleapi.ScaleClient("test_key")
+start = time.perf_counter()
+client.v2
+print(int((time.perf_counter() - start) * 1e6))
+"""
+
+
+def import_time(module: str) -> float:
+    """Cumulative import time of `module` in ms, in a new interpreter"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME.match(line)
+        if match and match.group(2) == module:
+            return int(match.group(1)) / 1000
+    raise RuntimeError(f"{module} not found in importtime output")
+
+
+def v2_access_time() -> float:
+    """Time of the first `ScaleClient.v2` access in ms"""
+    result = subprocess.run(
+        [sys.executable, "-c", V2_ACCESS],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout) / 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--samples", type=int, default=10)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare to results of a --json run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    metrics = {
+        "import_scaleapi_ms": [import_time("scaleapi") for _ in range(args.samples)],
+        "first_v2_access_ms": [v2_access_time() for _ in range(args.samples)],
+    }
+    results = {name: statistics.median(values) for name, values in metrics.items()}
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+
+    slower = []
+    for name, value in results.items():
+        change = ""
+        if name in baseline:
+            change = f"{value / baseline[name] - 1:+.1%}"
+            if value > baseline[name] * (1 + args.tolerance):
+                slower.append(name)
+        print(f"{name:<20} {value:8.1f} ms {change:>8}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+    if slower:
+        sys.exit(f"Import time regressed beyond {args.tolerance:.0%}: {slower}")
+
+
+if __name__ == "__main__":
+    main()
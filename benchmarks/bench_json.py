@@ -0,0 +1,103 @@
+"""Compares the JSON codecs on large task pages: decoding straight
+from bytes and encoding alone, then end to end through `get_tasks()`
+against the stub server serving the same tasks.
+
+    $ python benchmarks/bench_json.py --annotations 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer, make_task  # noqa: E402
+from scaleapi import ScaleClient, json_codec  # noqa: E402
+
+
+def make_task_fields(annotations: int) -> dict:
+    """Returns the fields of a completed task with a full response"""
+    boxes = [
+        {
+            "uuid": f"box-{i}",
+            "label": "car",
+            "left": 10.5 * i,
+            "top": 20.25,
+            "width": 100.0,
+            "height": 42.0,
+            "attributes": {"occluded": "no", "truncated": "partially"},
+        }
+        for i in range(annotations)
+    ]
+    return {"status": "completed", "response": {"annotations": boxes}}
+
+
+def make_page(tasks: int, annotations: int) -> dict:
+    """Returns a `tasks` page of completed tasks with full responses"""
+    fields = make_task_fields(annotations)
+    docs = [make_task(f"task_{i}", **fields) for i in range(tasks)]
+    return {"docs": docs, "total": tasks, "has_more": False, "next_token": None}
+
+
+def timed(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def available_codecs():
+    for name in ("json", "ujson", "orjson"):
+        try:
+            json_codec.set_codec(name)
+        except ImportError:
+            continue
+        yield name, json_codec.get_codec()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100, help="tasks per page")
+    parser.add_argument("--annotations", type=int, default=200)
+    parser.add_argument("--pages", type=int, default=10, help="pages end to end")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    page = make_page(args.tasks, args.annotations)
+    encoded = json_codec.get_codec().dumps(page)
+    print(f"page of {args.tasks} tasks: {len(encoded) / 1e6:.2f} MB")
+
+    previous = json_codec.get_codec()
+    codecs = list(available_codecs())
+
+    print("decode and encode only")
+    for name, codec in codecs:
+        json_codec.set_codec(name)
+        loads = timed(lambda codec=codec: codec.loads(encoded), args.repeat)
+        dumps = timed(lambda codec=codec: codec.dumps(page), args.repeat)
+        print(f"  {name:<7} loads {loads * 1000:7.2f} ms  dumps {dumps * 1000:7.2f} ms")
+
+    print(f"get_tasks, {args.pages} pages end to end (best of 3)")
+    server = StubServer(
+        total_tasks=args.tasks * args.pages,
+        task_overrides=make_task_fields(args.annotations),
+    )
+    with server, ScaleClient("test_key", api_instance_url=server.url) as client:
+
+        def export():
+            tasks = client.get_tasks(project_name="p", limit=args.tasks)
+            assert sum(1 for _ in tasks) == args.tasks * args.pages
+
+        for name, _ in codecs:
+            json_codec.set_codec(name)
+            elapsed = min(timed(export, 1) for _ in range(3))
+            print(
+                f"  {name:<7} {args.pages / elapsed:6.1f} pages/s  "
+                f"{args.tasks * args.pages / elapsed:8.0f} tasks/s"
+            )
+    json_codec.set_codec(previous)
+
+
+if __name__ == "__main__":
+    main()
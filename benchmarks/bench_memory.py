@@ -0,0 +1,51 @@
+"""Compares the memory held by tasks listed with `get_tasks()` and
+with `get_tasks(compact=True)`, against the local stub server.
+
+    $ python benchmarks/bench_memory.py --tasks 100000
+"""
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from scaleapi import ScaleClient  # noqa: E402
+
+
+def measure(client, compact):
+    """Lists all tasks, returns (held bytes, seconds)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    tasks = list(client.get_tasks(project_name="benchmark_project", compact=compact))
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+    return held, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=50000)
+    args = parser.parse_args()
+
+    with StubServer(total_tasks=args.tasks) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            for compact in (False, True):
+                held, elapsed = measure(client, compact)
+                print(
+                    f"{'CompactTask' if compact else 'Task':<12} "
+                    f"{held / 1e6:8.1f} MB  {held / args.tasks:7.0f} B/task  "
+                    f"{args.tasks / elapsed:8.0f} tasks/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""Measures `get_tasks()` export time with and without page
+prefetching, when both the API and the consumer take time.
+
+    $ python benchmarks/bench_prefetch.py --tasks 2000 --latency 0.05
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from scaleapi import ScaleClient  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--work", type=float, default=0.0005)
+    args = parser.parse_args()
+
+    with StubServer(total_tasks=args.tasks, latency=args.latency) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            for prefetch in (0, 1, 4):
+                start = time.perf_counter()
+                count = 0
+                for _ in client.get_tasks(project_name="p", prefetch=prefetch):
+                    time.sleep(args.work)  # simulated per-task processing
+                    count += 1
+                elapsed = time.perf_counter() - start
+                print(
+                    f"prefetch={prefetch}  {count} tasks in {elapsed:6.2f}s  "
+                    f"({count / elapsed:8.1f} tasks/s)"
+                )
+
+
+if __name__ == "__main__":
+    main()
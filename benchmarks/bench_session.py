@@ -0,0 +1,62 @@
+"""Compares requests per second of a pooled, long-lived HTTP session
+against opening a new session (and connection) for every request.
+
+    $ python benchmarks/bench_session.py --requests 2000 --threads 8
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from scaleapi.api import Api  # noqa: E402
+
+
+def _run(call, requests_count: int, threads: int) -> float:
+    """Runs `call` the given number of times and returns requests/sec"""
+    start = time.perf_counter()
+    if threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(lambda _: call(), range(requests_count)))
+    else:
+        for _ in range(requests_count):
+            call()
+    return requests_count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+
+    with StubServer() as server:
+
+        def new_session_per_request():
+            with Api("test_key", api_instance_url=server.url) as api:
+                api.get_request("task/task_0")
+
+        pooled_api = Api(
+            "test_key", api_instance_url=server.url, pool_maxsize=args.threads
+        )
+
+        def pooled_session():
+            pooled_api.get_request("task/task_0")
+
+        for threads in sorted({1, args.threads}):
+            cold = _run(new_session_per_request, args.requests, threads)
+            warm = _run(pooled_session, args.requests, threads)
+            print(
+                f"threads={threads:<3} new session: {cold:8.1f} req/s   "
+                f"pooled session: {warm:8.1f} req/s   speedup: {warm / cold:.2f}x"
+            )
+
+        pooled_api.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""Reproducible benchmark suite of the client against the local stub
+server, measuring throughput and per-request latency of the create,
+get, list, export and upload paths.
+
+    $ python benchmarks/bench_suite.py
+    $ python benchmarks/bench_suite.py --scenarios list --json run.json
+    $ python benchmarks/bench_suite.py --baseline run.json
+
+With `--baseline`, results are compared to a previous `--json` run and
+the script exits with an error if any scenario lost more throughput
+than `--tolerance`, so it can gate transport or deserialization
+changes.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import StubServer  # noqa: E402
+from scaleapi import LatencyHistogram, ScaleClient  # noqa: E402
+from scaleapi.tasks import TaskType  # noqa: E402
+
+
+def bench_create(client, args):
+    """Creates tasks concurrently with `create_tasks()`"""
+    payloads = ({"instruction": "Draw boxes"} for _ in range(args.requests))
+    results = client.create_tasks(
+        TaskType.ImageAnnotation, payloads, concurrency=args.concurrency
+    )
+    return sum(1 for _ in results)
+
+
+def bench_get(client, args):
+    """Fetches single tasks one after the other"""
+    for i in range(args.requests):
+        client.get_task(f"task_{i}")
+    return args.requests
+
+
+def bench_list(client, _):
+    """Lists all tasks of the v1 `tasks` endpoint"""
+    return sum(1 for _ in client.get_tasks(project_name="benchmark_project"))
+
+
+def bench_export(client, _):
+    """Exports all v2 tasks, including threads and annotations"""
+    count, next_token = 0, None
+    while True:
+        page = client.v2.get_tasks(
+            project_id="project_0", limit=100, next_token=next_token
+        )
+        count += len(page.tasks)
+        next_token = page.next_token
+        if not next_token:
+            return count
+
+
+def bench_upload(client, args):
+    """Uploads files of `--file-size` KiB"""
+    content = os.urandom(args.file_size * 1024)
+    for _ in range(args.requests):
+        client.upload_file(io.BytesIO(content))
+    return args.requests
+
+
+SCENARIOS = {
+    "create": bench_create,
+    "get": bench_get,
+    "list": bench_list,
+    "export": bench_export,
+    "upload": bench_upload,
+}
+
+
+def run_scenario(name, server, args):
+    """Runs a scenario with a new client, returns its measurements"""
+    histogram = LatencyHistogram()
+    client = ScaleClient(
+        "test_key",
+        api_instance_url=server.url,
+        pool_maxsize=args.concurrency,
+        hooks=[histogram],
+    )
+    client.v2.api_client.configuration.host = server.v2_url
+
+    with client:
+        start = time.perf_counter()
+        items = SCENARIOS[name](client, args)
+        elapsed = time.perf_counter() - start
+
+    rows = histogram.summary()
+    requests = sum(row["count"] for row in rows)
+    slowest = max(rows, key=lambda row: row["p50"])
+    return {
+        "scenario": name,
+        "items": items,
+        "requests": requests,
+        "seconds": elapsed,
+        "items_per_second": items / elapsed,
+        "p50_ms": slowest["p50"] * 1000,
+        "p95_ms": slowest["p95"] * 1000,
+        "p99_ms": slowest["p99"] * 1000,
+        "retries": sum(row["retries"] for row in rows),
+    }
+
+
+def print_results(results, baseline):
+    print(
+        f"{'scenario':<8} {'items':>7} {'requests':>8} {'seconds':>8} "
+        f"{'items/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'change':>8}"
+    )
+    for result in results:
+        change = ""
+        if result["scenario"] in baseline:
+            previous = baseline[result["scenario"]]["items_per_second"]
+            change = f"{result['items_per_second'] / previous - 1:+8.1%}"
+        print(
+            f"{result['scenario']:<8} {result['items']:>7} {result['requests']:>8} "
+            f"{result['seconds']:>8.2f} {result['items_per_second']:>10.1f} "
+            f"{result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {change:>8}"
+        )
+
+
+def regressions(results, baseline, tolerance):
+    """Names of scenarios slower than the baseline beyond tolerance"""
+    return [
+        result["scenario"]
+        for result in results
+        if result["scenario"] in baseline
+        and result["items_per_second"]
+        < baseline[result["scenario"]]["items_per_second"] * (1 - tolerance)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument("--tasks", type=int, default=2000, help="tasks to list")
+    parser.add_argument("--requests", type=int, default=500, help="calls per run")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--file-size", type=int, default=256, help="KiB")
+    parser.add_argument("--turns", type=int, default=2, help="turns per v2 task")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--baseline", help="compare to results of a --json run")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = {result["scenario"]: result for result in json.load(file)}
+
+    server = StubServer(
+        total_tasks=args.tasks,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        v2_turns=args.turns,
+    )
+    with server:
+        results = [run_scenario(name, server, args) for name in args.scenarios]
+
+    print_results(results, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+
+    slower = regressions(results, baseline, args.tolerance)
+    if slower:
+        sys.exit(f"Throughput regressed beyond {args.tolerance:.0%}: {slower}")
+
+
+if __name__ == "__main__":
+    main()
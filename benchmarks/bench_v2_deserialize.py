@@ -0,0 +1,98 @@
+"""Compares the deserialization of v2 `get_tasks` pages with pydantic
+validation, with `validate_responses=False`, and with `lazy_threads`,
+reporting the time to deserialize a page, the time to also read the
+threads of every task, and the memory retained by the page.
+
+    $ python benchmarks/bench_v2_deserialize.py --tasks 100 --turns 20
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.stub_server import make_v2_task  # noqa: E402
+from scaleapi.api_client.v2 import ApiClient  # noqa: E402
+
+
+def best_of(func, repeat):
+    """Fastest of `repeat` runs, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def retained(func):
+    """Bytes allocated by `func` and still held by its result"""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    result = func()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del result
+    return size
+
+
+MODES = (
+    # name, validate_responses, lazy_threads
+    ("validated", True, False),
+    ("construct", False, False),
+    ("lazy", True, True),
+    ("lazy+cons", False, True),
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=100, help="tasks per page")
+    parser.add_argument("--turns", type=int, default=20, help="turns per task")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    page = json.dumps(
+        {
+            "tasks": [
+                make_v2_task(f"task_{i}", turns=args.turns) for i in range(args.tasks)
+            ],
+            "next_token": None,
+        }
+    ).encode("utf-8")
+
+    api_client = ApiClient()
+    results = {}
+    for name, validate, lazy in MODES:
+        api_client.validate_responses = validate
+        api_client.lazy_threads = lazy
+
+        def deserialize():
+            return api_client.deserialize(page, "GetTasksResponse", "application/json")
+
+        def read_threads():
+            for task in deserialize().tasks:
+                task.threads  # pylint: disable=pointless-statement
+
+        deserialize()
+        results[name] = (
+            best_of(deserialize, args.repeat),
+            best_of(read_threads, args.repeat),
+            retained(deserialize),
+        )
+
+    baseline = results["validated"][0]
+    for name, (elapsed, with_threads, size) in results.items():
+        print(
+            f"{name:<10} {elapsed * 1e3:8.1f} ms/page  {baseline / elapsed:6.2f}x  "
+            f"{with_threads * 1e3:8.1f} ms/page with threads  "
+            f"{size / 2 ** 20:6.1f} MiB/page"
+        )
+
+
+if __name__ == "__main__":
+    main()
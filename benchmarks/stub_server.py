@@ -0,0 +1,540 @@
+"""Local stand-in for the Scale API, used to test and benchmark the
+client without network latency or API quota.
+
+Answers the v1 `task`, `tasks`, `batches`, `projects` and `files`
+endpoints and the v2 endpoints used by `V2Api`, with configurable
+latency, server errors and 429 throttling.
+
+    with StubServer() as server:
+        client = ScaleClient("test_key", api_instance_url=server.url)
+        client.get_task("task_0")
+
+        client.v2.api_client.configuration.host = server.v2_url
+        client.v2.get_task(task_id="task_0")
+"""
+
+import collections
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+CREATED_AT = "2021-06-17T21:46:36.359Z"
+
+
+def make_task(task_id: str, **overrides) -> dict:
+    """Returns a task payload shaped like the v1 API response"""
+    task = {
+        "task_id": task_id,
+        "created_at": CREATED_AT,
+        "updated_at": CREATED_AT,
+        "completed_at": None,
+        "type": "imageannotation",
+        "status": "pending",
+        "project": "benchmark_project",
+        "batch": "benchmark_batch",
+        "unique_id": None,
+        "callback_url": "http://www.example.com/callback",
+        "metadata": {},
+        "tags": [],
+        "params": {
+            "attachment_type": "image",
+            "attachment": "http://i.imgur.com/v4cBreD.jpg",
+            "geometries": {"box": {"objects_to_annotate": ["Baby Cow", "Big Cow"]}},
+        },
+    }
+    task.update(overrides)
+    return task
+
+
+def make_batch(name: str, **overrides) -> dict:
+    """Returns a batch payload shaped like the v1 API response"""
+    batch = {
+        "name": name,
+        "project": "benchmark_project",
+        "status": "staging",
+        "created_at": CREATED_AT,
+        "callback": None,
+        "metadata": {},
+    }
+    batch.update(overrides)
+    return batch
+
+
+def make_project(name: str, **overrides) -> dict:
+    """Returns a project payload shaped like the v1 API response"""
+    project = {
+        "name": name,
+        "type": "imageannotation",
+        "created_at": CREATED_AT,
+        "param_history": [
+            {"version": 0, "instruction": "Draw boxes", "created_at": CREATED_AT}
+        ],
+    }
+    project.update(overrides)
+    return project
+
+
+def make_file(size: int, **overrides) -> dict:
+    """Returns a file payload shaped like the v1 API response"""
+    file_id = uuid.uuid4().hex
+    file = {
+        "id": file_id,
+        "mime_type": "application/octet-stream",
+        "size": size,
+        "attachment_url": f"scaledata://benchmark/{file_id}",
+        "metadata": {},
+    }
+    file.update(overrides)
+    return file
+
+
+def make_v2_task(task_id: str, turns: int = 1, **overrides) -> dict:
+    """Returns a completed task payload shaped like the v2 API
+    response, with `turns` conversation turns and their annotations"""
+    task = {
+        "task_id": task_id,
+        "project": "project_0",
+        "batch": "batch_0",
+        "status": "completed",
+        "created_at": CREATED_AT,
+        "completed_at": CREATED_AT,
+        "metadata": {"source": "benchmark"},
+        "threads": [
+            {
+                "id": f"{task_id}_thread",
+                "turns": [_make_v2_turn(f"{task_id}_{i}") for i in range(turns)],
+                "annotations": [],
+            }
+        ],
+    }
+    task.update(overrides)
+    return task
+
+
+def _make_v2_turn(turn_id: str) -> dict:
+    return {
+        "id": turn_id,
+        "messages": [
+            {
+                "role": role,
+                "content": {"text": f"{role} message of turn {turn_id}. " * 8},
+                "source_id": f"{role}_source",
+                "annotations": [],
+            }
+            for role in ("user", "assistant")
+        ],
+        "annotations": [
+            {"id": f"{turn_id}_a0", "key": "rating", "type": "integer", "value": 4},
+            {
+                "id": f"{turn_id}_a1",
+                "key": "category",
+                "type": "category",
+                "value": "helpful",
+                "possible_values": ["helpful", "unhelpful"],
+            },
+            {
+                "id": f"{turn_id}_a2",
+                "key": "explanation",
+                "type": "text",
+                "value": "The response answers the question.",
+            },
+        ],
+    }
+
+
+def make_v2_batch(batch_id: str, **overrides) -> dict:
+    """Returns a batch payload shaped like the v2 API response"""
+    batch = {
+        "id": batch_id,
+        "name": batch_id,
+        "project": "project_0",
+        "created_at": CREATED_AT,
+        "status": "in_progress",
+        "metadata": {},
+    }
+    batch.update(overrides)
+    return batch
+
+
+def make_v2_project(project_id: str, **overrides) -> dict:
+    """Returns a project payload shaped like the v2 API response"""
+    project = {
+        "id": project_id,
+        "name": project_id,
+        "created_at": CREATED_AT,
+        "types": ["chat"],
+    }
+    project.update(overrides)
+    return project
+
+
+def _page(query, total, default_limit=100, key="next_token"):
+    """Offset of the requested page, its end and the next token"""
+    limit = int(query.get("limit", default_limit))
+    offset = int(query.get(key) or query.get("offset") or 0)
+    end = min(offset + limit, total)
+    return offset, end, limit, str(end) if end < total else None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment, otherwise keep-alive
+    # connections stall on Nagle's algorithm and delayed ACKs
+    disable_nagle_algorithm = True
+    wbufsize = 64 * 1024
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+    def _send_json(self, payload, status=200, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _handle(self):
+        url = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        body = self._read_body()
+        self.server.count(self.command, url.path)
+        time.sleep(self.server.latency)
+
+        injected = self.server.inject_failure()
+        if injected:
+            self._send_json(*injected)
+            return
+
+        for method, pattern, route in ROUTES:
+            match = pattern.fullmatch(url.path)
+            if method == self.command and match:
+                self._send_json(route(self, *match.groups(), query=query, body=body))
+                return
+        self._send_json({"error": f"Unknown endpoint {url.path}"}, 404)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def _json_body(self, body):
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            return json.loads(body or b"{}")
+        return {}
+
+    # v1 routes
+
+    def get_task(self, task_id, **_):
+        return make_task(task_id)
+
+    def create_task(self, task_type, body, **_):
+        return make_task(uuid.uuid4().hex, type=task_type, **self._json_body(body))
+
+    def update_task(self, task_id, action, **_):
+        return make_task(
+            task_id, status="canceled" if action == "cancel" else "pending"
+        )
+
+    def list_tasks(self, query, **_):
+        if "unique_id" in query:
+            task = make_task(f"task_{query['unique_id']}", unique_id=query["unique_id"])
+            return {"docs": [task], "total": 1, "limit": 100, "has_more": False}
+        offset, end, limit, next_token = _page(query, self.server.total_tasks)
+        return {
+            "docs": [
+                make_task(f"task_{i}", **self.server.task_overrides)
+                for i in range(offset, end)
+            ],
+            "total": self.server.total_tasks,
+            "limit": limit,
+            "offset": offset,
+            "has_more": next_token is not None,
+            "next_token": next_token,
+        }
+
+    def list_batches(self, query, **_):
+        offset, end, limit, next_token = _page(query, self.server.total_batches)
+        return {
+            "docs": [make_batch(f"batch_{i}") for i in range(offset, end)],
+            "totalDocs": self.server.total_batches,
+            "limit": limit,
+            "offset": offset,
+            "has_more": next_token is not None,
+        }
+
+    def create_batch(self, body, **_):
+        payload = self._json_body(body)
+        return make_batch(payload.get("name", "batch"), project=payload.get("project"))
+
+    def get_batch(self, name, action=None, **_):
+        if action == "status":
+            return {"status": "completed", "completed": 10, "pending": 0}
+        return make_batch(name, status="in_progress" if action else "staging")
+
+    def list_projects(self, **_):
+        return [make_project(f"project_{i}") for i in range(self.server.total_projects)]
+
+    def create_project(self, body, **_):
+        return make_project(self._json_body(body).get("name", "project"))
+
+    def get_project(self, name, **_):
+        return make_project(name)
+
+    def upload_file(self, body, **_):
+        return make_file(len(body))
+
+    def import_file(self, body, **_):
+        return make_file(0, attachment_url=self._json_body(body).get("file_url"))
+
+    # v2 routes
+
+    def v2_get_task(self, query, **_):
+        return make_v2_task(query.get("task_id", "task_0"), turns=self.server.v2_turns)
+
+    def v2_list_tasks(self, query, **_):
+        offset, end, _, next_token = _page(query, self.server.total_tasks)
+        turns = self.server.v2_turns
+        tasks = [make_v2_task(f"task_{i}", turns=turns) for i in range(offset, end)]
+        return {"tasks": tasks, "next_token": next_token}
+
+    def v2_delivery_tasks(self, query, **_):
+        page = self.v2_list_tasks(query)
+        page["delivery"] = query.get("delivery_id", "delivery_0")
+        return page
+
+    def v2_list_delivery_tasks(self, query, **_):
+        offset, end, _, next_token = _page(query, self.server.total_tasks)
+        docs = [
+            {
+                "task_id": f"task_{i}",
+                "delivery_id": query.get("delivery_id", "delivery_0"),
+                "response": {},
+            }
+            for i in range(offset, end)
+        ]
+        return {"docs": docs, "total": end - offset, "next_token": next_token}
+
+    def v2_list_datasets(self, **_):
+        return {"datasets": [{"id": "dataset_0", "name": "dataset_0"}]}
+
+    def v2_list_dataset_tasks(self, query, **_):
+        offset, end, _, next_token = _page(query, self.server.total_tasks)
+        tasks = [
+            {
+                "task_id": f"task_{i}",
+                "dataset": query.get("dataset_id", "dataset_0"),
+                "delivery": "delivery_0",
+                "response": {},
+            }
+            for i in range(offset, end)
+        ]
+        return {"tasks": tasks, "next_token": next_token}
+
+    def v2_list_deliveries(self, **_):
+        return {
+            "deliveries": [
+                {
+                    "id": "delivery_0",
+                    "name": "delivery_0",
+                    "task_count": self.server.total_tasks,
+                    "delivered_at": CREATED_AT,
+                    "project": "project_0",
+                }
+            ]
+        }
+
+    def v2_get_batch(self, query, **_):
+        return make_v2_batch(query.get("batch_id", "batch_0"))
+
+    def v2_update_batch(self, body, **_):
+        return make_v2_batch(self._json_body(body).get("batch_id", "batch_0"))
+
+    def v2_list_batches(self, query, **_):
+        offset, end, _, next_token = _page(query, self.server.total_batches)
+        batches = [make_v2_batch(f"batch_{i}") for i in range(offset, end)]
+        return {"batches": batches, "next_token": next_token}
+
+    def v2_get_project(self, query, **_):
+        return make_v2_project(query.get("project_id", "project_0"))
+
+    def v2_list_projects(self, **_):
+        projects = range(self.server.total_projects)
+        return {"projects": [make_v2_project(f"project_{i}") for i in projects]}
+
+    def v2_set_task_metadata(self, body, **_):
+        payload = self._json_body(body)
+        return make_v2_task(
+            payload.get("task_id", "task_0"), metadata=payload.get("metadata", {})
+        )
+
+
+_V1 = r"(?:/.*)?/v1/"
+_V2 = r"(?:/.*)?/v2/"
+_TASK_ACTIONS = "cancel|audit|unique_id|setMetadata|tags"
+
+# (method, path pattern, handler) tried in order, groups of the
+# pattern are passed to the handler as positional arguments
+ROUTES = [
+    ("GET", _V1 + r"task/([^/]+)", _Handler.get_task),
+    ("POST", _V1 + rf"task/([^/]+)/({_TASK_ACTIONS})", _Handler.update_task),
+    ("PUT", _V1 + rf"task/([^/]+)/({_TASK_ACTIONS})", _Handler.update_task),
+    ("DELETE", _V1 + rf"task/([^/]+)/({_TASK_ACTIONS})", _Handler.update_task),
+    ("POST", _V1 + r"task/([^/]+)", _Handler.create_task),
+    ("GET", _V1 + r"tasks", _Handler.list_tasks),
+    ("GET", _V1 + r"batches", _Handler.list_batches),
+    ("POST", _V1 + r"batches", _Handler.create_batch),
+    ("GET", _V1 + r"batches/([^/]+)", _Handler.get_batch),
+    ("GET", _V1 + r"batches/([^/]+)/(status)", _Handler.get_batch),
+    ("POST", _V1 + r"batches/([^/]+)/(finalize|setMetadata)", _Handler.get_batch),
+    ("GET", _V1 + r"projects", _Handler.list_projects),
+    ("POST", _V1 + r"projects", _Handler.create_project),
+    ("GET", _V1 + r"projects/([^/]+)", _Handler.get_project),
+    ("POST", _V1 + r"projects/([^/]+)/setParams", _Handler.get_project),
+    ("POST", _V1 + r"files/upload", _Handler.upload_file),
+    ("POST", _V1 + r"files/import", _Handler.import_file),
+    ("GET", _V2 + r"task", _Handler.v2_get_task),
+    ("GET", _V2 + r"tasks", _Handler.v2_list_tasks),
+    ("POST", _V2 + r"task/metadata", _Handler.v2_set_task_metadata),
+    ("GET", _V2 + r"deliveries", _Handler.v2_list_deliveries),
+    ("GET", _V2 + r"delivery", _Handler.v2_delivery_tasks),
+    ("GET", _V2 + r"delivery/tasks", _Handler.v2_list_delivery_tasks),
+    ("GET", _V2 + r"datasets", _Handler.v2_list_datasets),
+    ("GET", _V2 + r"datasets/tasks", _Handler.v2_list_dataset_tasks),
+    ("GET", _V2 + r"batch", _Handler.v2_get_batch),
+    ("GET", _V2 + r"batches", _Handler.v2_list_batches),
+    ("POST", _V2 + r"batch", _Handler.v2_update_batch),
+    (
+        "POST",
+        _V2 + r"batch/(?:finalize|pause|resume|cancel|metadata)",
+        _Handler.v2_update_batch,
+    ),
+    ("GET", _V2 + r"project", _Handler.v2_get_project),
+    ("GET", _V2 + r"projects", _Handler.v2_list_projects),
+]
+ROUTES = [(method, re.compile(pattern), route) for method, pattern, route in ROUTES]
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, config):
+        super().__init__(address, _Handler)
+        self.__dict__.update(config)
+        self.requests = collections.Counter()
+        self._random = random.Random(self.seed)
+        self._lock = threading.Lock()
+
+    def count(self, method, path):
+        with self._lock:
+            self.requests[f"{method} {path}"] += 1
+
+    def inject_failure(self):
+        """Returns (payload, status, headers) of an injected error
+        response, or None to answer the request normally"""
+        with self._lock:
+            draw = self._random.random()
+        if draw < self.throttle_rate:
+            headers = {"Retry-After": str(self.retry_after)}
+            return {"error": "Too many requests"}, 429, headers
+        if draw < self.throttle_rate + self.error_rate:
+            return {"error": "Injected server error"}, 500, None
+        return None
+
+
+class StubServer:
+    """Threaded HTTP server answering a subset of Scale API endpoints.
+
+    Args:
+        total_tasks (int):
+            Number of tasks returned by the `tasks` list endpoints
+        latency (float):
+            Seconds to wait before answering each request
+        error_rate (float):
+            Fraction of requests answered with a 500 error
+        throttle_rate (float):
+            Fraction of requests answered with a 429 error
+        retry_after (float):
+            `Retry-After` seconds sent with 429 errors
+        total_batches (int):
+            Number of batches returned by the `batches` list endpoints
+        total_projects (int):
+            Number of projects returned by the `projects` endpoints
+        v2_turns (int):
+            Number of conversation turns in v2 tasks, to size payloads
+        task_overrides (dict, optional):
+            Fields set on the tasks of the v1 `tasks` list endpoint,
+            i.e. a large `response` to size payloads
+        seed (int):
+            Seed of the error injection, for reproducible runs
+    """
+
+    def __init__(
+        self,
+        total_tasks: int = 1000,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 0,
+        total_batches: int = 50,
+        total_projects: int = 10,
+        v2_turns: int = 1,
+        task_overrides: dict = None,
+        seed: int = 0,
+    ):
+        config = {
+            "total_tasks": total_tasks,
+            "latency": latency,
+            "error_rate": error_rate,
+            "throttle_rate": throttle_rate,
+            "retry_after": retry_after,
+            "total_batches": total_batches,
+            "total_projects": total_projects,
+            "v2_turns": v2_turns,
+            "task_overrides": task_overrides or {},
+            "seed": seed,
+        }
+        self._httpd = _Server(("127.0.0.1", 0), config)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        """Base url of the v1 API, for `api_instance_url`"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    @property
+    def v2_url(self) -> str:
+        """Host of the v2 API, for the v2 client `configuration.host`"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def requests(self) -> collections.Counter:
+        """Number of requests received by `METHOD path`"""
+        return self._httpd.requests
+
+    def start(self):
+        """Starts serving in a background thread"""
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stops the server and closes its socket"""
+        if self._thread.is_alive():
+            self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -1,27 +1,146 @@
-from datetime import datetime
-from typing import IO, Dict, Generator, Generic, List, Optional, TypeVar, Union
+import bisect
+import contextlib
+import math
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    Generator,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    get_origin,
+)
+from urllib.parse import quote
+
+from dateutil import parser as date_parser
 
-from pydantic import Field, StrictStr
-from typing_extensions import Annotated
-
-from scaleapi.api_client.v2 import ApiClient, Configuration, ExpandableEnumTask, Option
-from scaleapi.api_client.v2 import Task as V2Task
-from scaleapi.api_client.v2 import V2Api
 from scaleapi.batches import Batch, BatchStatus
+from scaleapi.cache import ResourceCache
+from scaleapi.checkpoint import (  # noqa: F401
+    CheckpointStore,
+    FileCheckpoint,
+    PaginationCheckpoint,
+)
+from scaleapi.concurrency import (
+    async_iterated,
+    bounded_map,
+    interleaved,
+    prefetched,
+)
 from scaleapi.evaluation_tasks import EvaluationTask
-from scaleapi.exceptions import ScaleInvalidRequest
+from scaleapi.exceptions import (
+    ScaleException,
+    ScaleForbidden,
+    ScaleInvalidRequest,
+    ScaleResourceNotFound,
+    ScaleUnauthorized,
+)
 from scaleapi.files import File
 from scaleapi.projects import Project, TaskTemplate
 from scaleapi.training_tasks import TrainingTask
 
 from ._version import __version__  # noqa: F401
-from .api import Api
+from .api import HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, Api
+from .instrumentation import (  # noqa: F401
+    LatencyHistogram,
+    OpenTelemetryHooks,
+    PrometheusHooks,
+    RequestHooks,
+    RequestInfo,
+)
+from .rate_limit import RateLimiter
+from .store import TaskStore  # noqa: F401
 from .studio import StudioBatch, StudioLabelerAssignment, StudioProjectGroup
-from .tasks import Task, TaskReviewStatus, TaskStatus, TaskType
+from .sync import TaskSync  # noqa: F401
+from .tasks import CompactTask, Task, TaskReviewStatus, TaskStatus, TaskType
 from .teams import Teammate, TeammateRole
 
+if TYPE_CHECKING:
+    # The v2 client and its models are imported on first use of
+    # `ScaleClient.v2`, keeping `import scaleapi` fast for v1 users.
+    from pydantic import Field, StrictStr
+    from typing_extensions import Annotated
+
+    from scaleapi.api_client.v2 import Batch as V2Batch
+    from scaleapi.api_client.v2 import BatchStatus as V2BatchStatus
+    from scaleapi.api_client.v2 import (
+        Dataset,
+        DatasetDelivery,
+        DatasetTask,
+        Delivery,
+        ExpandableEnumBatch,
+        ExpandableEnumDatasetsDeliveries,
+        ExpandableEnumDatasetTask,
+        ExpandableEnumDeliveries,
+        ExpandableEnumDelivery,
+        ExpandableEnumTask,
+        GetDeliveryTasksResponseDocsInner,
+        Option,
+    )
+    from scaleapi.api_client.v2 import Task as V2Task
+    from scaleapi.api_client.v2 import TaskStatus as V2TaskStatus
+    from scaleapi.api_client.v2 import V2Api
+
 T = TypeVar("T")
 
+TASKS_ALLOWED_KWARGS = frozenset(
+    {
+        "start_time",
+        "end_time",
+        "status",
+        "type",
+        "project",
+        "batch",
+        "limit",
+        "completed_before",
+        "completed_after",
+        "next_token",
+        "customer_review_status",
+        "tags",
+        "updated_before",
+        "updated_after",
+        "unique_id",
+        "include_attachment_url",
+        "limited_response",
+    }
+)
+
+# Task timestamps that get_tasks_parallel() can shard exports by
+TASKS_TIME_FIELDS = frozenset({"created", "completed", "updated"})
+# Time windows are not split any further than this duration
+TASKS_MIN_WINDOW = timedelta(seconds=1)
+# Tasks this close to the edge of a window can be returned by both
+# windows sharing the edge
+TASKS_EDGE_TOLERANCE = timedelta(milliseconds=1)
+
+# Budget of the `unique_id` query string of one resolve_unique_ids()
+# request, so that URLs stay well below common 8 KB server limits
+UNIQUE_IDS_QUERY_LENGTH = 6000
+# Unique IDs per request, at most the page size of tasks()
+UNIQUE_IDS_PER_REQUEST = 100
+
+BATCHES_ALLOWED_KWARGS = frozenset(
+    {
+        "start_time",
+        "end_time",
+        "exclude_archived",
+        "status",
+        "project",
+        "limit",
+        "offset",
+    }
+)
+
 
 class Paginator(list, Generic[T]):
     """Paginator for list endpoints"""
@@ -53,7 +172,22 @@ class Batchlist(Paginator[Batch]):
 
 
 class ScaleClient:
-    """Main class serves as an interface for Scale API"""
+    """Main class serves as an interface for Scale API.
+
+    The client keeps a pool of HTTP connections alive across calls
+    and can be shared between threads. Use `close()` or a `with`
+    statement to release the connections when no longer needed.
+
+    Pass a `RateLimiter` to throttle all v1 and v2 requests of the
+    client, adapting to 429 responses of the API, and `RequestHooks`
+    (i.e. a `LatencyHistogram`) to instrument them. A `ResourceCache`
+    serves repeated reads of projects, templates and batches.
+
+    With `validate_responses=False`, v2 responses are trusted and
+    their models built without pydantic validation, which is much
+    faster for large task exports. With `lazy_threads=True`, the
+    threads of v2 tasks are parsed on first access only.
+    """
 
     def __init__(
         self,
@@ -63,7 +197,18 @@ class ScaleClient:
         verify=None,
         proxies=None,
         cert=None,
+        pool_connections: int = HTTP_POOL_CONNECTIONS,
+        pool_maxsize: int = None,
+        rate_limiter: RateLimiter = None,
+        hooks: Iterable[RequestHooks] = None,
+        cache: ResourceCache = None,
+        validate_responses: bool = True,
+        lazy_threads: bool = False,
     ):
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.validate_responses = validate_responses
+        self.lazy_threads = lazy_threads
         self.api = Api(
             api_key,
             user_agent_extension=source,
@@ -71,12 +216,67 @@ class ScaleClient:
             verify=verify,
             proxies=proxies,
             cert=cert,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize or HTTP_POOL_MAXSIZE,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
         )
 
-        configuration = Configuration(access_token=api_key)
+        self._api_key = api_key
+        self._user_agent = Api._generate_useragent(source)
+        self._pool_maxsize = pool_maxsize
+        self._v2 = None
+        self._v2_lock = threading.Lock()
+
+    @property
+    def v2(self) -> "V2Api":
+        """Client of the v2 API, imported and created on first access"""
+        if self._v2 is None:
+            with self._v2_lock:
+                if self._v2 is None:
+                    self._v2 = self._create_v2()
+        return self._v2
+
+    @v2.setter
+    def v2(self, value: "V2Api"):
+        self._v2 = value
+
+    def _create_v2(self) -> "V2Api":
+        # pylint: disable=import-outside-toplevel
+        from scaleapi.api_client.v2 import ApiClient, Configuration, V2Api
+
+        configuration = Configuration(access_token=self._api_key)
+        if self._pool_maxsize:
+            configuration.connection_pool_maxsize = self._pool_maxsize
         api_client = ApiClient(configuration)
-        api_client.user_agent = Api._generate_useragent(source)
-        self.v2 = V2Api(api_client)
+        api_client.user_agent = self._user_agent
+        api_client.rate_limiter = self.rate_limiter
+        api_client.instrumentation = self.api.instrumentation
+        api_client.validate_responses = self.validate_responses
+        api_client.lazy_threads = self.lazy_threads
+        return V2Api(api_client)
+
+    def _cached_get(self, key: Tuple, endpoint: str):
+        """GET request served from the cache, if the client has one"""
+        if self.cache is None:
+            return self.api.get_request(endpoint)
+        return self.cache.get_or_load(key, lambda: self.api.get_request(endpoint))
+
+    def _invalidate(self, *keys: Tuple):
+        if self.cache is not None:
+            self.cache.invalidate(*keys)
+
+    def close(self):
+        """Closes the client and releases pooled HTTP connections."""
+        self.api.close()
+        if self._v2 is not None:
+            self._v2.api_client.rest_client.pool_manager.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def get_task(self, task_id: str) -> Task:
         """Fetches a task.
@@ -292,35 +492,20 @@ class ScaleClient:
             next_token (str):
                 Can be use to fetch the next page of tasks
         """
-        allowed_kwargs = {
-            "start_time",
-            "end_time",
-            "status",
-            "type",
-            "project",
-            "batch",
-            "limit",
-            "completed_before",
-            "completed_after",
-            "next_token",
-            "customer_review_status",
-            "tags",
-            "updated_before",
-            "updated_after",
-            "unique_id",
-            "include_attachment_url",
-            "limited_response",
-        }
+        return self._tasks(kwargs)
 
+    def _tasks(self, kwargs: Dict, compact: bool = False) -> Tasklist:
+        """Returns a page of `Task`, or `CompactTask` if `compact`"""
         for key in kwargs:
-            if key not in allowed_kwargs:
+            if key not in TASKS_ALLOWED_KWARGS:
                 raise ScaleInvalidRequest(
                     f"Illegal parameter {key} for ScaleClient.tasks()"
                 )
 
         response = self.api.get_request("tasks", params=kwargs)
 
-        docs = [Task(json, self) for json in response["docs"]]
+        task_class = CompactTask if compact else Task
+        docs = [task_class(json, self) for json in response["docs"]]
         return Tasklist(
             docs,
             response["total"],
@@ -332,17 +517,19 @@ class ScaleClient:
 
     def v2_get_tasks(
         self,
-        project_id: Optional[StrictStr] = None,
-        project_name: Optional[StrictStr] = None,
-        batch_id: Optional[StrictStr] = None,
-        batch_name: Optional[StrictStr] = None,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        batch_id: "Optional[StrictStr]" = None,
+        batch_name: "Optional[StrictStr]" = None,
         status: Optional[TaskStatus] = None,
         completed_after: Optional[datetime] = None,
         completed_before: Optional[datetime] = None,
-        limit: Optional[Annotated[int, Field(le=100, strict=True, ge=1)]] = None,
-        expand: Optional[List[ExpandableEnumTask]] = None,
-        opts: Optional[List[Option]] = None,
-    ) -> Generator[V2Task, None, None]:
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumTask]]" = None,
+        opts: "Optional[List[Option]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "Generator[V2Task, None, None]":
         """Retrieve all tasks as a `generator` method, with the
         given parameters. This methods handles pagination of
         v2.get_tasks() method.
@@ -378,6 +565,12 @@ class ScaleClient:
         :type expand: List[ExpandableEnumTask]
         :param opts: List of properties to include in the task response.
         :type opts: List[Option]
+        :param prefetch: Number of pages fetched in the background
+            ahead of the consumer, see `get_tasks()`.
+        :type prefetch: int
+        :param checkpoint: Store, or file path, saving the pagination
+            state after each page to resume an interrupted export.
+        :type checkpoint: CheckpointStore | str
 
         Yields:
             Generator[V2Task]:
@@ -397,15 +590,605 @@ class ScaleClient:
             "opts": opts,
         }
 
-        next_token = None
-        has_more = True
+        yield from self.v2_paginate(
+            "get_tasks", prefetch=prefetch, checkpoint=checkpoint, **tasks_args
+        )
 
-        while has_more:
-            tasks_args["next_token"] = next_token
-            tasks = self.v2.get_tasks(**tasks_args)
-            yield from tasks.tasks
-            next_token = tasks.next_token
-            has_more = tasks.next_token is not None
+    def v2_get_delivered_tasks(
+        self,
+        delivery_id: "Optional[StrictStr]" = None,
+        delivery_name: "Optional[StrictStr]" = None,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumDelivery]]" = None,
+        opts: "Optional[List[Option]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "Generator[V2Task, None, None]":
+        """Retrieve all tasks of a delivery as a `generator` method,
+        handling pagination of v2.get_delivery() method. Yields full
+        Task objects; use `v2_get_delivered_responses()` for the
+        delivered response of each task instead.
+
+        :param delivery_id: Scale's unique identifier for the delivery.
+        :type delivery_id: str
+        :param delivery_name: The name of the delivery.
+        :type delivery_name: str
+        :param project_id: Scale's unique identifier for the project.
+        :type project_id: str
+        :param project_name: The name of the project.
+        :type project_name: str
+        :param limit: Limit the number of entities returned.
+        :type limit: int
+        :param expand: List of fields to expand in the response.
+        :type expand: List[ExpandableEnumDelivery]
+        :param opts: List of properties to include in the task response.
+        :type opts: List[Option]
+        :param prefetch: Number of pages fetched in the background
+            ahead of the consumer, see `get_tasks()`.
+        :type prefetch: int
+        :param checkpoint: Store, or file path, saving the pagination
+            state after each page to resume an interrupted export.
+        :type checkpoint: CheckpointStore | str
+
+        Yields:
+            Generator[V2Task]:
+                Yields Task objects, can be iterated.
+        """
+        tasks_args = {
+            "delivery_id": delivery_id,
+            "delivery_name": delivery_name,
+            "project_id": project_id,
+            "project_name": project_name,
+            "limit": limit,
+            "expand": expand,
+            "opts": opts,
+        }
+        yield from self.v2_paginate(
+            "get_delivery", prefetch=prefetch, checkpoint=checkpoint, **tasks_args
+        )
+
+    def v2_get_dataset_tasks(
+        self,
+        dataset_id: "Optional[StrictStr]" = None,
+        delivery_id: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumDatasetTask]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "Generator[DatasetTask, None, None]":
+        """Retrieve all tasks of a dataset as a `generator` method,
+        handling pagination of v2.get_dataset_tasks() method.
+
+        :param dataset_id: Scale's unique identifier for the dataset.
+        :type dataset_id: str
+        :param delivery_id: Scale's unique identifier for the delivery.
+        :type delivery_id: str
+        :param delivered_after: Deliveries with a `delivered_at` after
+            the given date will be returned.
+        :type delivered_after: datetime
+        :param delivered_before: Deliveries with a `delivered_at`
+            before the given date will be returned.
+        :type delivered_before: datetime
+        :param limit: Limit the number of entities returned.
+        :type limit: int
+        :param expand: List of fields to expand in the response.
+        :type expand: List[ExpandableEnumDatasetTask]
+        :param prefetch: Number of pages fetched in the background
+            ahead of the consumer, see `get_tasks()`.
+        :type prefetch: int
+        :param checkpoint: Store, or file path, saving the pagination
+            state after each page to resume an interrupted export.
+        :type checkpoint: CheckpointStore | str
+
+        Yields:
+            Generator[DatasetTask]:
+                Yields DatasetTask objects, can be iterated.
+        """
+        tasks_args = {
+            "dataset_id": dataset_id,
+            "delivery_id": delivery_id,
+            "delivered_after": delivered_after,
+            "delivered_before": delivered_before,
+            "limit": limit,
+            "expand": expand,
+        }
+        yield from self.v2_paginate(
+            "get_dataset_tasks", prefetch=prefetch, checkpoint=checkpoint, **tasks_args
+        )
+
+    def v2_get_batches(
+        self,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        status: "Optional[V2BatchStatus]" = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        completed_after: Optional[datetime] = None,
+        completed_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumBatch]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "Generator[V2Batch, None, None]":
+        """Retrieve all batches as a `generator` method,
+        handling pagination of v2.get_batches() method.
+
+        :param project_id: Scale's unique identifier for the project.
+        :type project_id: str
+        :param project_name: The name of the project.
+        :type project_name: str
+        :param status: Status of the batches.
+        :type status: BatchStatus
+        :param created_after: Batches created after the given date.
+        :type created_after: datetime
+        :param created_before: Batches created before the given date.
+        :type created_before: datetime
+        :param completed_after: Batches completed after the given date.
+        :type completed_after: datetime
+        :param completed_before: Batches completed before the given
+            date.
+        :type completed_before: datetime
+        :param limit: Limit the number of entities returned.
+        :type limit: int
+        :param expand: List of fields to expand in the response.
+        :type expand: List[ExpandableEnumBatch]
+        :param prefetch: Number of pages fetched in the background
+            ahead of the consumer, see `get_tasks()`.
+        :type prefetch: int
+        :param checkpoint: Store, or file path, saving the pagination
+            state after each page to resume an interrupted export.
+        :type checkpoint: CheckpointStore | str
+
+        Yields:
+            Generator[V2Batch]:
+                Yields Batch objects, can be iterated.
+        """
+        batches_args = {
+            "project_id": project_id,
+            "project_name": project_name,
+            "status": status,
+            "created_after": created_after,
+            "created_before": created_before,
+            "completed_after": completed_after,
+            "completed_before": completed_before,
+            "limit": limit,
+            "expand": expand,
+        }
+        yield from self.v2_paginate(
+            "get_batches", prefetch=prefetch, checkpoint=checkpoint, **batches_args
+        )
+
+    def v2_get_delivered_responses(
+        self,
+        delivery_id: "Optional[StrictStr]" = None,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        status: "Optional[V2TaskStatus]" = None,
+        completed_after: Optional[datetime] = None,
+        completed_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "Generator[GetDeliveryTasksResponseDocsInner, None, None]":
+        """Retrieve the delivered responses of tasks as a `generator`
+        method, handling pagination of v2.get_delivery_tasks() method.
+        Yields a record per task of a delivery, project or batch, with
+        its delivered response, delivery and schema identifiers, and
+        no other task fields; use `v2_get_delivered_tasks()` for the
+        full tasks of a delivery instead.
+
+        :param delivery_id: Scale's unique identifier for the delivery.
+        :type delivery_id: str
+        :param project_id: Scale's unique identifier for the project.
+        :type project_id: str
+        :param project_name: The name of the project.
+        :type project_name: str
+        :param status: The current status of the task.
+        :type status: TaskStatus
+        :param completed_after: Tasks completed after the given date.
+        :type completed_after: datetime
+        :param completed_before: Tasks completed before the given date.
+        :type completed_before: datetime
+        :param limit: Limit the number of entities returned.
+        :type limit: int
+        :param prefetch: Number of pages fetched in the background
+            ahead of the consumer, see `get_tasks()`.
+        :type prefetch: int
+        :param checkpoint: Store, or file path, saving the pagination
+            state after each page to resume an interrupted export.
+        :type checkpoint: CheckpointStore | str
+
+        Yields:
+            Generator[GetDeliveryTasksResponseDocsInner]:
+                Yields the delivered response of each task, can be
+                iterated.
+        """
+        tasks_args = {
+            "delivery_id": delivery_id,
+            "project_id": project_id,
+            "project_name": project_name,
+            "status": status,
+            "completed_after": completed_after,
+            "completed_before": completed_before,
+            "limit": limit,
+        }
+        yield from self.v2_paginate(
+            "get_delivery_tasks", prefetch=prefetch, checkpoint=checkpoint, **tasks_args
+        )
+
+    def v2_get_deliveries(
+        self,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        expand: "Optional[List[ExpandableEnumDeliveries]]" = None,
+    ) -> "Generator[Delivery, None, None]":
+        """Retrieve all deliveries of a project as a `generator`
+        method, wrapping v2.get_deliveries() method.
+
+        :param project_id: Scale's unique identifier for the project.
+        :type project_id: str
+        :param project_name: The name of the project.
+        :type project_name: str
+        :param delivered_after: Deliveries with a `delivered_at` after
+            the given date will be returned.
+        :type delivered_after: datetime
+        :param delivered_before: Deliveries with a `delivered_at`
+            before the given date will be returned.
+        :type delivered_before: datetime
+        :param expand: List of fields to expand in the response.
+        :type expand: List[ExpandableEnumDeliveries]
+
+        Yields:
+            Generator[Delivery]:
+                Yields Delivery objects, can be iterated.
+        """
+        yield from self.v2_paginate(
+            "get_deliveries",
+            project_id=project_id,
+            project_name=project_name,
+            delivered_after=delivered_after,
+            delivered_before=delivered_before,
+            expand=expand,
+        )
+
+    def v2_get_dataset_deliveries(
+        self,
+        dataset_id: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        expand: "Optional[List[ExpandableEnumDatasetsDeliveries]]" = None,
+    ) -> "Generator[DatasetDelivery, None, None]":
+        """Retrieve all deliveries of a dataset as a `generator`
+        method, wrapping v2.get_dataset_deliveries() method.
+
+        :param dataset_id: Scale's unique identifier for the dataset.
+        :type dataset_id: str
+        :param delivered_after: Deliveries with a `delivered_at` after
+            the given date will be returned.
+        :type delivered_after: datetime
+        :param delivered_before: Deliveries with a `delivered_at`
+            before the given date will be returned.
+        :type delivered_before: datetime
+        :param expand: List of fields to expand in the response.
+        :type expand: List[ExpandableEnumDatasetsDeliveries]
+
+        Yields:
+            Generator[DatasetDelivery]:
+                Yields DatasetDelivery objects, can be iterated.
+        """
+        yield from self.v2_paginate(
+            "get_dataset_deliveries",
+            dataset_id=dataset_id,
+            delivered_after=delivered_after,
+            delivered_before=delivered_before,
+            expand=expand,
+        )
+
+    def v2_get_datasets(self) -> "Generator[Dataset, None, None]":
+        """Retrieve all datasets as a `generator` method, wrapping
+        v2.get_datasets() method.
+
+        Yields:
+            Generator[Dataset]:
+                Yields Dataset objects, can be iterated.
+        """
+        yield from self.v2_paginate("get_datasets")
+
+    # asyncio counterparts of the typed V2 generators. Pages are
+    # fetched in a worker thread, see `v2_paginate_async()`.
+
+    def v2_get_tasks_async(
+        self,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        batch_id: "Optional[StrictStr]" = None,
+        batch_name: "Optional[StrictStr]" = None,
+        status: Optional[TaskStatus] = None,
+        completed_after: Optional[datetime] = None,
+        completed_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumTask]]" = None,
+        opts: "Optional[List[Option]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "AsyncGenerator[V2Task, None]":
+        """asyncio counterpart of `v2_get_tasks()`, taking the same
+        parameters.
+
+        `async for task in client.v2_get_tasks_async(project_name="p")`
+        """
+        return self.v2_paginate_async(
+            "get_tasks",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            project_id=project_id,
+            project_name=project_name,
+            batch_id=batch_id,
+            batch_name=batch_name,
+            status=status,
+            completed_after=completed_after,
+            completed_before=completed_before,
+            limit=limit,
+            expand=expand,
+            opts=opts,
+        )
+
+    def v2_get_delivered_tasks_async(
+        self,
+        delivery_id: "Optional[StrictStr]" = None,
+        delivery_name: "Optional[StrictStr]" = None,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumDelivery]]" = None,
+        opts: "Optional[List[Option]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "AsyncGenerator[V2Task, None]":
+        """asyncio counterpart of `v2_get_delivered_tasks()`, taking
+        the same parameters."""
+        return self.v2_paginate_async(
+            "get_delivery",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            delivery_id=delivery_id,
+            delivery_name=delivery_name,
+            project_id=project_id,
+            project_name=project_name,
+            limit=limit,
+            expand=expand,
+            opts=opts,
+        )
+
+    def v2_get_dataset_tasks_async(
+        self,
+        dataset_id: "Optional[StrictStr]" = None,
+        delivery_id: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumDatasetTask]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "AsyncGenerator[DatasetTask, None]":
+        """asyncio counterpart of `v2_get_dataset_tasks()`, taking the
+        same parameters."""
+        return self.v2_paginate_async(
+            "get_dataset_tasks",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            dataset_id=dataset_id,
+            delivery_id=delivery_id,
+            delivered_after=delivered_after,
+            delivered_before=delivered_before,
+            limit=limit,
+            expand=expand,
+        )
+
+    def v2_get_batches_async(
+        self,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        status: "Optional[V2BatchStatus]" = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        completed_after: Optional[datetime] = None,
+        completed_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        expand: "Optional[List[ExpandableEnumBatch]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "AsyncGenerator[V2Batch, None]":
+        """asyncio counterpart of `v2_get_batches()`, taking the same
+        parameters."""
+        return self.v2_paginate_async(
+            "get_batches",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            project_id=project_id,
+            project_name=project_name,
+            status=status,
+            created_after=created_after,
+            created_before=created_before,
+            completed_after=completed_after,
+            completed_before=completed_before,
+            limit=limit,
+            expand=expand,
+        )
+
+    def v2_get_delivered_responses_async(
+        self,
+        delivery_id: "Optional[StrictStr]" = None,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        status: "Optional[V2TaskStatus]" = None,
+        completed_after: Optional[datetime] = None,
+        completed_before: Optional[datetime] = None,
+        limit: "Optional[Annotated[int, Field(le=100, strict=True, ge=1)]]" = None,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> "AsyncGenerator[GetDeliveryTasksResponseDocsInner, None]":
+        """asyncio counterpart of `v2_get_delivered_responses()`,
+        taking the same parameters."""
+        return self.v2_paginate_async(
+            "get_delivery_tasks",
+            prefetch=prefetch,
+            checkpoint=checkpoint,
+            delivery_id=delivery_id,
+            project_id=project_id,
+            project_name=project_name,
+            status=status,
+            completed_after=completed_after,
+            completed_before=completed_before,
+            limit=limit,
+        )
+
+    def v2_get_deliveries_async(
+        self,
+        project_id: "Optional[StrictStr]" = None,
+        project_name: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        expand: "Optional[List[ExpandableEnumDeliveries]]" = None,
+    ) -> "AsyncGenerator[Delivery, None]":
+        """asyncio counterpart of `v2_get_deliveries()`, taking the
+        same parameters."""
+        return self.v2_paginate_async(
+            "get_deliveries",
+            project_id=project_id,
+            project_name=project_name,
+            delivered_after=delivered_after,
+            delivered_before=delivered_before,
+            expand=expand,
+        )
+
+    def v2_get_dataset_deliveries_async(
+        self,
+        dataset_id: "Optional[StrictStr]" = None,
+        delivered_after: Optional[datetime] = None,
+        delivered_before: Optional[datetime] = None,
+        expand: "Optional[List[ExpandableEnumDatasetsDeliveries]]" = None,
+    ) -> "AsyncGenerator[DatasetDelivery, None]":
+        """asyncio counterpart of `v2_get_dataset_deliveries()`, taking
+        the same parameters."""
+        return self.v2_paginate_async(
+            "get_dataset_deliveries",
+            dataset_id=dataset_id,
+            delivered_after=delivered_after,
+            delivered_before=delivered_before,
+            expand=expand,
+        )
+
+    def v2_get_datasets_async(self) -> "AsyncGenerator[Dataset, None]":
+        """asyncio counterpart of `v2_get_datasets()`"""
+        return self.v2_paginate_async("get_datasets")
+
+    def v2_paginate(
+        self,
+        method: str,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+        **kwargs,
+    ) -> Generator:
+        """Yields the items of all pages of a v2 list endpoint,
+        following `next_token`. Endpoints without pagination return
+        a single page.
+
+        `for batch in client.v2_paginate("get_batches", project_id="p")`
+
+        Args:
+            method (str):
+                Name of the `V2Api` method, i.e. "get_batches"
+            prefetch (int):
+                Number of pages fetched in a background thread ahead
+                of the consumer, defaults to 0 (no prefetching).
+            checkpoint (CheckpointStore | str, optional):
+                Store, or file path, saving the pagination state
+                after each consumed page to resume an interrupted
+                export.
+            **kwargs:
+                Arguments of the `V2Api` method
+
+        Yields:
+            Items of the list field of each page, i.e. `Batch`
+        """
+        progress = (
+            PaginationCheckpoint(checkpoint, method, kwargs) if checkpoint else None
+        )
+        next_token = progress.resume() if progress else None
+
+        pages = self._v2_pages(method, kwargs, next_token)
+        if prefetch:
+            pages = prefetched(pages, prefetch)
+
+        with contextlib.closing(pages):
+            for page in pages:
+                items = self._v2_page_items(page)
+                yield from items
+                if progress:
+                    progress.page_done(getattr(page, "next_token", None), len(items))
+
+    async def v2_paginate_async(
+        self,
+        method: str,
+        prefetch: int = 0,
+        checkpoint: Union[CheckpointStore, str] = None,
+        **kwargs,
+    ) -> AsyncGenerator:
+        """asyncio counterpart of `v2_paginate()`, fetching pages in a
+        worker thread so that the event loop is not blocked.
+
+        `async for task in client.v2_paginate_async("get_tasks", ...)`
+        """
+        progress = (
+            PaginationCheckpoint(checkpoint, method, kwargs) if checkpoint else None
+        )
+        next_token = progress.resume() if progress else None
+
+        pages = self._v2_pages(method, kwargs, next_token)
+        if prefetch:
+            pages = prefetched(pages, prefetch)
+
+        pages = async_iterated(pages)
+        try:
+            async for page in pages:
+                items = self._v2_page_items(page)
+                for item in items:
+                    yield item
+                if progress:
+                    progress.page_done(getattr(page, "next_token", None), len(items))
+        finally:
+            await pages.aclose()
+
+    def _v2_pages(self, method: str, kwargs: Dict, next_token: str = None) -> Generator:
+        """Yields all pages of a v2 list endpoint, following
+        `next_token`."""
+        fetch = getattr(self.v2, method)
+        while True:
+            # Endpoints without pagination have no `next_token` argument
+            page = (
+                fetch(**kwargs, next_token=next_token)
+                if next_token
+                else fetch(**kwargs)
+            )
+            yield page
+            next_token = getattr(page, "next_token", None)
+            if not next_token:
+                return
+
+    @staticmethod
+    def _v2_page_items(page) -> List:
+        """Items of a page of a v2 list endpoint, its list field"""
+        for name, field in type(page).model_fields.items():
+            if get_origin(field.annotation) is list:
+                return getattr(page, name) or []
+        raise TypeError(f"{type(page).__name__} is not a list response")
 
     def get_tasks(
         self,
@@ -425,7 +1208,10 @@ class ScaleClient:
         include_attachment_url: bool = True,
         limited_response: bool = None,
         limit: int = None,
-    ) -> Generator[Task, None, None]:
+        prefetch: int = 0,
+        compact: bool = False,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> Generator[Union[Task, CompactTask], None, None]:
         """Retrieve all tasks as a `generator` method, with the
         given parameters. This methods handles pagination of
         tasks() method.
@@ -433,6 +1219,10 @@ class ScaleClient:
         In order to retrieve results as a list, please use:
         `task_list = list(get_tasks(...))`
 
+        With `prefetch`, the next pages are fetched in a
+        background thread while the current page is consumed, so that
+        network round trips overlap with processing of the tasks.
+
         Args:
             project_name (str, optional):
                 Project Name
@@ -496,8 +1286,26 @@ class ScaleClient:
                 Determines the task count per request (1-100)
                 For large sized tasks, use a smaller limit
 
+            prefetch (int):
+                Number of pages to fetch ahead in a background thread.
+                Memory usage is bounded by `prefetch` pages.
+                Defaults to 0, fetching each page only when needed.
+
+            compact (bool):
+                If true, yields `CompactTask` records holding only the
+                commonly used fields, i.e. to keep millions of tasks
+                in memory. Defaults to False.
+
+            checkpoint (CheckpointStore | str, optional):
+                Store, or path of a JSON state file, where the
+                `next_token` and filters are saved after the tasks of
+                each page were consumed. If the export is interrupted,
+                calling `get_tasks()` again with the same arguments
+                and checkpoint resumes after the last consumed page.
+                The checkpoint is cleared once all pages are read.
+
         Yields:
-            Generator[Task]:
+            Generator[Task | CompactTask]:
                 Yields Task objects, can be iterated.
         """
 
@@ -506,9 +1314,6 @@ class ScaleClient:
                 "At least one of project_name or batch_name must be provided."
             )
 
-        next_token = None
-        has_more = True
-
         tasks_args = self._process_tasks_endpoint_args(
             project_name,
             batch_name,
@@ -530,14 +1335,267 @@ class ScaleClient:
         if limit:
             tasks_args["limit"] = limit
 
+        progress = (
+            PaginationCheckpoint(checkpoint, "tasks", tasks_args)
+            if checkpoint
+            else None
+        )
+        next_token = progress.resume() if progress else None
+
+        pages = self._get_tasks_pages(tasks_args, compact, next_token)
+        if prefetch:
+            pages = prefetched(pages, prefetch)
+
+        with contextlib.closing(pages):
+            for tasks in pages:
+                yield from tasks.docs
+                if progress:
+                    progress.page_done(
+                        tasks.next_token if tasks.has_more else None, len(tasks.docs)
+                    )
+
+    def _get_tasks_pages(
+        self, tasks_args: Dict, compact: bool = False, next_token: str = None
+    ) -> Generator[Tasklist, None, None]:
+        """Yields all pages of the tasks() endpoint for the given
+        arguments, following `next_token`."""
+        tasks_args = dict(tasks_args)
+        has_more = True
+
         while has_more:
             tasks_args["next_token"] = next_token
 
-            tasks = self.tasks(**tasks_args)
-            yield from tasks.docs
+            tasks = self._tasks(tasks_args, compact)
+            yield tasks
             next_token = tasks.next_token
             has_more = tasks.has_more
 
+    def get_tasks_parallel(
+        self,
+        after: Union[str, datetime],
+        before: Union[str, datetime],
+        time_field: str = "created",
+        project_name: str = None,
+        batch_name: str = None,
+        task_type: TaskType = None,
+        status: TaskStatus = None,
+        review_status: Union[List[TaskReviewStatus], TaskReviewStatus] = None,
+        tags: Union[List[str], str] = None,
+        include_attachment_url: bool = True,
+        limited_response: bool = None,
+        limit: int = None,
+        shards: int = 8,
+        max_shard_size: int = 10000,
+        compact: bool = False,
+    ) -> Generator[Union[Task, CompactTask], None, None]:
+        """Retrieve all tasks in a time range as a `generator` method,
+        paginating several time windows in parallel.
+
+        `next_token` pagination of a single query is sequential, so
+        the [`after`, `before`] range of the chosen `time_field` is
+        split into `shards` disjoint windows which are paginated
+        concurrently. Windows with more than `max_shard_size` tasks,
+        according to `get_tasks_count()`, are split further before the
+        export starts. Tasks are yielded as their pages arrive, so the
+        order is not deterministic; duplicates at window boundaries
+        are dropped.
+
+        Only the IDs of tasks whose timestamp falls on a window edge
+        are kept to drop duplicates, so memory does not grow with the
+        size of the export. Tasks without the timestamp, i.e. compact
+        tasks split by `updated`, are all kept. With `updated`, a task
+        updated during the export can still be yielded twice.
+
+        For best throughput, create the client with a `pool_maxsize`
+        of at least `shards`.
+
+        Args:
+            after (str | datetime):
+                Start of the time range, a datetime or a string in
+                UTC timezone ISO format: 'YYYY-MM-DD HH:MM:SS.mmmmmm'
+
+            before (str | datetime):
+                End of the time range, same format as `after`
+
+            time_field (str):
+                Timestamp to split the range by, one of `created`,
+                `completed` or `updated`. Defaults to `created`.
+
+            project_name (str, optional):
+                Project Name
+
+            batch_name (str, optional):
+                Batch Name
+
+            task_type (TaskType, optional):
+                Task type to filter i.e. `TaskType.TextCollection`
+
+            status (TaskStatus, optional):
+                Task status i.e. `TaskStatus.Completed`
+
+            review_status (List[TaskReviewStatus] | TaskReviewStatus):
+                The status of the audit result of the task.
+
+            tags (List[str] | str, optional):
+                The tags of a task; multiple tags can be
+                specified as a list.
+
+            include_attachment_url (bool):
+                If true, returns a pre-signed s3 url for the
+                attachment used to create the task.
+
+            limited_response (bool):
+                If true, returns task response of the following fields:
+                task_id, status, metadata, project, otherVersion.
+
+            limit (int):
+                Determines the task count per request (1-100)
+
+            shards (int):
+                Number of time windows to paginate in parallel
+
+            max_shard_size (int):
+                Windows with more tasks than this are split further
+
+            compact (bool):
+                If true, yields `CompactTask` records, see
+                `get_tasks()`. Defaults to False.
+
+        Yields:
+            Generator[Task | CompactTask]:
+                Yields Task objects, can be iterated.
+        """
+        if time_field not in TASKS_TIME_FIELDS:
+            raise ValueError(f"time_field must be one of {sorted(TASKS_TIME_FIELDS)}")
+
+        filters = {
+            "project_name": project_name,
+            "batch_name": batch_name,
+            "task_type": task_type,
+            "status": status,
+            "review_status": review_status,
+            "tags": tags,
+            "include_attachment_url": include_attachment_url,
+        }
+        windows = self._split_tasks_time_range(
+            filters,
+            time_field,
+            self._parse_time(after),
+            self._parse_time(before),
+            shards,
+            max_shard_size,
+        )
+
+        def window_pages(window):
+            tasks_args = self._process_tasks_endpoint_args(
+                limited_response=limited_response,
+                **filters,
+                **self._time_window_args(time_field, window),
+            )
+            if limit:
+                tasks_args["limit"] = limit
+            return self._get_tasks_pages(tasks_args, compact)
+
+        edges = sorted({edge for window in windows for edge in window})
+        edge_task_ids = set()
+        for tasks in interleaved(map(window_pages, windows), concurrency=shards):
+            for task in tasks.docs:
+                if self._on_time_edge(task, time_field, edges):
+                    if task.id in edge_task_ids:
+                        continue
+                    edge_task_ids.add(task.id)
+                yield task
+
+    def _split_tasks_time_range(
+        self,
+        filters: Dict,
+        time_field: str,
+        start: datetime,
+        end: datetime,
+        shards: int,
+        max_shard_size: int,
+    ) -> List[Tuple[datetime, datetime]]:
+        """Splits a time range into windows holding at most
+        `max_shard_size` tasks each, dropping empty windows."""
+        windows = self._split_time_window((start, end), shards)
+        result = []
+
+        while windows:
+            counts = bounded_map(
+                lambda window: self.get_tasks_count(
+                    **filters, **self._time_window_args(time_field, window)
+                ),
+                windows,
+                concurrency=shards,
+            )
+            next_windows = []
+            for index, count in counts:
+                if isinstance(count, Exception):
+                    raise count
+                window = windows[index]
+                if count > max_shard_size and window[1] - window[0] > TASKS_MIN_WINDOW:
+                    parts = min(math.ceil(count / max_shard_size), shards)
+                    next_windows.extend(self._split_time_window(window, parts))
+                elif count:
+                    result.append(window)
+            windows = next_windows
+
+        return result
+
+    @staticmethod
+    def _split_time_window(
+        window: Tuple[datetime, datetime], parts: int
+    ) -> List[Tuple[datetime, datetime]]:
+        start, end = window
+        step = (end - start) / parts
+        edges = [start + step * i for i in range(parts)] + [end]
+        return list(zip(edges, edges[1:]))
+
+    @staticmethod
+    def _time_window_args(time_field: str, window: Tuple[datetime, datetime]):
+        return {
+            f"{time_field}_after": ScaleClient._format_time(window[0]),
+            f"{time_field}_before": ScaleClient._format_time(window[1]),
+        }
+
+    @staticmethod
+    def _on_time_edge(
+        task: Union[Task, CompactTask], time_field: str, edges: List[datetime]
+    ) -> bool:
+        """Whether the timestamp of a task is on one of the sorted
+        window `edges`, or missing"""
+        value = getattr(task, f"{time_field}_at", None)
+        if not value:
+            return True
+        try:
+            time = ScaleClient._parse_time(value)
+        except (ValueError, OverflowError):
+            return True
+        index = bisect.bisect_left(edges, time)
+        return any(
+            abs(time - edges[i]) <= TASKS_EDGE_TOLERANCE
+            for i in (index - 1, index)
+            if 0 <= i < len(edges)
+        )
+
+    @staticmethod
+    def _parse_time(value: Union[str, datetime]) -> datetime:
+        """Parses a timestamp into a naive datetime in UTC"""
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(
+                    value[:-1] + "+00:00" if value.endswith("Z") else value
+                )
+            except ValueError:
+                value = date_parser.parse(value)
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    @staticmethod
+    def _format_time(value: datetime) -> str:
+        return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
     def get_tasks_count(
         self,
         project_name: str = None,
@@ -722,6 +1780,173 @@ class ScaleClient:
         taskdata = self.api.post_request(endpoint, body=kwargs)
         return Task(taskdata, self)
 
+    def create_tasks(
+        self,
+        task_type: TaskType,
+        payloads: Iterable[Dict],
+        concurrency: int = 10,
+        ordered: bool = True,
+    ) -> Generator[Tuple[int, Union[Task, ScaleException]], None, None]:
+        """Creates many tasks concurrently through a pool of worker
+        threads, as a `generator` method. Payloads are consumed lazily,
+        so a generator of payloads can be streamed in bounded memory.
+
+        Each task is created with `create_task()`, so tasks with a
+        `unique_id` are recovered, instead of duplicated, when a retried
+        request had already created them. A failing payload doesn't
+        stop the others; its exception is yielded as its result.
+
+        For best throughput, create the client with a `pool_maxsize`
+        of at least `concurrency`.
+
+        `for index, result in client.create_tasks(task_type, payloads)`
+
+        Args:
+            task_type (TaskType):
+                Task type to be created
+                i.e. `TaskType.ImageAnnotation`
+            payloads (Iterable[Dict]):
+                Task parameters for each task, as they would be
+                passed to `create_task()`
+            concurrency (int):
+                Number of tasks to create in parallel
+            ordered (bool):
+                If True, yields results in the same order as payloads,
+                otherwise as soon as each task is created
+
+        Yields:
+            Tuple[int, Task | ScaleException]:
+                Index of the payload and the created task, or the
+                exception raised while creating it
+        """
+        yield from bounded_map(
+            lambda payload: self.create_task(task_type, **payload),
+            payloads,
+            concurrency,
+            ordered,
+        )
+
+    def get_tasks_by_ids(
+        self,
+        task_ids: Iterable[str],
+        concurrency: int = 10,
+        ordered: bool = False,
+    ) -> Generator[Tuple[str, Union[Task, Exception]], None, None]:
+        """Fetches many tasks by `task_id` concurrently through a pool
+        of worker threads, as a `generator` method. Duplicate IDs are
+        fetched and yielded once, and IDs are consumed lazily.
+
+        Requests go through the client's rate limiter and retries. A
+        task that cannot be fetched doesn't stop the others; the error
+        is yielded as its result: `ScaleResourceNotFound` for a missing
+        task, `ScaleForbidden` for a task the API key cannot access, or
+        `ScaleUnauthorized` for a rejected API key. Other errors, such
+        as a failed connection, are raised.
+
+        `for task_id, result in client.get_tasks_by_ids(task_ids)`
+
+        Args:
+            task_ids (Iterable[str]):
+                Task identifiers
+            concurrency (int):
+                Number of tasks to fetch in parallel
+            ordered (bool):
+                If True, yields results in the order of the first
+                occurrence of each ID, otherwise as soon as each task
+                is fetched
+
+        Yields:
+            Tuple[str, Task | Exception]:
+                Task identifier and the task, or the exception raised
+                while fetching it
+        """
+
+        def fetch(task_id: str) -> Tuple[str, Union[Task, Exception]]:
+            try:
+                return task_id, self.get_task(task_id)
+            except (ScaleResourceNotFound, ScaleForbidden, ScaleUnauthorized) as err:
+                return task_id, err
+
+        def deduplicated() -> Generator[str, None, None]:
+            seen = set()
+            for task_id in task_ids:
+                if task_id not in seen:
+                    seen.add(task_id)
+                    yield task_id
+
+        for _, result in bounded_map(fetch, deduplicated(), concurrency, ordered):
+            if isinstance(result, Exception):
+                raise result
+            yield result
+
+    def resolve_unique_ids(
+        self,
+        unique_ids: Iterable[str],
+        project_name: str = None,
+        concurrency: int = 10,
+        compact: bool = False,
+    ) -> Tuple[Dict[str, Union[Task, CompactTask]], List[str]]:
+        """Resolves many of your own `unique_id` values to their tasks,
+        i.e. to skip already created tasks before an ingestion.
+
+        IDs are deduplicated and grouped into `tasks()` list calls
+        filtered by up to 100 unique IDs each, keeping every URL
+        within a safe length, and the list calls run concurrently.
+
+        Args:
+            unique_ids (Iterable[str]):
+                Unique IDs to resolve
+            project_name (str, optional):
+                Only resolve tasks of this project
+            concurrency (int):
+                Number of list calls in parallel
+            compact (bool):
+                If True, returns `CompactTask` objects holding only
+                the identifiers, status and metadata of each task
+
+        Returns:
+            Tuple[Dict[str, Task | CompactTask], List[str]]:
+                Tasks by `unique_id`, and the unique IDs without a
+                task in their input order
+        """
+        unique_ids = list(dict.fromkeys(unique_ids))
+
+        def chunks() -> Generator[List[str], None, None]:
+            chunk, length = [], 0
+            for unique_id in unique_ids:
+                # Encoded as `unique_id=<value>&` in the query string
+                size = len(quote(unique_id, safe="")) + len("unique_id=&")
+                if chunk and (
+                    len(chunk) == UNIQUE_IDS_PER_REQUEST
+                    or length + size > UNIQUE_IDS_QUERY_LENGTH
+                ):
+                    yield chunk
+                    chunk, length = [], 0
+                chunk.append(unique_id)
+                length += size
+            if chunk:
+                yield chunk
+
+        def fetch(chunk: List[str]) -> List[Union[Task, CompactTask]]:
+            tasks_args = {"unique_id": chunk, "limit": UNIQUE_IDS_PER_REQUEST}
+            if project_name:
+                tasks_args["project"] = project_name
+            return [
+                task
+                for page in self._get_tasks_pages(tasks_args, compact)
+                for task in page.docs
+            ]
+
+        found = {}
+        for _, result in bounded_map(fetch, chunks(), concurrency, ordered=False):
+            if isinstance(result, Exception):
+                raise result
+            for task in result:
+                found[task.unique_id] = task
+
+        missing = [unique_id for unique_id in unique_ids if unique_id not in found]
+        return found, missing
+
     def create_batch(
         self,
         project: str,
@@ -781,6 +2006,7 @@ class ScaleClient:
         """
         endpoint = f"batches/{Api.quote_string(batch_name)}/finalize"
         batchdata = self.api.post_request(endpoint)
+        self._invalidate(("batch", batch_name))
         return Batch(batchdata, self)
 
     def batch_status(self, batch_name: str) -> Dict:
@@ -817,7 +2043,7 @@ class ScaleClient:
             Batch
         """
         endpoint = f"batches/{Api.quote_string(batch_name)}"
-        batchdata = self.api.get_request(endpoint)
+        batchdata = self._cached_get(("batch", batch_name), endpoint)
         return Batch(batchdata, self)
 
     def batches(self, **kwargs) -> Batchlist:
@@ -857,18 +2083,8 @@ class ScaleClient:
                 to batches list. Batchlist.limit and Batchlist.offset
                 are helpers for pagination.
         """
-        allowed_kwargs = {
-            "start_time",
-            "end_time",
-            "exclude_archived",
-            "status",
-            "project",
-            "limit",
-            "offset",
-        }
-
         for key in kwargs:
-            if key not in allowed_kwargs:
+            if key not in BATCHES_ALLOWED_KWARGS:
                 raise ScaleInvalidRequest(
                     f"Illegal parameter {key} for ScaleClient.batches()"
                 )
@@ -891,6 +2107,7 @@ class ScaleClient:
         created_after: str = None,
         created_before: str = None,
         exclude_archived: bool = False,
+        concurrency: int = 1,
     ) -> Generator[Batch, None, None]:
         """`Generator` method to yield all batches with the given
         parameters.
@@ -898,6 +2115,10 @@ class ScaleClient:
         In order to retrieve results as a list, please use:
         `batches_list = list(get_batches(...))`
 
+        The first page reports the total number of batches, so with
+        `concurrency` greater than 1 the remaining pages are fetched
+        in parallel, while batches are still yielded in order.
+
         Args:
             project_name (str):
                 Project Name to filter batches
@@ -916,30 +2137,46 @@ class ScaleClient:
             exclude_archived (bool):
                 A flag to exclude archived batches if True
 
+            concurrency (int):
+                Number of pages to fetch in parallel, defaults to 1
+
         Yields:
             Generator[Batch]:
                 Yields Batch, can be iterated.
         """
 
-        has_more = True
-        offset = 0
+        batches_args = {
+            "start_time": created_after,
+            "end_time": created_before,
+            "project": project_name,
+            "exclude_archived": exclude_archived,
+        }
 
-        while has_more:
-            batches_args = {
-                "start_time": created_after,
-                "end_time": created_before,
-                "project": project_name,
-                "offset": offset,
-                "exclude_archived": exclude_archived,
-            }
+        if batch_status:
+            batches_args["status"] = batch_status.value
 
-            if batch_status:
-                batches_args["status"] = batch_status.value
+        batches = self.batches(**batches_args, offset=0)
+        yield from batches.docs
+        offset = batches.limit
 
-            batches = self.batches(**batches_args)
+        if concurrency > 1 and batches.has_more:
+            pages = bounded_map(
+                lambda page_offset: self.batches(**batches_args, offset=page_offset),
+                range(offset, batches.total, batches.limit),
+                concurrency,
+            )
+            for _, batches in pages:
+                if isinstance(batches, Exception):
+                    raise batches
+                yield from batches.docs
+                offset += batches.limit
+
+        # Sequentially fetch the rest, including batches created
+        # after the first page was retrieved
+        while batches.has_more:
+            batches = self.batches(**batches_args, offset=offset)
             yield from batches.docs
             offset += batches.limit
-            has_more = batches.has_more
 
     def set_batch_metadata(self, batch_name: str, metadata: Dict) -> Batch:
         """Sets metadata for a TaskBatch.
@@ -955,6 +2192,7 @@ class ScaleClient:
         """
         endpoint = f"batches/{Api.quote_string(batch_name)}/setMetadata"
         batchdata = self.api.post_request(endpoint, body=metadata)
+        self._invalidate(("batch", batch_name))
         return Batch(batchdata, self)
 
     def create_project(
@@ -1001,6 +2239,7 @@ class ScaleClient:
             "datasetId": dataset_id,
         }
         projectdata = self.api.post_request(endpoint, body=payload)
+        self._invalidate(("projects",))
         return Project(projectdata, self)
 
     def get_project(self, project_name: str) -> Project:
@@ -1015,7 +2254,7 @@ class ScaleClient:
             Project
         """
         endpoint = f"projects/{Api.quote_string(project_name)}"
-        projectdata = self.api.get_request(endpoint)
+        projectdata = self._cached_get(("project", project_name), endpoint)
         return Project(projectdata, self)
 
     def get_projects(self) -> List[Project]:
@@ -1038,7 +2277,7 @@ class ScaleClient:
             List[Project]
         """
         endpoint = "projects"
-        project_list = self.api.get_request(endpoint)
+        project_list = self._cached_get(("projects",), endpoint)
         return [Project(project, self) for project in project_list]
 
     def update_project(self, project_name: str, **kwargs) -> Project:
@@ -1061,6 +2300,9 @@ class ScaleClient:
 
         endpoint = f"projects/{Api.quote_string(project_name)}/setParams"
         projectdata = self.api.post_request(endpoint, body=kwargs)
+        self._invalidate(
+            ("project", project_name), ("template", project_name), ("projects",)
+        )
         return Project(projectdata, self)
 
     def get_project_template(self, project_name: str) -> TaskTemplate:
@@ -1077,17 +2319,28 @@ class ScaleClient:
             TaskTemplate
         """
         endpoint = f"projects/{Api.quote_string(project_name)}/taskTemplates"
-        template = self.api.get_request(endpoint)
+        template = self._cached_get(("template", project_name), endpoint)
         return TaskTemplate(template, self)
 
-    def upload_file(self, file: IO, **kwargs) -> File:
+    def upload_file(
+        self,
+        file: Union[IO, str, os.PathLike],
+        progress_callback: Callable[[int, int], None] = None,
+        **kwargs,
+    ) -> File:
         """Upload file.
         Refer to Files API Reference:
         https://docs.scale.com/reference#file-upload-1
 
+        The file is streamed in chunks, so memory usage doesn't grow
+        with its size. A file given as a path is memory-mapped.
+
         Args:
-            file (IO):
-                File buffer
+            file (IO | str | os.PathLike):
+                Binary file buffer, or path of the file
+            progress_callback (Callable[[int, int], None], optional):
+                Called with the bytes uploaded so far and the total
+                size of the request
 
         Returns:
             File
@@ -1095,7 +2348,9 @@ class ScaleClient:
 
         endpoint = "files/upload"
         files = {"file": file}
-        filedata = self.api.post_request(endpoint, files=files, data=kwargs)
+        filedata = self.api.post_request(
+            endpoint, files=files, data=kwargs, progress_callback=progress_callback
+        )
         return File(filedata, self)
 
     def import_file(self, file_url: str, **kwargs) -> File:
@@ -1454,3 +2709,14 @@ class ScaleClient:
         endpoint = "studio/batches/reset_priorities"
         batches = self.api.post_request(endpoint)
         return [StudioBatch(batch, self) for batch in batches]
+
+
+def __getattr__(name):
+    # AsyncScaleClient is imported on first access, so that its
+    # optional dependencies are not loaded for the sync client
+    if name == "AsyncScaleClient":
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from .async_client import AsyncScaleClient
+
+        return AsyncScaleClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,8 +4,12 @@ import urllib.parse
 import requests
 from requests.adapters import HTTPAdapter, Response, Retry
 
+from . import json_codec
 from ._version import __package_name__, __version__
 from .exceptions import ExceptionMap, ScaleException
+from .instrumentation import Instrumentation
+from .multipart import MultipartEncoder
+from .rate_limit import HTTP_TOO_MANY_REQUESTS, parse_retry_after
 
 SCALE_API_BASE_URL_V1 = "https://api.scale.com/v1"
 
@@ -14,6 +18,12 @@ HTTP_TOTAL_RETRIES = 3  # Number of total retries
 HTTP_RETRY_BACKOFF_FACTOR = 2  # Wait 1, 2, 4 seconds between retries
 HTTP_STATUS_FORCE_LIST = [408, 429] + list(range(500, 531))
 HTTP_RETRY_ALLOWED_METHODS = frozenset({"GET", "POST", "DELETE"})
+HTTP_RETRY_AFTER_STATUS_CODES = frozenset({413, 429, 503})
+HTTP_RETRY_BACKOFF_MAX = 120  # Max seconds to wait between retries
+
+# Parameters for HTTP connection pooling
+HTTP_POOL_CONNECTIONS = 10  # Number of host pools to cache
+HTTP_POOL_MAXSIZE = 10  # Max number of connections to keep per host
 
 
 class Api:
@@ -27,11 +37,17 @@ class Api:
         verify=None,
         proxies=None,
         cert=None,
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        rate_limiter=None,
+        hooks=None,
     ):
         if api_key == "" or api_key is None:
             raise ScaleException("Please provide a valid API Key.")
 
         self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.instrumentation = Instrumentation(hooks)
 
         self._auth = (self.api_key, "")
         self._headers = {
@@ -47,8 +63,87 @@ class Api:
         self.proxies = proxies
         self.cert = cert
 
-    @staticmethod
+        self._session = self._create_session(pool_connections, pool_maxsize)
+
+    def _create_session(self, pool_connections, pool_maxsize) -> requests.Session:
+        """Creates the long-lived HTTP session shared by all requests
+        of this client. Connections are kept alive and reused, so
+        consecutive calls don't pay for a new TCP+TLS handshake.
+        The underlying connection pool is thread-safe.
+
+        Args:
+            pool_connections (int):
+                Number of host connection pools to cache
+            pool_maxsize (int):
+                Maximum number of connections to keep per host,
+                should be at least the number of concurrent threads
+
+        Returns:
+            requests.Session: Configured session
+        """
+        session = requests.Session()
+        retry_strategy = _ObservedRetry(
+            total=HTTP_TOTAL_RETRIES,
+            backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
+            status_forcelist=HTTP_STATUS_FORCE_LIST,
+            allowed_methods=HTTP_RETRY_ALLOWED_METHODS,
+            raise_on_status=False,
+            on_retry=self._on_retry,
+        )
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry_strategy,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        session.cert = self.cert if self.cert else None
+        session.verify = self.verify if self.verify else True
+        if self.proxies:
+            session.proxies.update(self.proxies)
+
+        return session
+
+    def _on_retry(self, retry_history, response=None) -> bool:
+        """Reports retried attempts, which never reach `_http_request`,
+        to the rate limiter and instrumentation hooks, and waits for
+        the rate limiter to allow the next attempt.
+
+        Returns True if the rate limiter waited for the `Retry-After`
+        of a throttled response, which urllib3 must not wait for again.
+        """
+        waited = False
+        if self.rate_limiter:
+            if response is not None:
+                self.rate_limiter.on_response(response.status, response.headers)
+                waited = response.status == HTTP_TOO_MANY_REQUESTS and (
+                    parse_retry_after(response.headers.get("Retry-After")) is not None
+                )
+            self.rate_limiter.acquire()
+        attempt = retry_history[-1]
+        self.instrumentation.retry(
+            attempt.method,
+            attempt.url,
+            len(retry_history),
+            attempt.status,
+            attempt.error,
+        )
+        return waited
+
+    def close(self):
+        """Closes the HTTP session and releases pooled connections."""
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _http_request(
+        self,
         method,
         url,
         headers=None,
@@ -57,46 +152,46 @@ class Api:
         body=None,
         files=None,
         data=None,
-        verify=None,
-        proxies=None,
-        cert=None,
     ) -> Response:
-        https = requests.Session()
-        retry_strategy = Retry(
-            total=HTTP_TOTAL_RETRIES,
-            backoff_factor=HTTP_RETRY_BACKOFF_FACTOR,
-            status_forcelist=HTTP_STATUS_FORCE_LIST,
-            allowed_methods=HTTP_RETRY_ALLOWED_METHODS,
-            raise_on_status=False,
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        https.mount("https://", adapter)
-
-        https.cert = cert if cert else None
-        https.verify = verify if verify else True
-        if proxies:
-            https.proxies.update(proxies)
-
+        request = self.instrumentation.request_start(method, url)
         try:
             params = params or {}
-            body = body or None
+            if body:
+                data = json_codec.dumps(body)
 
-            res = https.request(
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+
+            res = self._session.request(
                 method=method,
                 url=url,
                 headers=headers,
                 auth=auth,
                 params=params,
-                json=body,
                 files=files,
                 data=data,
             )
-
-            return res
         except Exception as err:
+            self.instrumentation.request_end(request, error=err)
             raise ScaleException(err) from err
 
+        if self.rate_limiter:
+            self.rate_limiter.on_response(res.status_code, res.headers)
+        if request is not None:
+            self._end_request(request, res)
+        return res
+
+    def _end_request(self, request, res: Response):
+        """Reports a completed request to instrumentation hooks"""
+        request.request_bytes = _content_length(res.request.headers)
+        try:
+            attempt = len(res.raw.retries.history) + 1
+        except AttributeError:
+            attempt = 1
+        self.instrumentation.request_end(
+            request, res.status_code, len(res.content), attempt
+        )
+
     @staticmethod
     def _raise_on_respose(res: Response):
         try:
@@ -131,15 +226,12 @@ class Api:
             body,
             files,
             data,
-            verify=self.verify,
-            proxies=self.proxies,
-            cert=self.cert,
         )
 
         json = None
         if res.status_code == 200:
             try:
-                json = res.json()
+                json = json_codec.loads(res.content)
             except ValueError:
                 # Some endpoints only return 'OK' message without JSON
                 return json
@@ -163,7 +255,7 @@ class Api:
                 new_res = self._http_request("GET", new_url, headers=headers, auth=auth)
 
                 if new_res.status_code == 200:
-                    new_res_data = new_res.json()
+                    new_res_data = json_codec.loads(new_res.content)
                     if new_res_data["docs"]:
                         json = new_res_data["docs"][0]
                     else:
@@ -182,19 +274,32 @@ class Api:
             "GET", endpoint, headers=self._headers, auth=self._auth, params=params
         )
 
-    def post_request(self, endpoint, body=None, files=None, data=None):
-        """Generic POST Request Wrapper"""
-        return self._api_request(
-            "POST",
-            endpoint,
-            headers=(
-                self._headers if files is None else self._headers_multipart_form_data
-            ),
-            auth=self._auth,
-            body=body,
-            files=files,
-            data=data,
-        )
+    def post_request(
+        self, endpoint, body=None, files=None, data=None, progress_callback=None
+    ):
+        """Generic POST Request Wrapper. Files are streamed with the
+        `data` fields as a multipart form, see `MultipartEncoder`."""
+        if files is None:
+            return self._api_request(
+                "POST",
+                endpoint,
+                headers=self._headers,
+                auth=self._auth,
+                body=body,
+                data=data,
+            )
+
+        with MultipartEncoder(data, files, progress_callback) as encoder:
+            return self._api_request(
+                "POST",
+                endpoint,
+                headers={
+                    **self._headers_multipart_form_data,
+                    "Content-Type": encoder.content_type,
+                },
+                auth=self._auth,
+                data=encoder,
+            )
 
     def delete_request(self, endpoint, params=None, body=None):
         """Generic DELETE Request Wrapper"""
@@ -261,3 +366,315 @@ class Api:
             str: Quoted text in return
         """
         return urllib.parse.quote(text, safe="")
+
+
+class _ObservedRetry(Retry):
+    """urllib3 `Retry` calling `on_retry` with the retry history and
+    the response (if any) of every attempt that is retried, as urllib3
+    retries them internally. If `on_retry` returns True, it already
+    waited before the next attempt and `sleep()` returns at once."""
+
+    def __init__(self, *args, on_retry=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.on_retry = on_retry
+        self.waited = False
+
+    def new(self, **kw):
+        kw.setdefault("on_retry", self.on_retry)
+        return super().new(**kw)
+
+    def increment(self, *args, **kwargs):
+        new_retry = super().increment(*args, **kwargs)
+        if self.on_retry:
+            new_retry.waited = bool(
+                self.on_retry(new_retry.history, kwargs.get("response"))
+            )
+        return new_retry
+
+    def sleep(self, response=None):
+        if not self.waited:
+            super().sleep(response)
+
+
+def _content_length(headers) -> int:
+    """Size of a request body, None if not known in advance"""
+    length = headers.get("Content-Length")
+    return int(length) if length is not None else None
+
+
+def _backoff_time(retry_count: int) -> float:
+    """Seconds to wait before the given retry, following the same
+    exponential schedule as urllib3's `Retry` with our settings."""
+    if retry_count <= 1:
+        return 0
+    backoff = HTTP_RETRY_BACKOFF_FACTOR * (2 ** (retry_count - 1))
+    return min(backoff, HTTP_RETRY_BACKOFF_MAX)
+
+
+class AsyncApi:
+    """Internal asyncio Api reference for handling http operations.
+
+    Mirrors `Api` on top of `httpx.AsyncClient`, sharing its endpoints,
+    retry schedule and exception mapping. Requires the optional
+    `httpx` dependency: `pip install scaleapi[async]`
+    """
+
+    def __init__(
+        self,
+        api_key,
+        user_agent_extension=None,
+        api_instance_url=None,
+        verify=None,
+        proxies=None,
+        cert=None,
+        max_connections=100,
+        rate_limiter=None,
+        hooks=None,
+    ):
+        if api_key == "" or api_key is None:
+            raise ScaleException("Please provide a valid API Key.")
+
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as err:
+            raise ScaleException(
+                "AsyncScaleClient requires httpx, "
+                "please install it with `pip install scaleapi[async]`"
+            ) from err
+
+        self.api_key = api_key
+        self.rate_limiter = rate_limiter
+        self.instrumentation = Instrumentation(hooks)
+
+        self._auth = (self.api_key, "")
+        self._headers = {
+            "Content-Type": "application/json",
+            "User-Agent": Api._generate_useragent(user_agent_extension),
+        }
+        self._headers_multipart_form_data = {
+            "User-Agent": Api._generate_useragent(user_agent_extension),
+        }
+        self.base_api_url = api_instance_url or SCALE_API_BASE_URL_V1
+
+        self.verify = verify
+        self.proxies = proxies
+        self.cert = cert
+
+        self._transport_error = httpx.TransportError
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        transport_args = {
+            "verify": verify if verify else True,
+            "cert": cert if cert else None,
+            "limits": limits,
+        }
+        # Transports only accept `httpx.Proxy` objects before httpx 0.26
+        mounts = {
+            f"{scheme}://": httpx.AsyncHTTPTransport(
+                proxy=httpx.Proxy(proxy) if isinstance(proxy, str) else proxy,
+                **transport_args,
+            )
+            for scheme, proxy in (proxies or {}).items()
+        }
+        # Requests wait for a free pooled connection without a timeout,
+        # so the number of in-flight requests is bounded by the pool.
+        self._client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(**transport_args),
+            mounts=mounts,
+            timeout=None,
+        )
+
+    async def close(self):
+        """Closes the HTTP client and releases pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    @staticmethod
+    def _prepare_params(params):
+        """Encodes query params the same way `requests` does, dropping
+        None values and keeping Python's bool representation."""
+        return {
+            key: str(value) if isinstance(value, bool) else value
+            for key, value in (params or {}).items()
+            if value is not None
+        }
+
+    @staticmethod
+    def _retry_delay(res, retry_count: int) -> float:
+        if res is not None and res.status_code in HTTP_RETRY_AFTER_STATUS_CODES:
+            retry_after = parse_retry_after(res.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        return _backoff_time(retry_count)
+
+    async def _http_request(
+        self,
+        method,
+        url,
+        headers=None,
+        auth=None,
+        params=None,
+        body=None,
+        files=None,
+        data=None,
+    ):
+        """Performs the request with retries, returning the response
+        along with status codes of the retried attempts."""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        retry_history = []
+        retryable = method in HTTP_RETRY_ALLOWED_METHODS
+        request = self.instrumentation.request_start(method, url)
+
+        while True:
+            res, error = None, None
+            if self.rate_limiter:
+                await self.rate_limiter.acquire_async()
+            try:
+                res = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    auth=auth,
+                    params=self._prepare_params(params),
+                    content=json_codec.dumps(body) if body else None,
+                    files=files,
+                    data=data,
+                )
+            except self._transport_error as err:
+                error = err
+                if len(retry_history) >= HTTP_TOTAL_RETRIES:
+                    self.instrumentation.request_end(
+                        request, attempt=len(retry_history) + 1, error=err
+                    )
+                    raise ScaleException(err) from err
+            except Exception as err:
+                self.instrumentation.request_end(
+                    request, attempt=len(retry_history) + 1, error=err
+                )
+                raise ScaleException(err) from err
+
+            if self.rate_limiter and res is not None:
+                self.rate_limiter.on_response(res.status_code, res.headers)
+
+            if res is not None and (
+                not retryable
+                or res.status_code not in HTTP_STATUS_FORCE_LIST
+                or len(retry_history) >= HTTP_TOTAL_RETRIES
+            ):
+                self._end_request(request, res, len(retry_history) + 1)
+                return res, retry_history
+
+            retry_history.append(res.status_code if res is not None else None)
+            self.instrumentation.retry(
+                method,
+                url,
+                len(retry_history),
+                res.status_code if res is not None else None,
+                error if res is None else None,
+            )
+            await asyncio.sleep(self._retry_delay(res, len(retry_history)))
+
+    def _end_request(self, request, res, attempt: int):
+        """Reports a completed request to instrumentation hooks"""
+        if request is not None:
+            request.request_bytes = _content_length(res.request.headers)
+            self.instrumentation.request_end(
+                request, res.status_code, len(res.content), attempt
+            )
+
+    async def _api_request(
+        self,
+        method,
+        endpoint,
+        headers=None,
+        auth=None,
+        params=None,
+        body=None,
+        files=None,
+        data=None,
+    ):
+        """Generic HTTP request method with error handling."""
+
+        url = f"{self.base_api_url}/{endpoint}"
+
+        res, retry_history = await self._http_request(
+            method, url, headers, auth, params, body, files, data
+        )
+
+        if res.status_code == 200:
+            try:
+                return json_codec.loads(res.content)
+            except ValueError:
+                # Some endpoints only return 'OK' message without JSON
+                return None
+
+        if res.status_code == 409 and "task" in endpoint and body.get("unique_id"):
+            # Task was created by an earlier attempt that returned 5xx
+            if retry_history and (retry_history[0] or 0) >= 500:
+                new_url = f"{self.base_api_url}/tasks"
+                new_res, _ = await self._http_request(
+                    "GET",
+                    new_url,
+                    headers=headers,
+                    auth=auth,
+                    params={"unique_id": body["unique_id"]},
+                )
+                docs = None
+                if new_res.status_code == 200:
+                    docs = json_codec.loads(new_res.content)["docs"]
+                if docs:
+                    return docs[0]
+                Api._raise_on_respose(new_res)  # pylint: disable=protected-access
+
+        Api._raise_on_respose(res)  # pylint: disable=protected-access
+        return None
+
+    async def get_request(self, endpoint, params=None):
+        """Generic GET Request Wrapper"""
+        return await self._api_request(
+            "GET", endpoint, headers=self._headers, auth=self._auth, params=params
+        )
+
+    async def post_request(self, endpoint, body=None, files=None, data=None):
+        """Generic POST Request Wrapper"""
+        return await self._api_request(
+            "POST",
+            endpoint,
+            headers=(
+                self._headers if files is None else self._headers_multipart_form_data
+            ),
+            auth=self._auth,
+            body=body,
+            files=files,
+            data=data,
+        )
+
+    async def delete_request(self, endpoint, params=None, body=None):
+        """Generic DELETE Request Wrapper"""
+        return await self._api_request(
+            "DELETE",
+            endpoint,
+            headers=self._headers,
+            auth=self._auth,
+            params=params,
+            body=body,
+        )
+
+    async def put_request(self, endpoint, body=None, params=None):
+        """Generic PUT Request Wrapper"""
+        return await self._api_request(
+            "PUT",
+            endpoint,
+            body=body,
+            headers=self._headers,
+            auth=self._auth,
+            params=params,
+        )
@@ -16,6 +16,7 @@ import datetime
 from dateutil.parser import parse
 from enum import Enum
 import decimal
+import functools
 import json
 import mimetypes
 import os
@@ -26,8 +27,11 @@ from urllib.parse import quote
 from typing import Tuple, Optional, List, Dict, Union
 from pydantic import SecretStr
 
+from scaleapi import json_codec
 from scaleapi.api_client.v2.configuration import Configuration
 from scaleapi.api_client.v2.api_response import ApiResponse, T as ApiResponseT
+from scaleapi.api_client.v2.construct import construct
+from scaleapi.api_client.v2 import lazy
 import scaleapi.api_client.v2.models
 from scaleapi.api_client.v2 import rest
 from scaleapi.api_client.v2.exceptions import (
@@ -92,6 +96,18 @@ class ApiClient:
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/1.0.0/python'
         self.client_side_validation = configuration.client_side_validation
+        # Optional scaleapi.rate_limit.RateLimiter shared with the v1 client
+        self.rate_limiter = None
+        # Optional scaleapi.instrumentation.Instrumentation of the client
+        self.instrumentation = None
+        # If False, response models are built without pydantic
+        # validation, see scaleapi.api_client.v2.construct
+        self.validate_responses = True
+        # If True, the threads of tasks are parsed on first access,
+        # see scaleapi.api_client.v2.lazy
+        self.lazy_threads = False
+        # Deserializers of the response types, by type
+        self._deserializers = {}
 
     def __enter__(self):
         return self
@@ -114,6 +130,10 @@ class ApiClient:
 
     _default = None
 
+    # Number of times a throttled (429) request is retried when a
+    # rate limiter is set
+    RATE_LIMIT_RETRIES = 3
+
     @classmethod
     def get_default(cls):
         """Return new instance of ApiClient.
@@ -268,20 +288,66 @@ class ApiClient:
         :return: RESTResponse
         """
 
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
-                method, url,
-                headers=header_params,
-                body=body, post_params=post_params,
-                _request_timeout=_request_timeout
+        request = None
+        if self.instrumentation:
+            request = self.instrumentation.request_start(
+                method, url, self._body_size(body)
             )
 
-        except ApiException as e:
+        try:
+            # perform request and return response
+            for attempt in range(1, self.RATE_LIMIT_RETRIES + 2):
+                if self.rate_limiter:
+                    self.rate_limiter.acquire()
+                response_data = self.rest_client.request(
+                    method, url,
+                    headers=header_params,
+                    body=body, post_params=post_params,
+                    _request_timeout=_request_timeout
+                )
+                if not self.rate_limiter:
+                    break
+                self.rate_limiter.on_response(
+                    response_data.status, response_data.getheaders()
+                )
+                # Throttled requests are retried once the limiter allows
+                if response_data.status != 429 or attempt > self.RATE_LIMIT_RETRIES:
+                    break
+                response_data.response.drain_conn()
+                if self.instrumentation:
+                    self.instrumentation.retry(method, url, attempt, 429)
+
+        except Exception as e:
+            if request is not None:
+                self.instrumentation.request_end(request, error=e)
             raise e
 
+        if request is not None:
+            self.instrumentation.request_end(
+                request,
+                response_data.status,
+                self._content_length(response_data),
+                attempt,
+            )
         return response_data
 
+    @staticmethod
+    def _content_length(response_data):
+        """Size of a response body, without reading a streamed one"""
+        if response_data.data is not None:
+            return len(response_data.data)
+        length = response_data.getheader("Content-Length")
+        return int(length) if length is not None else None
+
+    @staticmethod
+    def _body_size(body):
+        """Size of a JSON or raw request body, for instrumentation"""
+        if body is None:
+            return None
+        if isinstance(body, (bytes, str)):
+            return len(body)
+        return len(json_codec.dumps(body))
+
     def response_deserialize(
         self,
         response_data: rest.RESTResponse,
@@ -315,8 +381,12 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                if encoding.lower() in ("utf-8", "utf8") and self._is_json(content_type):
+                    # JSON is decoded straight from the response bytes
+                    response_body = response_data.data
+                else:
+                    response_body = response_text = response_data.data.decode(encoding)
+                return_data = self.deserialize(response_body, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -387,10 +457,16 @@ class ApiClient:
             for key, val in obj_dict.items()
         }
 
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    @staticmethod
+    def _is_json(content_type: Optional[str]) -> bool:
+        return content_type is not None and re.match(
+            r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE
+        ) is not None
+
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response: RESTResponse object to be deserialized.
+        :param response_text: response body, JSON bodies can be bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -401,14 +477,14 @@ class ApiClient:
         # fetch data from response object
         if content_type is None:
             try:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
             except ValueError:
                 data = response_text
-        elif re.match(r'^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)', content_type, re.IGNORECASE):
-            if response_text == "":
+        elif self._is_json(content_type):
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = json_codec.loads(response_text)
         elif re.match(r'^text\/[a-z.+-]+\s*(;|$)', content_type, re.IGNORECASE):
             data = response_text
         else:
@@ -430,20 +506,36 @@ class ApiClient:
         if data is None:
             return None
 
+        # Type strings are resolved once, and their plan reused by
+        # later responses
+        try:
+            deserializer = self._deserializers[klass]
+        except KeyError:
+            deserializer = self.__compile_deserializer(klass)
+            self._deserializers[klass] = deserializer
+        return deserializer(data)
+
+    def __compile_deserializer(self, klass):
+        """Resolves a type into the function deserializing its data.
+
+        :param klass: class literal, or string of class name.
+
+        :return: function of the data, returning an object.
+        """
         if isinstance(klass, str):
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
-                sub_kls = m.group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                sub_deserializer = self.__compile_nullable(m.group(1))
+                return lambda data: [sub_deserializer(sub_data)
+                                     for sub_data in data]
 
             if klass.startswith('Dict['):
                 m = re.match(r'Dict\[([^,]*), (.*)]', klass)
                 assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in data.items()}
+                sub_deserializer = self.__compile_nullable(m.group(2))
+                return lambda data: {k: sub_deserializer(v)
+                                     for k, v in data.items()}
 
             # convert str to class
             if klass in self.NATIVE_TYPES_MAPPING:
@@ -452,19 +544,24 @@ class ApiClient:
                 klass = getattr(scaleapi.api_client.v2.models, klass)
 
         if klass in self.PRIMITIVE_TYPES:
-            return self.__deserialize_primitive(data, klass)
+            return functools.partial(self.__deserialize_primitive, klass=klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return self.__deserialize_object
         elif klass == datetime.date:
-            return self.__deserialize_date(data)
+            return self.__deserialize_date
         elif klass == datetime.datetime:
-            return self.__deserialize_datetime(data)
+            return self.__deserialize_datetime
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            return decimal.Decimal
         elif issubclass(klass, Enum):
-            return self.__deserialize_enum(data, klass)
+            return functools.partial(self.__deserialize_enum, klass=klass)
         else:
-            return self.__deserialize_model(data, klass)
+            return functools.partial(self.__deserialize_model, klass=klass)
+
+    def __compile_nullable(self, klass):
+        """Like `__compile_deserializer`, for values that can be None."""
+        deserializer = self.__compile_deserializer(klass)
+        return lambda data: None if data is None else deserializer(data)
 
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
@@ -794,4 +891,8 @@ class ApiClient:
         :return: model object.
         """
 
+        if self.lazy_threads:
+            return lazy.deserialize(klass, data, self.validate_responses)
+        if not self.validate_responses:
+            return construct(klass, data)
         return klass.from_dict(data)
@@ -0,0 +1,291 @@
+# coding: utf-8
+
+"""Builds v2 models from trusted API responses with `model_construct`,
+skipping pydantic validation. Used by `ApiClient` when
+`validate_responses` is False.
+
+Nested models, lists, dicts, datetimes and enums are converted from
+the field annotations, honoring field aliases. oneOf wrappers are
+built directly when their schema is unambiguous, i.e. an annotation
+by its `type`, and validated with `from_dict()` otherwise.
+"""
+
+import datetime
+import functools
+import typing
+from enum import Enum
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from dateutil.parser import parse
+from pydantic import BaseModel
+from typing_extensions import Annotated, get_args, get_origin
+
+Converter = Callable[[Any], Any]
+
+
+def construct(klass: type, data: Any) -> Any:
+    """Returns `data`, decoded JSON, as an instance of `klass`
+    without validating it"""
+    return _converter(klass)(data)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _unwrap(annotation: Any) -> Any:
+    """Strips `Annotated[...]` constraints, i.e. of `StrictStr`"""
+    while get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    return annotation
+
+
+def _is_model(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, BaseModel)
+
+
+def _parse_datetime(value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        return datetime.datetime.fromisoformat(
+            value[:-1] + "+00:00" if value.endswith("Z") else value
+        )
+    except ValueError:
+        return parse(value)
+
+
+def _parse_date(value: Any) -> Any:
+    return parse(value).date() if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=None)
+def _converter(annotation: Any) -> Converter:
+    """Returns the function converting JSON values of a type"""
+    annotation = _unwrap(annotation)
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is typing.Union:
+        types = [_unwrap(arg) for arg in args if arg is not type(None)]
+        if len(types) == 1:
+            return _converter(types[0])
+        if not any(_is_model(arg) or get_origin(arg) for arg in types):
+            # A union of primitives, i.e. `Union[StrictFloat, StrictInt]`
+            return _identity
+        return _validator(annotation)
+    if origin in (list, List):
+        item = _converter(args[0]) if args else _identity
+        if item is _identity:
+            return _identity
+        return lambda value: (
+            [None if v is None else item(v) for v in value]
+            if isinstance(value, list)
+            else value
+        )
+    if origin in (dict, Dict):
+        item = _converter(args[1]) if len(args) == 2 else _identity
+        if item is _identity:
+            return _identity
+        return lambda value: (
+            {k: None if v is None else item(v) for k, v in value.items()}
+            if isinstance(value, dict)
+            else value
+        )
+    if annotation is datetime.datetime:
+        return _parse_datetime
+    if annotation is datetime.date:
+        return _parse_date
+    if isinstance(annotation, type) and issubclass(annotation, Enum):
+        return _enum_converter(annotation)
+    if _is_model(annotation):
+        if "actual_instance" in annotation.model_fields:
+            return _one_of_converter(annotation)
+        return _model_converter(annotation)
+    return _identity
+
+
+def _validator(annotation: Any) -> Converter:
+    """Validates values of types that cannot be resolved from the
+    JSON alone, i.e. a union of several models"""
+    # pylint: disable=import-outside-toplevel
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(annotation)
+    return adapter.validate_python
+
+
+def _enum_converter(enum: type) -> Converter:
+    def convert(value: Any) -> Any:
+        try:
+            return enum(value)
+        except ValueError:
+            # A value added to the API after this client was generated
+            return value
+
+    return convert
+
+
+def _defaults(klass: type) -> Tuple[Dict[str, Any], List[str]]:
+    """Default values of the fields of a model, and the fields whose
+    mutable default is copied for each instance"""
+    if not klass.__pydantic_complete__:
+        klass.model_rebuild()
+    defaults = {
+        name: None if field.is_required() else field.get_default(call_default_factory=True)
+        for name, field in klass.model_fields.items()
+    }
+    mutable = [
+        name for name, value in defaults.items() if isinstance(value, (dict, list, set))
+    ]
+    return defaults, mutable
+
+
+def _instance(
+    klass: type,
+    values: Dict[str, Any],
+    fields_set: Set[str],
+    private: Dict[str, Any] = None,
+) -> Any:
+    """Creates a model from complete field values, like
+    `model_construct()` without resolving and copying the defaults"""
+    instance = object.__new__(klass)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", private)
+    return instance
+
+
+def _model_converter(klass: type) -> Converter:
+    # Built on first use, as models can reference themselves
+    plan: Dict[str, Any] = {}
+
+    def build():
+        defaults, _ = _defaults(klass)
+        fields = [
+            (field.alias or name, name, _converter(field.annotation), defaults[name])
+            for name, field in klass.model_fields.items()
+            if name != "additional_properties"
+        ]
+        plain = [
+            (key, name)
+            for key, name, field_converter, default in fields
+            if field_converter is _identity and default is None
+        ]
+        plan.update(
+            # Values used as they are, None if missing
+            plain=plain,
+            converted=[field for field in fields if field[:2] not in plain],
+            template=dict.fromkeys(klass.model_fields),
+            keys=frozenset(field[0] for field in fields),
+            # from_dict() sets all fields, None if missing
+            fields_set=frozenset(field[1] for field in fields),
+            additional_properties="additional_properties" in klass.model_fields,
+            # Private attributes need the initialization of pydantic
+            private=bool(klass.__private_attributes__),
+        )
+
+    def convert(data: Any) -> Any:
+        if not plan:
+            build()
+        if not isinstance(data, dict) or plan["private"]:
+            return klass.from_dict(data)
+        get = data.get
+        # Fields in the order of the model, like from_dict()
+        values = plan["template"].copy()
+        values.update({name: get(key) for key, name in plan["plain"]})
+        for key, name, field_converter, default in plan["converted"]:
+            value = get(key)
+            if value is not None:
+                values[name] = field_converter(value)
+            elif isinstance(default, (dict, list, set)):
+                values[name] = default.copy()
+            else:
+                values[name] = default
+        if plan["additional_properties"]:
+            keys = plan["keys"]
+            values["additional_properties"] = {
+                key: value for key, value in data.items() if key not in keys
+            }
+        return _instance(klass, values, set(plan["fields_set"]))
+
+    return convert
+
+
+def _union_args(klass: type) -> List[Any]:
+    """The schemas of the `actual_instance` of a oneOf wrapper"""
+    types = []
+    for arg in get_args(_unwrap(klass.model_fields["actual_instance"].annotation)):
+        arg = _unwrap(arg)
+        if get_origin(arg) is typing.Union:
+            types.extend(_unwrap(item) for item in get_args(arg))
+        elif arg is not type(None):
+            types.append(arg)
+    return types
+
+
+def _one_of_converter(klass: type) -> Converter:
+    # Resolved on first use, like the fields of models
+    dispatch: Dict[str, Any] = {}
+
+    def resolve():
+        types = _union_args(klass)
+        if klass.__name__ == "Annotation":
+            # pylint: disable=import-outside-toplevel
+            from scaleapi.api_client.v2.models.annotation import (
+                ANNOTATION_TYPE_CLASSES,
+            )
+
+            def schema(data):
+                return ANNOTATION_TYPE_CLASSES.get(data.get("type"))
+
+        else:
+            models = [arg for arg in types if _is_model(arg)]
+            model = models[0] if len(models) == 1 else None
+
+            def schema(_):
+                return model
+
+        defaults, mutable = _defaults(klass)
+        dispatch.update(
+            # The model of a dict, None if ambiguous
+            schema=schema,
+            str_schema=str in types,
+            # The validator field set with a str by from_dict()
+            str_validator=next(
+                (
+                    name
+                    for name, field in klass.model_fields.items()
+                    if name.startswith("oneof_schema_")
+                    and str in map(_unwrap, get_args(field.annotation))
+                ),
+                None,
+            ),
+            defaults=defaults,
+            mutable=mutable,
+        )
+
+    def wrap(actual_instance: Any, validator: str = None) -> Any:
+        defaults = dispatch["defaults"]
+        values = dict(defaults, actual_instance=actual_instance)
+        for name in dispatch["mutable"]:
+            values[name] = defaults[name].copy()
+        fields_set = {"actual_instance"}
+        if validator:
+            values[validator] = actual_instance
+            fields_set.add(validator)
+        return _instance(klass, values, fields_set)
+
+    def convert(data: Any) -> Any:
+        if not dispatch:
+            resolve()
+        if isinstance(data, dict):
+            model = dispatch["schema"](data)
+            if model is not None:
+                return wrap(_converter(model)(data))
+        elif isinstance(data, str) and dispatch["str_schema"]:
+            return wrap(data, dispatch["str_validator"])
+        return klass.from_dict(data)
+
+    return convert
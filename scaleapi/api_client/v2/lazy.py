@@ -0,0 +1,124 @@
+# coding: utf-8
+
+"""Builds v2 tasks whose `threads` are kept as decoded JSON until
+they are first accessed. Used by `ApiClient` when `lazy_threads` is
+True.
+
+A `LazyTask` is a `Task`: reading `task.threads`, serializing,
+comparing or printing the task parses its threads once, validated
+or not like the rest of the response, and caches them on the task.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from pydantic import PrivateAttr
+from typing_extensions import get_args, get_origin
+
+from scaleapi.api_client.v2.construct import _converter, _instance, construct
+from scaleapi.api_client.v2.models.task import Task
+from scaleapi.api_client.v2.models.thread import Thread
+
+# Serializes the parsing of threads read from several threads
+_lock = threading.Lock()
+
+
+class LazyTask(Task):
+    """Task parsing its `threads` on first access"""
+
+    _raw_threads: Optional[list] = PrivateAttr(default=None)
+    _validate: bool = PrivateAttr(default=True)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "threads":
+            self._materialize()
+            return self.__dict__["threads"]
+        return super().__getattr__(name)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Task):
+            return NotImplemented
+        # Lazy and eager tasks are equal when their fields are
+        self._materialize()
+        getattr(other, "threads")
+        return self.__dict__ == other.__dict__
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def _materialize(self) -> None:
+        """Parses the raw threads into the fields of the task"""
+        if "threads" in self.__dict__:
+            return
+        with _lock:
+            if "threads" in self.__dict__:
+                return
+            raw = self._raw_threads
+            if raw is None:
+                threads = None
+            elif self._validate:
+                threads = [Thread.from_dict(item) for item in raw]
+            else:
+                threads = _converter(Task.model_fields["threads"].annotation)(raw)
+            # Fields in the order of the model, like an eager task
+            values = self.__dict__
+            object.__setattr__(
+                self,
+                "__dict__",
+                {
+                    name: threads if name == "threads" else values[name]
+                    for name in Task.model_fields
+                },
+            )
+            self._raw_threads = None
+
+
+def lazy_task(data: Any, validate: bool = True) -> Any:
+    """Returns `data`, a decoded task, as a `LazyTask`. Fields other
+    than `threads` are validated unless `validate` is False."""
+    if not isinstance(data, dict):
+        return Task.from_dict(data) if validate else construct(Task, data)
+    raw = data.get("threads")
+    data = {key: value for key, value in data.items() if key != "threads"}
+    task = Task.from_dict(data) if validate else construct(Task, data)
+    values = task.__dict__
+    del values["threads"]
+    return _instance(
+        LazyTask,
+        values,
+        set(task.model_fields_set),
+        {"_raw_threads": raw, "_validate": validate},
+    )
+
+
+def deserialize(klass: type, data: Any, validate: bool = True) -> Any:
+    """Returns `data` as an instance of `klass`, with its tasks
+    built by `lazy_task()`"""
+    if klass is Task:
+        return lazy_task(data, validate)
+    fields = _task_list_fields(klass)
+    if not fields or not isinstance(data, dict):
+        return klass.from_dict(data) if validate else construct(klass, data)
+
+    # The response is built without its tasks, set afterwards
+    tasks = {name: data.get(key) for key, name in fields.items()}
+    data = dict(data, **{key: [] for key in fields})
+    instance = klass.from_dict(data) if validate else construct(klass, data)
+    for name, items in tasks.items():
+        instance.__dict__[name] = (
+            None if items is None else [lazy_task(item, validate) for item in items]
+        )
+    return instance
+
+
+def _task_list_fields(klass: type) -> Dict[str, str]:
+    """The aliases and names of the fields of a model listing tasks,
+    i.e. `GetTasksResponse.tasks`"""
+    fields = getattr(klass, "model_fields", None) or {}
+    return {
+        field.alias or name: name
+        for name, field in fields.items()
+        if get_origin(field.annotation) in (list, List)
+        and get_args(field.annotation) == (Task,)
+    }
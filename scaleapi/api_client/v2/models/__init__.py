@@ -13,119 +13,256 @@
 """  # noqa: E501
 
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import models into model package
-from scaleapi.api_client.v2.models.annotation import Annotation
-from scaleapi.api_client.v2.models.annotation_boolean import AnnotationBoolean
-from scaleapi.api_client.v2.models.annotation_boolean_properties import AnnotationBooleanProperties
-from scaleapi.api_client.v2.models.annotation_category import AnnotationCategory
-from scaleapi.api_client.v2.models.annotation_category_multiple import AnnotationCategoryMultiple
-from scaleapi.api_client.v2.models.annotation_category_multiple_properties import AnnotationCategoryMultipleProperties
-from scaleapi.api_client.v2.models.annotation_category_properties import AnnotationCategoryProperties
-from scaleapi.api_client.v2.models.annotation_file import AnnotationFile
-from scaleapi.api_client.v2.models.annotation_file_properties import AnnotationFileProperties
-from scaleapi.api_client.v2.models.annotation_file_properties_value import AnnotationFilePropertiesValue
-from scaleapi.api_client.v2.models.annotation_integer import AnnotationInteger
-from scaleapi.api_client.v2.models.annotation_integer_properties import AnnotationIntegerProperties
-from scaleapi.api_client.v2.models.annotation_labeled_text import AnnotationLabeledText
-from scaleapi.api_client.v2.models.annotation_labeled_text_properties import AnnotationLabeledTextProperties
-from scaleapi.api_client.v2.models.annotation_metadata import AnnotationMetadata
-from scaleapi.api_client.v2.models.annotation_ranked_choices import AnnotationRankedChoices
-from scaleapi.api_client.v2.models.annotation_ranked_choices_properties import AnnotationRankedChoicesProperties
-from scaleapi.api_client.v2.models.annotation_ranked_groups import AnnotationRankedGroups
-from scaleapi.api_client.v2.models.annotation_ranked_groups_properties import AnnotationRankedGroupsProperties
-from scaleapi.api_client.v2.models.annotation_rubric_criteria import AnnotationRubricCriteria
-from scaleapi.api_client.v2.models.annotation_rubric_criteria_properties import AnnotationRubricCriteriaProperties
-from scaleapi.api_client.v2.models.annotation_rubric_rating import AnnotationRubricRating
-from scaleapi.api_client.v2.models.annotation_rubric_rating_properties import AnnotationRubricRatingProperties
-from scaleapi.api_client.v2.models.annotation_text import AnnotationText
-from scaleapi.api_client.v2.models.annotation_text_properties import AnnotationTextProperties
-from scaleapi.api_client.v2.models.annotation_type import AnnotationType
-from scaleapi.api_client.v2.models.annotation_workspace_container import AnnotationWorkspaceContainer
-from scaleapi.api_client.v2.models.annotation_workspace_container_properties import AnnotationWorkspaceContainerProperties
-from scaleapi.api_client.v2.models.audio_file import AudioFile
-from scaleapi.api_client.v2.models.base_annotation import BaseAnnotation
-from scaleapi.api_client.v2.models.base_chunk import BaseChunk
-from scaleapi.api_client.v2.models.basic_file import BasicFile
-from scaleapi.api_client.v2.models.batch import Batch
-from scaleapi.api_client.v2.models.batch_operation_request import BatchOperationRequest
-from scaleapi.api_client.v2.models.batch_status import BatchStatus
-from scaleapi.api_client.v2.models.cancel_batch200_response import CancelBatch200Response
-from scaleapi.api_client.v2.models.chunk import Chunk
-from scaleapi.api_client.v2.models.chunk_text import ChunkText
-from scaleapi.api_client.v2.models.chunk_text_properties import ChunkTextProperties
-from scaleapi.api_client.v2.models.content_and_url import ContentAndUrl
-from scaleapi.api_client.v2.models.create_batch_request import CreateBatchRequest
-from scaleapi.api_client.v2.models.create_chat_task_request import CreateChatTaskRequest
-from scaleapi.api_client.v2.models.criterion_definition import CriterionDefinition
-from scaleapi.api_client.v2.models.criterion_evaluation import CriterionEvaluation
-from scaleapi.api_client.v2.models.dataset import Dataset
-from scaleapi.api_client.v2.models.dataset_delivery import DatasetDelivery
-from scaleapi.api_client.v2.models.dataset_delivery_dataset import DatasetDeliveryDataset
-from scaleapi.api_client.v2.models.dataset_delivery_metadata import DatasetDeliveryMetadata
-from scaleapi.api_client.v2.models.dataset_task import DatasetTask
-from scaleapi.api_client.v2.models.delivery import Delivery
-from scaleapi.api_client.v2.models.detailed_file import DetailedFile
-from scaleapi.api_client.v2.models.error_detail import ErrorDetail
-from scaleapi.api_client.v2.models.error_type import ErrorType
-from scaleapi.api_client.v2.models.expandable import Expandable
-from scaleapi.api_client.v2.models.expandable_annotation import ExpandableAnnotation
-from scaleapi.api_client.v2.models.expandable_batch import ExpandableBatch
-from scaleapi.api_client.v2.models.expandable_dataset import ExpandableDataset
-from scaleapi.api_client.v2.models.expandable_dataset_delivery import ExpandableDatasetDelivery
-from scaleapi.api_client.v2.models.expandable_delivery import ExpandableDelivery
-from scaleapi.api_client.v2.models.expandable_enum_batch import ExpandableEnumBatch
-from scaleapi.api_client.v2.models.expandable_enum_dataset_task import ExpandableEnumDatasetTask
-from scaleapi.api_client.v2.models.expandable_enum_datasets_deliveries import ExpandableEnumDatasetsDeliveries
-from scaleapi.api_client.v2.models.expandable_enum_deliveries import ExpandableEnumDeliveries
-from scaleapi.api_client.v2.models.expandable_enum_delivery import ExpandableEnumDelivery
-from scaleapi.api_client.v2.models.expandable_enum_task import ExpandableEnumTask
-from scaleapi.api_client.v2.models.expandable_project import ExpandableProject
-from scaleapi.api_client.v2.models.get_batch500_response import GetBatch500Response
-from scaleapi.api_client.v2.models.get_batches_response import GetBatchesResponse
-from scaleapi.api_client.v2.models.get_dataset_deliveries_response import GetDatasetDeliveriesResponse
-from scaleapi.api_client.v2.models.get_dataset_delivery_response import GetDatasetDeliveryResponse
-from scaleapi.api_client.v2.models.get_dataset_task_response_url404_response import GetDatasetTaskResponseUrl404Response
-from scaleapi.api_client.v2.models.get_dataset_tasks_response import GetDatasetTasksResponse
-from scaleapi.api_client.v2.models.get_datasets_response import GetDatasetsResponse
-from scaleapi.api_client.v2.models.get_delivered_tasks_response import GetDeliveredTasksResponse
-from scaleapi.api_client.v2.models.get_deliveries_response import GetDeliveriesResponse
-from scaleapi.api_client.v2.models.get_delivery_tasks_response import GetDeliveryTasksResponse
-from scaleapi.api_client.v2.models.get_delivery_tasks_response_docs_inner import GetDeliveryTasksResponseDocsInner
-from scaleapi.api_client.v2.models.get_projects_response import GetProjectsResponse
-from scaleapi.api_client.v2.models.get_schema400_response import GetSchema400Response
-from scaleapi.api_client.v2.models.get_schema404_response import GetSchema404Response
-from scaleapi.api_client.v2.models.get_schema_response import GetSchemaResponse
-from scaleapi.api_client.v2.models.get_schema_response_schema import GetSchemaResponseSchema
-from scaleapi.api_client.v2.models.get_tasks_response import GetTasksResponse
-from scaleapi.api_client.v2.models.image_file import ImageFile
-from scaleapi.api_client.v2.models.labeled_text_value import LabeledTextValue
-from scaleapi.api_client.v2.models.message import Message
-from scaleapi.api_client.v2.models.message_content import MessageContent
-from scaleapi.api_client.v2.models.message_role import MessageRole
-from scaleapi.api_client.v2.models.model_parameters import ModelParameters
-from scaleapi.api_client.v2.models.option import Option
-from scaleapi.api_client.v2.models.pause_batch200_response import PauseBatch200Response
-from scaleapi.api_client.v2.models.project import Project
-from scaleapi.api_client.v2.models.reasoning import Reasoning
-from scaleapi.api_client.v2.models.reference_text import ReferenceText
-from scaleapi.api_client.v2.models.resume_batch200_response import ResumeBatch200Response
-from scaleapi.api_client.v2.models.rubric import Rubric
-from scaleapi.api_client.v2.models.rubric_criteria_value import RubricCriteriaValue
-from scaleapi.api_client.v2.models.rubric_evaluation import RubricEvaluation
-from scaleapi.api_client.v2.models.rubric_rating_value import RubricRatingValue
-from scaleapi.api_client.v2.models.sensitive_content_report import SensitiveContentReport
-from scaleapi.api_client.v2.models.set_batch_metadata_request import SetBatchMetadataRequest
-from scaleapi.api_client.v2.models.set_task_metadata_request import SetTaskMetadataRequest
-from scaleapi.api_client.v2.models.submission import Submission
-from scaleapi.api_client.v2.models.task import Task
-from scaleapi.api_client.v2.models.task_status import TaskStatus
-from scaleapi.api_client.v2.models.thread import Thread
-from scaleapi.api_client.v2.models.turn import Turn
-from scaleapi.api_client.v2.models.v1_task_task_id_get200_response import V1TaskTaskIdGet200Response
-from scaleapi.api_client.v2.models.v1_task_task_id_get200_response_response import V1TaskTaskIdGet200ResponseResponse
-from scaleapi.api_client.v2.models.workspace_container_config import WorkspaceContainerConfig
-from scaleapi.api_client.v2.models.workspace_container_value import WorkspaceContainerValue
-from scaleapi.api_client.v2.models.workspace_execution_data import WorkspaceExecutionData
-from scaleapi.api_client.v2.models.workspace_execution_data_result import WorkspaceExecutionDataResult
-from scaleapi.api_client.v2.models.workspace_execution_data_result_status import WorkspaceExecutionDataResultStatus
-from scaleapi.api_client.v2.models.workspace_file import WorkspaceFile
+if TYPE_CHECKING:
+    from scaleapi.api_client.v2.models.annotation import Annotation
+    from scaleapi.api_client.v2.models.annotation_boolean import AnnotationBoolean
+    from scaleapi.api_client.v2.models.annotation_boolean_properties import AnnotationBooleanProperties
+    from scaleapi.api_client.v2.models.annotation_category import AnnotationCategory
+    from scaleapi.api_client.v2.models.annotation_category_multiple import AnnotationCategoryMultiple
+    from scaleapi.api_client.v2.models.annotation_category_multiple_properties import AnnotationCategoryMultipleProperties
+    from scaleapi.api_client.v2.models.annotation_category_properties import AnnotationCategoryProperties
+    from scaleapi.api_client.v2.models.annotation_file import AnnotationFile
+    from scaleapi.api_client.v2.models.annotation_file_properties import AnnotationFileProperties
+    from scaleapi.api_client.v2.models.annotation_file_properties_value import AnnotationFilePropertiesValue
+    from scaleapi.api_client.v2.models.annotation_integer import AnnotationInteger
+    from scaleapi.api_client.v2.models.annotation_integer_properties import AnnotationIntegerProperties
+    from scaleapi.api_client.v2.models.annotation_labeled_text import AnnotationLabeledText
+    from scaleapi.api_client.v2.models.annotation_labeled_text_properties import AnnotationLabeledTextProperties
+    from scaleapi.api_client.v2.models.annotation_metadata import AnnotationMetadata
+    from scaleapi.api_client.v2.models.annotation_ranked_choices import AnnotationRankedChoices
+    from scaleapi.api_client.v2.models.annotation_ranked_choices_properties import AnnotationRankedChoicesProperties
+    from scaleapi.api_client.v2.models.annotation_ranked_groups import AnnotationRankedGroups
+    from scaleapi.api_client.v2.models.annotation_ranked_groups_properties import AnnotationRankedGroupsProperties
+    from scaleapi.api_client.v2.models.annotation_rubric_criteria import AnnotationRubricCriteria
+    from scaleapi.api_client.v2.models.annotation_rubric_criteria_properties import AnnotationRubricCriteriaProperties
+    from scaleapi.api_client.v2.models.annotation_rubric_rating import AnnotationRubricRating
+    from scaleapi.api_client.v2.models.annotation_rubric_rating_properties import AnnotationRubricRatingProperties
+    from scaleapi.api_client.v2.models.annotation_text import AnnotationText
+    from scaleapi.api_client.v2.models.annotation_text_properties import AnnotationTextProperties
+    from scaleapi.api_client.v2.models.annotation_type import AnnotationType
+    from scaleapi.api_client.v2.models.annotation_workspace_container import AnnotationWorkspaceContainer
+    from scaleapi.api_client.v2.models.annotation_workspace_container_properties import AnnotationWorkspaceContainerProperties
+    from scaleapi.api_client.v2.models.audio_file import AudioFile
+    from scaleapi.api_client.v2.models.base_annotation import BaseAnnotation
+    from scaleapi.api_client.v2.models.base_chunk import BaseChunk
+    from scaleapi.api_client.v2.models.basic_file import BasicFile
+    from scaleapi.api_client.v2.models.batch import Batch
+    from scaleapi.api_client.v2.models.batch_operation_request import BatchOperationRequest
+    from scaleapi.api_client.v2.models.batch_status import BatchStatus
+    from scaleapi.api_client.v2.models.cancel_batch200_response import CancelBatch200Response
+    from scaleapi.api_client.v2.models.chunk import Chunk
+    from scaleapi.api_client.v2.models.chunk_text import ChunkText
+    from scaleapi.api_client.v2.models.chunk_text_properties import ChunkTextProperties
+    from scaleapi.api_client.v2.models.content_and_url import ContentAndUrl
+    from scaleapi.api_client.v2.models.create_batch_request import CreateBatchRequest
+    from scaleapi.api_client.v2.models.create_chat_task_request import CreateChatTaskRequest
+    from scaleapi.api_client.v2.models.criterion_definition import CriterionDefinition
+    from scaleapi.api_client.v2.models.criterion_evaluation import CriterionEvaluation
+    from scaleapi.api_client.v2.models.dataset import Dataset
+    from scaleapi.api_client.v2.models.dataset_delivery import DatasetDelivery
+    from scaleapi.api_client.v2.models.dataset_delivery_dataset import DatasetDeliveryDataset
+    from scaleapi.api_client.v2.models.dataset_delivery_metadata import DatasetDeliveryMetadata
+    from scaleapi.api_client.v2.models.dataset_task import DatasetTask
+    from scaleapi.api_client.v2.models.delivery import Delivery
+    from scaleapi.api_client.v2.models.detailed_file import DetailedFile
+    from scaleapi.api_client.v2.models.error_detail import ErrorDetail
+    from scaleapi.api_client.v2.models.error_type import ErrorType
+    from scaleapi.api_client.v2.models.expandable import Expandable
+    from scaleapi.api_client.v2.models.expandable_annotation import ExpandableAnnotation
+    from scaleapi.api_client.v2.models.expandable_batch import ExpandableBatch
+    from scaleapi.api_client.v2.models.expandable_dataset import ExpandableDataset
+    from scaleapi.api_client.v2.models.expandable_dataset_delivery import ExpandableDatasetDelivery
+    from scaleapi.api_client.v2.models.expandable_delivery import ExpandableDelivery
+    from scaleapi.api_client.v2.models.expandable_enum_batch import ExpandableEnumBatch
+    from scaleapi.api_client.v2.models.expandable_enum_dataset_task import ExpandableEnumDatasetTask
+    from scaleapi.api_client.v2.models.expandable_enum_datasets_deliveries import ExpandableEnumDatasetsDeliveries
+    from scaleapi.api_client.v2.models.expandable_enum_deliveries import ExpandableEnumDeliveries
+    from scaleapi.api_client.v2.models.expandable_enum_delivery import ExpandableEnumDelivery
+    from scaleapi.api_client.v2.models.expandable_enum_task import ExpandableEnumTask
+    from scaleapi.api_client.v2.models.expandable_project import ExpandableProject
+    from scaleapi.api_client.v2.models.get_batch500_response import GetBatch500Response
+    from scaleapi.api_client.v2.models.get_batches_response import GetBatchesResponse
+    from scaleapi.api_client.v2.models.get_dataset_deliveries_response import GetDatasetDeliveriesResponse
+    from scaleapi.api_client.v2.models.get_dataset_delivery_response import GetDatasetDeliveryResponse
+    from scaleapi.api_client.v2.models.get_dataset_task_response_url404_response import GetDatasetTaskResponseUrl404Response
+    from scaleapi.api_client.v2.models.get_dataset_tasks_response import GetDatasetTasksResponse
+    from scaleapi.api_client.v2.models.get_datasets_response import GetDatasetsResponse
+    from scaleapi.api_client.v2.models.get_delivered_tasks_response import GetDeliveredTasksResponse
+    from scaleapi.api_client.v2.models.get_deliveries_response import GetDeliveriesResponse
+    from scaleapi.api_client.v2.models.get_delivery_tasks_response import GetDeliveryTasksResponse
+    from scaleapi.api_client.v2.models.get_delivery_tasks_response_docs_inner import GetDeliveryTasksResponseDocsInner
+    from scaleapi.api_client.v2.models.get_projects_response import GetProjectsResponse
+    from scaleapi.api_client.v2.models.get_schema400_response import GetSchema400Response
+    from scaleapi.api_client.v2.models.get_schema404_response import GetSchema404Response
+    from scaleapi.api_client.v2.models.get_schema_response import GetSchemaResponse
+    from scaleapi.api_client.v2.models.get_schema_response_schema import GetSchemaResponseSchema
+    from scaleapi.api_client.v2.models.get_tasks_response import GetTasksResponse
+    from scaleapi.api_client.v2.models.image_file import ImageFile
+    from scaleapi.api_client.v2.models.labeled_text_value import LabeledTextValue
+    from scaleapi.api_client.v2.models.message import Message
+    from scaleapi.api_client.v2.models.message_content import MessageContent
+    from scaleapi.api_client.v2.models.message_role import MessageRole
+    from scaleapi.api_client.v2.models.model_parameters import ModelParameters
+    from scaleapi.api_client.v2.models.option import Option
+    from scaleapi.api_client.v2.models.pause_batch200_response import PauseBatch200Response
+    from scaleapi.api_client.v2.models.project import Project
+    from scaleapi.api_client.v2.models.reasoning import Reasoning
+    from scaleapi.api_client.v2.models.reference_text import ReferenceText
+    from scaleapi.api_client.v2.models.resume_batch200_response import ResumeBatch200Response
+    from scaleapi.api_client.v2.models.rubric import Rubric
+    from scaleapi.api_client.v2.models.rubric_criteria_value import RubricCriteriaValue
+    from scaleapi.api_client.v2.models.rubric_evaluation import RubricEvaluation
+    from scaleapi.api_client.v2.models.rubric_rating_value import RubricRatingValue
+    from scaleapi.api_client.v2.models.sensitive_content_report import SensitiveContentReport
+    from scaleapi.api_client.v2.models.set_batch_metadata_request import SetBatchMetadataRequest
+    from scaleapi.api_client.v2.models.set_task_metadata_request import SetTaskMetadataRequest
+    from scaleapi.api_client.v2.models.submission import Submission
+    from scaleapi.api_client.v2.models.task import Task
+    from scaleapi.api_client.v2.models.task_status import TaskStatus
+    from scaleapi.api_client.v2.models.thread import Thread
+    from scaleapi.api_client.v2.models.turn import Turn
+    from scaleapi.api_client.v2.models.v1_task_task_id_get200_response import V1TaskTaskIdGet200Response
+    from scaleapi.api_client.v2.models.v1_task_task_id_get200_response_response import V1TaskTaskIdGet200ResponseResponse
+    from scaleapi.api_client.v2.models.workspace_container_config import WorkspaceContainerConfig
+    from scaleapi.api_client.v2.models.workspace_container_value import WorkspaceContainerValue
+    from scaleapi.api_client.v2.models.workspace_execution_data import WorkspaceExecutionData
+    from scaleapi.api_client.v2.models.workspace_execution_data_result import WorkspaceExecutionDataResult
+    from scaleapi.api_client.v2.models.workspace_execution_data_result_status import WorkspaceExecutionDataResultStatus
+    from scaleapi.api_client.v2.models.workspace_file import WorkspaceFile
+
+# names are imported from their module on first access
+_LAZY_IMPORTS = {
+    "Annotation": "scaleapi.api_client.v2.models.annotation",
+    "AnnotationBoolean": "scaleapi.api_client.v2.models.annotation_boolean",
+    "AnnotationBooleanProperties": "scaleapi.api_client.v2.models.annotation_boolean_properties",
+    "AnnotationCategory": "scaleapi.api_client.v2.models.annotation_category",
+    "AnnotationCategoryMultiple": "scaleapi.api_client.v2.models.annotation_category_multiple",
+    "AnnotationCategoryMultipleProperties": "scaleapi.api_client.v2.models.annotation_category_multiple_properties",
+    "AnnotationCategoryProperties": "scaleapi.api_client.v2.models.annotation_category_properties",
+    "AnnotationFile": "scaleapi.api_client.v2.models.annotation_file",
+    "AnnotationFileProperties": "scaleapi.api_client.v2.models.annotation_file_properties",
+    "AnnotationFilePropertiesValue": "scaleapi.api_client.v2.models.annotation_file_properties_value",
+    "AnnotationInteger": "scaleapi.api_client.v2.models.annotation_integer",
+    "AnnotationIntegerProperties": "scaleapi.api_client.v2.models.annotation_integer_properties",
+    "AnnotationLabeledText": "scaleapi.api_client.v2.models.annotation_labeled_text",
+    "AnnotationLabeledTextProperties": "scaleapi.api_client.v2.models.annotation_labeled_text_properties",
+    "AnnotationMetadata": "scaleapi.api_client.v2.models.annotation_metadata",
+    "AnnotationRankedChoices": "scaleapi.api_client.v2.models.annotation_ranked_choices",
+    "AnnotationRankedChoicesProperties": "scaleapi.api_client.v2.models.annotation_ranked_choices_properties",
+    "AnnotationRankedGroups": "scaleapi.api_client.v2.models.annotation_ranked_groups",
+    "AnnotationRankedGroupsProperties": "scaleapi.api_client.v2.models.annotation_ranked_groups_properties",
+    "AnnotationRubricCriteria": "scaleapi.api_client.v2.models.annotation_rubric_criteria",
+    "AnnotationRubricCriteriaProperties": "scaleapi.api_client.v2.models.annotation_rubric_criteria_properties",
+    "AnnotationRubricRating": "scaleapi.api_client.v2.models.annotation_rubric_rating",
+    "AnnotationRubricRatingProperties": "scaleapi.api_client.v2.models.annotation_rubric_rating_properties",
+    "AnnotationText": "scaleapi.api_client.v2.models.annotation_text",
+    "AnnotationTextProperties": "scaleapi.api_client.v2.models.annotation_text_properties",
+    "AnnotationType": "scaleapi.api_client.v2.models.annotation_type",
+    "AnnotationWorkspaceContainer": "scaleapi.api_client.v2.models.annotation_workspace_container",
+    "AnnotationWorkspaceContainerProperties": "scaleapi.api_client.v2.models.annotation_workspace_container_properties",
+    "AudioFile": "scaleapi.api_client.v2.models.audio_file",
+    "BaseAnnotation": "scaleapi.api_client.v2.models.base_annotation",
+    "BaseChunk": "scaleapi.api_client.v2.models.base_chunk",
+    "BasicFile": "scaleapi.api_client.v2.models.basic_file",
+    "Batch": "scaleapi.api_client.v2.models.batch",
+    "BatchOperationRequest": "scaleapi.api_client.v2.models.batch_operation_request",
+    "BatchStatus": "scaleapi.api_client.v2.models.batch_status",
+    "CancelBatch200Response": "scaleapi.api_client.v2.models.cancel_batch200_response",
+    "Chunk": "scaleapi.api_client.v2.models.chunk",
+    "ChunkText": "scaleapi.api_client.v2.models.chunk_text",
+    "ChunkTextProperties": "scaleapi.api_client.v2.models.chunk_text_properties",
+    "ContentAndUrl": "scaleapi.api_client.v2.models.content_and_url",
+    "CreateBatchRequest": "scaleapi.api_client.v2.models.create_batch_request",
+    "CreateChatTaskRequest": "scaleapi.api_client.v2.models.create_chat_task_request",
+    "CriterionDefinition": "scaleapi.api_client.v2.models.criterion_definition",
+    "CriterionEvaluation": "scaleapi.api_client.v2.models.criterion_evaluation",
+    "Dataset": "scaleapi.api_client.v2.models.dataset",
+    "DatasetDelivery": "scaleapi.api_client.v2.models.dataset_delivery",
+    "DatasetDeliveryDataset": "scaleapi.api_client.v2.models.dataset_delivery_dataset",
+    "DatasetDeliveryMetadata": "scaleapi.api_client.v2.models.dataset_delivery_metadata",
+    "DatasetTask": "scaleapi.api_client.v2.models.dataset_task",
+    "Delivery": "scaleapi.api_client.v2.models.delivery",
+    "DetailedFile": "scaleapi.api_client.v2.models.detailed_file",
+    "ErrorDetail": "scaleapi.api_client.v2.models.error_detail",
+    "ErrorType": "scaleapi.api_client.v2.models.error_type",
+    "Expandable": "scaleapi.api_client.v2.models.expandable",
+    "ExpandableAnnotation": "scaleapi.api_client.v2.models.expandable_annotation",
+    "ExpandableBatch": "scaleapi.api_client.v2.models.expandable_batch",
+    "ExpandableDataset": "scaleapi.api_client.v2.models.expandable_dataset",
+    "ExpandableDatasetDelivery": "scaleapi.api_client.v2.models.expandable_dataset_delivery",
+    "ExpandableDelivery": "scaleapi.api_client.v2.models.expandable_delivery",
+    "ExpandableEnumBatch": "scaleapi.api_client.v2.models.expandable_enum_batch",
+    "ExpandableEnumDatasetTask": "scaleapi.api_client.v2.models.expandable_enum_dataset_task",
+    "ExpandableEnumDatasetsDeliveries": "scaleapi.api_client.v2.models.expandable_enum_datasets_deliveries",
+    "ExpandableEnumDeliveries": "scaleapi.api_client.v2.models.expandable_enum_deliveries",
+    "ExpandableEnumDelivery": "scaleapi.api_client.v2.models.expandable_enum_delivery",
+    "ExpandableEnumTask": "scaleapi.api_client.v2.models.expandable_enum_task",
+    "ExpandableProject": "scaleapi.api_client.v2.models.expandable_project",
+    "GetBatch500Response": "scaleapi.api_client.v2.models.get_batch500_response",
+    "GetBatchesResponse": "scaleapi.api_client.v2.models.get_batches_response",
+    "GetDatasetDeliveriesResponse": "scaleapi.api_client.v2.models.get_dataset_deliveries_response",
+    "GetDatasetDeliveryResponse": "scaleapi.api_client.v2.models.get_dataset_delivery_response",
+    "GetDatasetTaskResponseUrl404Response": "scaleapi.api_client.v2.models.get_dataset_task_response_url404_response",
+    "GetDatasetTasksResponse": "scaleapi.api_client.v2.models.get_dataset_tasks_response",
+    "GetDatasetsResponse": "scaleapi.api_client.v2.models.get_datasets_response",
+    "GetDeliveredTasksResponse": "scaleapi.api_client.v2.models.get_delivered_tasks_response",
+    "GetDeliveriesResponse": "scaleapi.api_client.v2.models.get_deliveries_response",
+    "GetDeliveryTasksResponse": "scaleapi.api_client.v2.models.get_delivery_tasks_response",
+    "GetDeliveryTasksResponseDocsInner": "scaleapi.api_client.v2.models.get_delivery_tasks_response_docs_inner",
+    "GetProjectsResponse": "scaleapi.api_client.v2.models.get_projects_response",
+    "GetSchema400Response": "scaleapi.api_client.v2.models.get_schema400_response",
+    "GetSchema404Response": "scaleapi.api_client.v2.models.get_schema404_response",
+    "GetSchemaResponse": "scaleapi.api_client.v2.models.get_schema_response",
+    "GetSchemaResponseSchema": "scaleapi.api_client.v2.models.get_schema_response_schema",
+    "GetTasksResponse": "scaleapi.api_client.v2.models.get_tasks_response",
+    "ImageFile": "scaleapi.api_client.v2.models.image_file",
+    "LabeledTextValue": "scaleapi.api_client.v2.models.labeled_text_value",
+    "Message": "scaleapi.api_client.v2.models.message",
+    "MessageContent": "scaleapi.api_client.v2.models.message_content",
+    "MessageRole": "scaleapi.api_client.v2.models.message_role",
+    "ModelParameters": "scaleapi.api_client.v2.models.model_parameters",
+    "Option": "scaleapi.api_client.v2.models.option",
+    "PauseBatch200Response": "scaleapi.api_client.v2.models.pause_batch200_response",
+    "Project": "scaleapi.api_client.v2.models.project",
+    "Reasoning": "scaleapi.api_client.v2.models.reasoning",
+    "ReferenceText": "scaleapi.api_client.v2.models.reference_text",
+    "ResumeBatch200Response": "scaleapi.api_client.v2.models.resume_batch200_response",
+    "Rubric": "scaleapi.api_client.v2.models.rubric",
+    "RubricCriteriaValue": "scaleapi.api_client.v2.models.rubric_criteria_value",
+    "RubricEvaluation": "scaleapi.api_client.v2.models.rubric_evaluation",
+    "RubricRatingValue": "scaleapi.api_client.v2.models.rubric_rating_value",
+    "SensitiveContentReport": "scaleapi.api_client.v2.models.sensitive_content_report",
+    "SetBatchMetadataRequest": "scaleapi.api_client.v2.models.set_batch_metadata_request",
+    "SetTaskMetadataRequest": "scaleapi.api_client.v2.models.set_task_metadata_request",
+    "Submission": "scaleapi.api_client.v2.models.submission",
+    "Task": "scaleapi.api_client.v2.models.task",
+    "TaskStatus": "scaleapi.api_client.v2.models.task_status",
+    "Thread": "scaleapi.api_client.v2.models.thread",
+    "Turn": "scaleapi.api_client.v2.models.turn",
+    "V1TaskTaskIdGet200Response": "scaleapi.api_client.v2.models.v1_task_task_id_get200_response",
+    "V1TaskTaskIdGet200ResponseResponse": "scaleapi.api_client.v2.models.v1_task_task_id_get200_response_response",
+    "WorkspaceContainerConfig": "scaleapi.api_client.v2.models.workspace_container_config",
+    "WorkspaceContainerValue": "scaleapi.api_client.v2.models.workspace_container_value",
+    "WorkspaceExecutionData": "scaleapi.api_client.v2.models.workspace_execution_data",
+    "WorkspaceExecutionDataResult": "scaleapi.api_client.v2.models.workspace_execution_data_result",
+    "WorkspaceExecutionDataResultStatus": "scaleapi.api_client.v2.models.workspace_execution_data_result_status",
+    "WorkspaceFile": "scaleapi.api_client.v2.models.workspace_file",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
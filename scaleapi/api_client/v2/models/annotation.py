@@ -229,151 +229,57 @@ class Annotation(BaseModel):
 
     @classmethod
     def from_dict(cls, obj: Union[str, Dict[str, Any]]) -> Self:
-        return cls.from_json(json.dumps(obj))
+        """Returns the object represented by the dict, validated once
+        against the annotation class of its `type`"""
+        annotation_type = obj.get("type") if isinstance(obj, dict) else None
+        annotation_class = ANNOTATION_TYPE_CLASSES.get(annotation_type)
+        if annotation_class is None:
+            return cls._from_dict_one_of(obj)
+
+        try:
+            actual_instance = annotation_class.from_dict(obj)
+        except (ValidationError, ValueError) as e:
+            raise ValueError(
+                "Can't discriminate annotation_type. Details: " + str(e)
+            ) from e
+        # The class is one of the oneOf schemas by construction, so
+        # the validation of `actual_instance` on assignment is skipped
+        return cls.model_construct(actual_instance=actual_instance)
 
     @classmethod
     def from_json(cls, json_str: str) -> Self:
         """Returns the object represented by the json string"""
+        return cls.from_dict(json.loads(json_str))
+
+    @classmethod
+    def _from_dict_one_of(cls, obj: Any) -> Self:
+        """Deserializes an annotation without a known `type`, which
+        must match exactly one of the oneOf schemas"""
         instance = cls.model_construct()
         error_messages = []
-
-        data = json.loads(json_str) if isinstance(json_str, str) else json_str
-        annotation_type = data.get("type") if isinstance(data, dict) else None
-
-        # https://github.com/swagger-api/swagger-codegen/issues/10962
-        try:
-            if annotation_type == "boolean":
-                instance.actual_instance = AnnotationBoolean.from_json(json_str)
-                return instance
-            elif annotation_type == "integer":
-                instance.actual_instance = AnnotationInteger.from_json(json_str)
-                return instance
-            elif annotation_type == "text":
-                instance.actual_instance = AnnotationText.from_json(json_str)
-                return instance
-            elif annotation_type == "category":
-                instance.actual_instance = AnnotationCategory.from_json(json_str)
-                return instance
-            elif annotation_type == "category_multiple":
-                instance.actual_instance = AnnotationCategoryMultiple.from_json(
-                    json_str
-                )
-                return instance
-            elif annotation_type == "file":
-                instance.actual_instance = AnnotationFile.from_json(json_str)
-                return instance
-            elif annotation_type == "labeled_text":
-                instance.actual_instance = AnnotationLabeledText.from_json(json_str)
-                return instance
-            elif annotation_type == "ranked_choices":
-                instance.actual_instance = AnnotationRankedChoices.from_json(json_str)
-                return instance
-            elif annotation_type == "ranked_groups":
-                instance.actual_instance = AnnotationRankedGroups.from_json(json_str)
-                return instance
-            elif annotation_type == "rubric_criteria":
-                instance.actual_instance = AnnotationRubricCriteria.from_json(json_str)
-                return instance
-            elif annotation_type == "rubric_rating":
-                instance.actual_instance = AnnotationRubricRating.from_json(json_str)
-                return instance
-            elif annotation_type == "workspace_container":
-                instance.actual_instance = AnnotationWorkspaceContainer.from_json(
-                    json_str
-                )
-                return instance
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-            raise ValueError(
-                "Can't discriminate annotation_type. Details: "
-                + ", ".join(error_messages)
-            )
-
         match = 0
 
-        # deserialize data into AnnotationBoolean
-        try:
-            instance.actual_instance = AnnotationBoolean.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationInteger
-        try:
-            instance.actual_instance = AnnotationInteger.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationText
-        try:
-            instance.actual_instance = AnnotationText.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationCategory
-        try:
-            instance.actual_instance = AnnotationCategory.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationCategoryMultiple
-        try:
-            instance.actual_instance = AnnotationCategoryMultiple.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationFile
-        try:
-            instance.actual_instance = AnnotationFile.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationLabeledText
-        try:
-            instance.actual_instance = AnnotationLabeledText.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationRankedChoices
-        try:
-            instance.actual_instance = AnnotationRankedChoices.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationRankedGroups
-        try:
-            instance.actual_instance = AnnotationRankedGroups.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationRubricCriteria
-        try:
-            instance.actual_instance = AnnotationRubricCriteria.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationRubricRating
-        try:
-            instance.actual_instance = AnnotationRubricRating.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
-        # deserialize data into AnnotationWorkspaceContainer
-        try:
-            instance.actual_instance = AnnotationWorkspaceContainer.from_json(json_str)
-            match += 1
-        except (ValidationError, ValueError) as e:
-            error_messages.append(str(e))
+        for annotation_class in ANNOTATION_TYPE_CLASSES.values():
+            try:
+                instance.actual_instance = annotation_class.from_dict(obj)
+                match += 1
+            except (ValidationError, ValueError) as e:
+                error_messages.append(str(e))
 
         if match > 1:
             # more than 1 match
             raise ValueError(
-                "Multiple matches found when deserializing the JSON string into Annotation with oneOf schemas: AnnotationCategory, AnnotationCategoryMultiple, AnnotationInteger, AnnotationText. Details: "
+                "Multiple matches found when deserializing the JSON string into Annotation with oneOf schemas: "
+                + ", ".join(ANNOTATION_ONE_OF_SCHEMAS)
+                + ". Details: "
                 + ", ".join(error_messages)
             )
         elif match == 0:
             # no match
             raise ValueError(
-                "No match found when deserializing the JSON string into Annotation with oneOf schemas: AnnotationCategory, AnnotationCategoryMultiple, AnnotationInteger, AnnotationText. Details: "
+                "No match found when deserializing the JSON string into Annotation with oneOf schemas: "
+                + ", ".join(ANNOTATION_ONE_OF_SCHEMAS)
+                + ". Details: "
                 + ", ".join(error_messages)
             )
         else:
@@ -448,5 +354,24 @@ from scaleapi.api_client.v2.models.annotation_workspace_container import (
     AnnotationWorkspaceContainer,
 )
 
+from scaleapi.api_client.v2.models.annotation_type import AnnotationType
+
+# Annotation class of each `type`, to deserialize an annotation with a
+# single validation instead of trying every oneOf schema
+ANNOTATION_TYPE_CLASSES = {
+    AnnotationType.BOOLEAN.value: AnnotationBoolean,
+    AnnotationType.INTEGER.value: AnnotationInteger,
+    AnnotationType.TEXT.value: AnnotationText,
+    AnnotationType.CATEGORY.value: AnnotationCategory,
+    AnnotationType.CATEGORY_MULTIPLE.value: AnnotationCategoryMultiple,
+    AnnotationType.FILE.value: AnnotationFile,
+    AnnotationType.LABELED_TEXT.value: AnnotationLabeledText,
+    AnnotationType.RANKED_CHOICES.value: AnnotationRankedChoices,
+    AnnotationType.RANKED_GROUPS.value: AnnotationRankedGroups,
+    AnnotationType.RUBRIC_CRITERIA.value: AnnotationRubricCriteria,
+    AnnotationType.RUBRIC_RATING.value: AnnotationRubricRating,
+    AnnotationType.WORKSPACE_CONTAINER.value: AnnotationWorkspaceContainer,
+}
+
 # TODO: Rewrite to not use raise_errors
 Annotation.model_rebuild(raise_errors=False)
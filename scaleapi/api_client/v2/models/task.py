@@ -18,7 +18,7 @@ import re  # noqa: F401
 import json
 
 from datetime import datetime
-from pydantic import BaseModel, ConfigDict, Field, StrictStr
+from pydantic import BaseModel, ConfigDict, Field, SerializerFunctionWrapHandler, StrictStr, model_serializer
 from typing import Any, ClassVar, Dict, List, Optional
 from scaleapi.api_client.v2.models.error_detail import ErrorDetail
 from scaleapi.api_client.v2.models.expandable_batch import ExpandableBatch
@@ -51,6 +51,13 @@ class Task(BaseModel):
         protected_namespaces=(),
     )
 
+    @model_serializer(mode="wrap")
+    def _serialize(self, handler: SerializerFunctionWrapHandler) -> Any:
+        """Parses the threads of a `LazyTask` before serializing it,
+        including when it is nested in a response"""
+        if "threads" not in self.__dict__:
+            getattr(self, "threads")
+        return handler(self)
 
     def to_str(self) -> str:
         """Returns the string representation of the model using alias"""
@@ -19,6 +19,7 @@ import ssl
 
 import urllib3
 
+from scaleapi import json_codec
 from scaleapi.api_client.v2.exceptions import ApiException, ApiValueError
 
 SUPPORTED_SOCKS_PROXIES = {"socks5", "socks5h", "socks4", "socks4a"}
@@ -178,7 +179,7 @@ class RESTClientObject:
                 ):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = json_codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
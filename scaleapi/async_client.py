@@ -0,0 +1,497 @@
+# pylint: disable=duplicate-code,protected-access
+from typing import IO, AsyncGenerator, Dict, Iterable, List, Tuple, Union
+
+from scaleapi import (
+    BATCHES_ALLOWED_KWARGS,
+    TASKS_ALLOWED_KWARGS,
+    Batchlist,
+    ScaleClient,
+    Tasklist,
+)
+from scaleapi.batches import Batch, BatchStatus
+from scaleapi.checkpoint import CheckpointStore, PaginationCheckpoint
+from scaleapi.concurrency import async_bounded_map
+from scaleapi.evaluation_tasks import EvaluationTask
+from scaleapi.exceptions import ScaleException, ScaleInvalidRequest
+from scaleapi.files import File
+from scaleapi.projects import Project, TaskTemplate
+from scaleapi.tasks import CompactTask, Task, TaskReviewStatus, TaskStatus, TaskType
+from scaleapi.teams import Teammate
+from scaleapi.training_tasks import TrainingTask
+
+from .api import Api, AsyncApi
+from .instrumentation import RequestHooks
+from .rate_limit import RateLimiter
+
+
+class AsyncScaleClient:
+    """asyncio interface for Scale API, mirroring `ScaleClient`.
+
+    Every method is a coroutine (or an async generator for
+    `get_tasks` and `get_batches`) with the same arguments and return
+    types as its `ScaleClient` counterpart, so a single event loop can
+    drive many requests concurrently. The number of in-flight requests
+    is bounded by `max_connections`, and their rate by the optional
+    `rate_limiter`, which can be shared with a `ScaleClient`.
+
+    The returned objects keep a reference to this client, their helper
+    methods (i.e. `Task.refresh()`) are only available with
+    `ScaleClient`. The V2 API is only available with `ScaleClient`.
+
+    Requires the optional `httpx` dependency:
+    `pip install scaleapi[async]`
+
+    Use `await client.close()` or an `async with` statement to release
+    the connections when the client is no longer needed.
+    """
+
+    def __init__(
+        self,
+        api_key,
+        source=None,
+        api_instance_url=None,
+        verify=None,
+        proxies=None,
+        cert=None,
+        max_connections: int = 100,
+        rate_limiter: RateLimiter = None,
+        hooks: Iterable[RequestHooks] = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.api = AsyncApi(
+            api_key,
+            user_agent_extension=source,
+            api_instance_url=api_instance_url,
+            verify=verify,
+            proxies=proxies,
+            cert=cert,
+            max_connections=max_connections,
+            rate_limiter=rate_limiter,
+            hooks=hooks,
+        )
+
+    async def close(self):
+        """Closes the client and releases pooled HTTP connections."""
+        await self.api.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def get_task(self, task_id: str) -> Task:
+        """Fetches a task. See `ScaleClient.get_task()`"""
+        endpoint = f"task/{task_id}"
+        return Task(await self.api.get_request(endpoint), self)
+
+    async def cancel_task(self, task_id: str, clear_unique_id: bool = False) -> Task:
+        """Cancels a task. See `ScaleClient.cancel_task()`"""
+        if clear_unique_id:
+            endpoint = f"task/{task_id}/cancel?clear_unique_id=true"
+        else:
+            endpoint = f"task/{task_id}/cancel"
+        return Task(await self.api.post_request(endpoint), self)
+
+    async def audit_task(self, task_id: str, accepted: bool, comments: str = None):
+        """Accepts or rejects a completed task.
+        See `ScaleClient.audit_task()`
+        """
+        payload = {"accepted": accepted, "comments": comments}
+        endpoint = f"task/{task_id}/audit"
+        await self.api.post_request(endpoint, body=payload)
+
+    async def update_task_unique_id(self, task_id: str, unique_id: str) -> Task:
+        """Updates a task's unique_id.
+        See `ScaleClient.update_task_unique_id()`
+        """
+        payload = {"unique_id": unique_id}
+        endpoint = f"task/{task_id}/unique_id"
+        return Task(await self.api.post_request(endpoint, body=payload), self)
+
+    async def clear_task_unique_id(self, task_id: str) -> Task:
+        """Clears a task's unique_id.
+        See `ScaleClient.clear_task_unique_id()`
+        """
+        endpoint = f"task/{task_id}/unique_id"
+        return Task(await self.api.delete_request(endpoint), self)
+
+    async def set_task_metadata(self, task_id: str, metadata: Dict) -> Task:
+        """Sets a task's metadata.
+        See `ScaleClient.set_task_metadata()`
+        """
+        endpoint = f"task/{task_id}/setMetadata"
+        return Task(await self.api.post_request(endpoint, body=metadata), self)
+
+    async def set_task_tags(self, task_id: str, tags: List[str]) -> Task:
+        """Sets tags of a task. See `ScaleClient.set_task_tags()`"""
+        endpoint = f"task/{task_id}/tags"
+        return Task(await self.api.post_request(endpoint, body=tags), self)
+
+    async def add_task_tags(self, task_id: str, tags: List[str]) -> Task:
+        """Adds tags to a task. See `ScaleClient.add_task_tags()`"""
+        endpoint = f"task/{task_id}/tags"
+        return Task(await self.api.put_request(endpoint, body=tags), self)
+
+    async def delete_task_tags(self, task_id: str, tags: List[str]) -> Task:
+        """Deletes tags from a task.
+        See `ScaleClient.delete_task_tags()`
+        """
+        endpoint = f"task/{task_id}/tags"
+        return Task(await self.api.delete_request(endpoint, body=tags), self)
+
+    async def tasks(self, **kwargs) -> Tasklist:
+        """Returns a page of your tasks. See `ScaleClient.tasks()`"""
+        for key in kwargs:
+            if key not in TASKS_ALLOWED_KWARGS:
+                raise ScaleInvalidRequest(
+                    f"Illegal parameter {key} for AsyncScaleClient.tasks()"
+                )
+
+        return await self._tasks(kwargs)
+
+    async def _tasks(self, kwargs: Dict, compact: bool = False) -> Tasklist:
+        response = await self.api.get_request("tasks", params=kwargs)
+
+        task_class = CompactTask if compact else Task
+        docs = [task_class(json, self) for json in response["docs"]]
+        return Tasklist(
+            docs,
+            response["total"],
+            response["limit"],
+            response["offset"],
+            response["has_more"],
+            response.get("next_token"),
+        )
+
+    async def get_tasks(
+        self,
+        project_name: str = None,
+        batch_name: str = None,
+        task_type: TaskType = None,
+        status: TaskStatus = None,
+        review_status: Union[List[TaskReviewStatus], TaskReviewStatus] = None,
+        unique_id: Union[List[str], str] = None,
+        completed_after: str = None,
+        completed_before: str = None,
+        updated_after: str = None,
+        updated_before: str = None,
+        created_after: str = None,
+        created_before: str = None,
+        tags: Union[List[str], str] = None,
+        include_attachment_url: bool = True,
+        limited_response: bool = None,
+        limit: int = None,
+        compact: bool = False,
+        checkpoint: Union[CheckpointStore, str] = None,
+    ) -> AsyncGenerator[Union[Task, CompactTask], None]:
+        """Retrieve all tasks as an async generator, with the given
+        parameters. See `ScaleClient.get_tasks()`
+
+        `async for task in client.get_tasks(project_name="Project")`
+        """
+        tasks_args = ScaleClient._process_tasks_endpoint_args(
+            project_name,
+            batch_name,
+            task_type,
+            status,
+            review_status,
+            unique_id,
+            completed_after,
+            completed_before,
+            updated_after,
+            updated_before,
+            created_after,
+            created_before,
+            tags,
+            include_attachment_url,
+            limited_response,
+        )
+
+        if limit:
+            tasks_args["limit"] = limit
+
+        progress = (
+            PaginationCheckpoint(checkpoint, "tasks", tasks_args)
+            if checkpoint
+            else None
+        )
+        next_token = progress.resume() if progress else None
+        has_more = True
+
+        while has_more:
+            tasks_args["next_token"] = next_token
+
+            tasks = await self._tasks(tasks_args, compact)
+            for task in tasks.docs:
+                yield task
+            next_token = tasks.next_token
+            has_more = tasks.has_more
+            if progress:
+                progress.page_done(next_token if has_more else None, len(tasks.docs))
+
+    async def get_tasks_count(
+        self,
+        project_name: str = None,
+        batch_name: str = None,
+        task_type: TaskType = None,
+        status: TaskStatus = None,
+        review_status: Union[List[TaskReviewStatus], TaskReviewStatus] = None,
+        unique_id: Union[List[str], str] = None,
+        completed_after: str = None,
+        completed_before: str = None,
+        updated_after: str = None,
+        updated_before: str = None,
+        created_after: str = None,
+        created_before: str = None,
+        tags: Union[List[str], str] = None,
+        include_attachment_url: bool = True,
+    ) -> int:
+        """Returns number of tasks with given filters.
+        See `ScaleClient.get_tasks_count()`
+        """
+        tasks_args = ScaleClient._process_tasks_endpoint_args(
+            project_name,
+            batch_name,
+            task_type,
+            status,
+            review_status,
+            unique_id,
+            completed_after,
+            completed_before,
+            updated_after,
+            updated_before,
+            created_after,
+            created_before,
+            tags,
+            include_attachment_url,
+        )
+
+        tasks_args["limit"] = 1
+
+        tasks = await self.tasks(**tasks_args)
+        return tasks.total
+
+    async def create_task(self, task_type: TaskType, **kwargs) -> Task:
+        """Creates a task. See `ScaleClient.create_task()`"""
+        endpoint = f"task/{task_type.value}"
+        taskdata = await self.api.post_request(endpoint, body=kwargs)
+        return Task(taskdata, self)
+
+    async def create_tasks(
+        self,
+        task_type: TaskType,
+        payloads: Iterable[Dict],
+        concurrency: int = 10,
+        ordered: bool = True,
+    ) -> AsyncGenerator[Tuple[int, Union[Task, ScaleException]], None]:
+        """Creates many tasks concurrently, as an async generator.
+        See `ScaleClient.create_tasks()`
+
+        `async for index, result in client.create_tasks(...)`
+        """
+        async for index, result in async_bounded_map(
+            lambda payload: self.create_task(task_type, **payload),
+            payloads,
+            concurrency,
+            ordered,
+        ):
+            yield index, result
+
+    async def create_batch(
+        self,
+        project: str,
+        batch_name: str,
+        callback: str = "",
+        calibration_batch: bool = False,
+        self_label_batch: bool = False,
+        metadata: Dict = None,
+    ) -> Batch:
+        """Creates a new Batch within a project.
+        See `ScaleClient.create_batch()`
+        """
+        endpoint = "batches"
+        payload = {
+            "project": project,
+            "name": batch_name,
+            "calibration_batch": calibration_batch,
+            "self_label_batch": self_label_batch,
+            "callback": callback,
+            "metadata": metadata or {},
+        }
+        batchdata = await self.api.post_request(endpoint, body=payload)
+        return Batch(batchdata, self)
+
+    async def finalize_batch(self, batch_name: str) -> Batch:
+        """Finalizes a batch. See `ScaleClient.finalize_batch()`"""
+        endpoint = f"batches/{Api.quote_string(batch_name)}/finalize"
+        batchdata = await self.api.post_request(endpoint)
+        return Batch(batchdata, self)
+
+    async def batch_status(self, batch_name: str) -> Dict:
+        """Returns the status of a batch.
+        See `ScaleClient.batch_status()`
+        """
+        endpoint = f"batches/{Api.quote_string(batch_name)}/status"
+        return await self.api.get_request(endpoint)
+
+    async def get_batch(self, batch_name: str) -> Batch:
+        """Returns a batch. See `ScaleClient.get_batch()`"""
+        endpoint = f"batches/{Api.quote_string(batch_name)}"
+        batchdata = await self.api.get_request(endpoint)
+        return Batch(batchdata, self)
+
+    async def batches(self, **kwargs) -> Batchlist:
+        """Returns a page of batches. See `ScaleClient.batches()`"""
+        for key in kwargs:
+            if key not in BATCHES_ALLOWED_KWARGS:
+                raise ScaleInvalidRequest(
+                    f"Illegal parameter {key} for AsyncScaleClient.batches()"
+                )
+        endpoint = "batches"
+        response = await self.api.get_request(endpoint, params=kwargs)
+        docs = [Batch(doc, self) for doc in response["docs"]]
+
+        return Batchlist(
+            docs,
+            response["totalDocs"],
+            response["limit"],
+            response["offset"],
+            response["has_more"],
+        )
+
+    async def get_batches(
+        self,
+        project_name: str = None,
+        batch_status: BatchStatus = None,
+        created_after: str = None,
+        created_before: str = None,
+        exclude_archived: bool = False,
+    ) -> AsyncGenerator[Batch, None]:
+        """Retrieve all batches as an async generator, with the given
+        parameters. See `ScaleClient.get_batches()`
+
+        `async for batch in client.get_batches(project_name="Project")`
+        """
+        has_more = True
+        offset = 0
+
+        while has_more:
+            batches_args = {
+                "start_time": created_after,
+                "end_time": created_before,
+                "project": project_name,
+                "offset": offset,
+                "exclude_archived": exclude_archived,
+            }
+
+            if batch_status:
+                batches_args["status"] = batch_status.value
+
+            batches = await self.batches(**batches_args)
+            for batch in batches.docs:
+                yield batch
+            offset += batches.limit
+            has_more = batches.has_more
+
+    async def set_batch_metadata(self, batch_name: str, metadata: Dict) -> Batch:
+        """Sets metadata for a batch.
+        See `ScaleClient.set_batch_metadata()`
+        """
+        endpoint = f"batches/{Api.quote_string(batch_name)}/setMetadata"
+        batchdata = await self.api.post_request(endpoint, body=metadata)
+        return Batch(batchdata, self)
+
+    async def create_project(
+        self,
+        project_name: str,
+        task_type: TaskType,
+        params: Dict = None,
+        rapid: bool = False,
+        studio: bool = False,
+        dataset_id: str = None,
+    ) -> Project:
+        """Creates a new project. See `ScaleClient.create_project()`"""
+        endpoint = "projects"
+        payload = {
+            "type": task_type.value,
+            "name": project_name,
+            "params": params,
+            "rapid": rapid,
+            "studio": studio,
+            "datasetId": dataset_id,
+        }
+        projectdata = await self.api.post_request(endpoint, body=payload)
+        return Project(projectdata, self)
+
+    async def get_project(self, project_name: str) -> Project:
+        """Retrieves a project. See `ScaleClient.get_project()`"""
+        endpoint = f"projects/{Api.quote_string(project_name)}"
+        projectdata = await self.api.get_request(endpoint)
+        return Project(projectdata, self)
+
+    async def get_projects(self) -> List[Project]:
+        """Returns all projects. Same as `projects()` method."""
+        return await self.projects()
+
+    async def projects(self) -> List[Project]:
+        """Returns all projects. See `ScaleClient.projects()`"""
+        endpoint = "projects"
+        project_list = await self.api.get_request(endpoint)
+        return [Project(project, self) for project in project_list]
+
+    async def update_project(self, project_name: str, **kwargs) -> Project:
+        """Sets parameters on a project.
+        See `ScaleClient.update_project()`
+        """
+        endpoint = f"projects/{Api.quote_string(project_name)}/setParams"
+        projectdata = await self.api.post_request(endpoint, body=kwargs)
+        return Project(projectdata, self)
+
+    async def get_project_template(self, project_name: str) -> TaskTemplate:
+        """Gets the task template of a project.
+        See `ScaleClient.get_project_template()`
+        """
+        endpoint = f"projects/{Api.quote_string(project_name)}/taskTemplates"
+        template = await self.api.get_request(endpoint)
+        return TaskTemplate(template, self)
+
+    async def upload_file(self, file: IO, **kwargs) -> File:
+        """Uploads a file. See `ScaleClient.upload_file()`"""
+        endpoint = "files/upload"
+        files = {"file": file}
+        filedata = await self.api.post_request(endpoint, files=files, data=kwargs)
+        return File(filedata, self)
+
+    async def import_file(self, file_url: str, **kwargs) -> File:
+        """Imports a file from a remote url.
+        See `ScaleClient.import_file()`
+        """
+        endpoint = "files/import"
+        payload = {"file_url": file_url, **kwargs}
+        filedata = await self.api.post_request(endpoint, body=payload)
+        return File(filedata, self)
+
+    async def create_evaluation_task(
+        self, task_type: TaskType, **kwargs
+    ) -> EvaluationTask:
+        """Creates an evaluation task for Rapid projects.
+        See `ScaleClient.create_evaluation_task()`
+        """
+        endpoint = f"evaluation_tasks/{task_type.value}"
+        evaluation_task_data = await self.api.post_request(endpoint, body=kwargs)
+        return EvaluationTask(evaluation_task_data, self)
+
+    async def create_training_task(self, task_type: TaskType, **kwargs) -> TrainingTask:
+        """Creates a training task for Rapid projects.
+        See `ScaleClient.create_training_task()`
+        """
+        endpoint = f"training_tasks/{task_type.value}"
+        training_task_data = await self.api.post_request(endpoint, body=kwargs)
+        return TrainingTask(training_task_data, self)
+
+    async def list_teammates(self) -> List[Teammate]:
+        """Returns all teammates. See `ScaleClient.list_teammates()`"""
+        endpoint = "teams"
+        teammate_list = await self.api.get_request(endpoint)
+        return [Teammate(teammate, self) for teammate in teammate_list]
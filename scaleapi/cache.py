@@ -0,0 +1,94 @@
+import collections
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable
+
+
+class ResourceCache:
+    """Read-through cache of mostly immutable resources, shared by all
+    threads of a client: projects, project templates and batches.
+
+    Entries expire `ttl` seconds after they were loaded, and the least
+    recently used entries are evicted beyond `maxsize` entries. The
+    client invalidates the entries of a project or batch it updates,
+    i.e. with `update_project()`, `set_batch_metadata()` or
+    `finalize_batch()`. Changes made elsewhere, like a batch status
+    progressing, are only seen once the entry expires.
+
+    `client = ScaleClient(api_key, cache=ResourceCache(ttl=600))`
+
+    Args:
+        ttl (float):
+            Seconds an entry is served from the cache
+        maxsize (int):
+            Maximum number of entries
+    """
+
+    def __init__(self, ttl: float = 300.0, maxsize: int = 1024):
+        if ttl <= 0 or maxsize <= 0:
+            raise ValueError("ttl and maxsize must be positive")
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        # key: (expires_at, value), least recently used first
+        self._entries = collections.OrderedDict()
+        # Incremented by invalidations, so that values loaded before an
+        # invalidation are not stored after it
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of hits, misses, evictions and entries"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Returns the cached value of `key`, or loads and caches it.
+
+        Args:
+            key (Hashable):
+                Cache key, i.e. `("project", project_name)`
+            loader (Callable[[], Any]):
+                Loads the value on a miss, errors are not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            generation = self._generation
+
+        # Loaded without holding the lock, concurrent misses of the
+        # same key may load it more than once
+        value = loader()
+
+        with self._lock:
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        return value
+
+    def invalidate(self, *keys: Hashable):
+        """Removes the given keys from the cache"""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Removes all entries from the cache"""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
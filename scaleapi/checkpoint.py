@@ -0,0 +1,128 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Union
+
+
+class CheckpointStore(ABC):
+    """Persists the pagination state of an export, so that a new
+    process can resume it where the previous one stopped. Subclass it
+    to keep checkpoints in a database or object storage, the state is
+    a small JSON serializable dictionary.
+    """
+
+    @abstractmethod
+    def load(self) -> Optional[Dict]:
+        """Returns the saved state, or None if there is none"""
+
+    @abstractmethod
+    def save(self, state: Dict):
+        """Saves the state, replacing any previous one"""
+
+    @abstractmethod
+    def clear(self):
+        """Removes the saved state"""
+
+
+class FileCheckpoint(CheckpointStore):
+    """Checkpoint saved to a JSON file. The file is replaced
+    atomically, so that it is never left half written.
+
+    Args:
+        path (str):
+            Path of the state file
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self) -> Optional[Dict]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return None
+
+    def save(self, state: Dict):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(state, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self.path)
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    return value
+
+
+class PaginationCheckpoint:
+    """Tracks the progress of a paginated endpoint in a
+    `CheckpointStore`, saving the `next_token` once all items of a
+    page were consumed, and clearing it after the last page.
+
+    Args:
+        store (CheckpointStore | str):
+            Store of the state, or path of a `FileCheckpoint`
+        endpoint (str):
+            Name of the paginated endpoint
+        args (Dict):
+            Filter arguments of the export, a checkpoint only resumes
+            an export with the same arguments
+    """
+
+    def __init__(self, store: Union[CheckpointStore, str], endpoint: str, args: Dict):
+        self.store = FileCheckpoint(store) if isinstance(store, str) else store
+        self.endpoint = endpoint
+        self.args = _jsonable({k: v for k, v in args.items() if k != "next_token"})
+        self.count = 0
+
+    def resume(self) -> Optional[str]:
+        """Returns the `next_token` to resume from, or None to start
+        from the first page.
+
+        Raises:
+            ValueError: The checkpoint belongs to a different export
+        """
+        state = self.store.load()
+        if not state:
+            return None
+        if state.get("endpoint") != self.endpoint or state.get("args") != self.args:
+            raise ValueError(
+                f"Checkpoint of {state.get('endpoint')} with arguments "
+                f"{state.get('args')} does not match this export, "
+                "clear it to start a new one"
+            )
+        self.count = state.get("count", 0)
+        return state["next_token"]
+
+    def page_done(self, next_token: Optional[str], items: int):
+        """Records a consumed page of `items`, then `next_token`"""
+        self.count += items
+        if not next_token:
+            self.store.clear()
+        else:
+            self.store.save(
+                {
+                    "endpoint": self.endpoint,
+                    "args": self.args,
+                    "next_token": next_token,
+                    "count": self.count,
+                }
+            )
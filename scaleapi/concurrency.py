@@ -0,0 +1,296 @@
+import collections
+import itertools
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# How often a blocked prefetch thread checks if the consumer has stopped
+_PREFETCH_POLL_INTERVAL = 0.1
+
+
+def _call(func: Callable[[T], R], item: T) -> Union[R, Exception]:
+    try:
+        return func(item)
+    except Exception as err:  # pylint: disable=broad-except
+        return err
+
+
+async def _async_call(
+    func: Callable[[T], Awaitable[R]], item: T
+) -> Union[R, Exception]:
+    try:
+        return await func(item)
+    except Exception as err:  # pylint: disable=broad-except
+        return err
+
+
+def bounded_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    concurrency: int,
+    ordered: bool = True,
+) -> Generator[Tuple[int, Union[R, Exception]], None, None]:
+    """Applies `func` to every item through a pool of worker threads,
+    yielding `(index, result)` tuples as results become available.
+
+    Items are consumed lazily and at most `concurrency` calls are in
+    flight, so arbitrarily large iterables run in bounded memory.
+    Exceptions raised by `func` are yielded as the item's result
+    instead of stopping the iteration.
+
+    Args:
+        func (Callable):
+            Function to call with each item
+        items (Iterable):
+            Items to process, can be a generator
+        concurrency (int):
+            Number of worker threads
+        ordered (bool):
+            If True, yields results in input order, otherwise in
+            completion order
+
+    Yields:
+        Tuple[int, Any]:
+            Index of the item in the input and its result or exception
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    iterator = enumerate(items)
+    pending = collections.OrderedDict()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+
+    def fill():
+        for index, item in itertools.islice(iterator, concurrency - len(pending)):
+            pending[executor.submit(_call, func, item)] = index
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                done = [next(iter(pending.keys()), None)]
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                index = pending.pop(future)
+                yield index, future.result()
+                fill()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+async def async_bounded_map(
+    func: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    concurrency: int,
+    ordered: bool = True,
+) -> AsyncGenerator[Tuple[int, Union[R, Exception]], None]:
+    """asyncio counterpart of `bounded_map`, running the coroutine
+    function `func` for every item with at most `concurrency`
+    coroutines in flight.
+
+    Yields:
+        Tuple[int, Any]:
+            Index of the item in the input and its result or exception
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    iterator = enumerate(items)
+    pending = collections.OrderedDict()
+
+    def fill():
+        for index, item in itertools.islice(iterator, concurrency - len(pending)):
+            pending[asyncio.ensure_future(_async_call(func, item))] = index
+
+    try:
+        fill()
+        while pending:
+            if ordered:
+                done = [next(iter(pending.keys()), None)]
+                await asyncio.wait(done)
+            else:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+
+            for future in done:
+                index = pending.pop(future)
+                yield index, future.result()
+                fill()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class _Buffer:
+    """Bounded queue between producer threads and a consumer, which
+    producers stop writing to once the consumer is gone."""
+
+    END = object()
+
+    def __init__(self, size: int):
+        self.queue = queue.Queue(maxsize=size)
+        self.stopped = threading.Event()
+
+    def put(self, item, error=None) -> bool:
+        """Buffers an item, returns False if the consumer stopped"""
+        while not self.stopped.is_set():
+            try:
+                self.queue.put((item, error), timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce(self, items: Iterable):
+        """Buffers all items, followed by an END marker"""
+        try:
+            for item in items:
+                if not self.put(item):
+                    return
+            self.put(self.END)
+        except Exception as err:  # pylint: disable=broad-except
+            self.put(self.END, err)
+
+    def get(self):
+        """Returns the next item, raising producer exceptions"""
+        item, error = self.queue.get()
+        if error is not None:
+            raise error
+        return item
+
+
+def prefetched(items: Iterable[T], depth: int) -> Generator[T, None, None]:
+    """Iterates `items` in a background thread, keeping up to `depth`
+    items buffered ahead of the consumer, so that producing the next
+    item (i.e. fetching the next page) overlaps with consuming the
+    current one. Memory is bounded by the buffer size.
+
+    Exceptions raised while producing are re-raised to the consumer.
+    Closing the generator stops the background thread.
+
+    Args:
+        items (Iterable):
+            Items to iterate, typically a generator of pages
+        depth (int):
+            Maximum number of items to buffer ahead
+
+    Yields:
+        Items of the given iterable, in order
+    """
+    if depth < 1:
+        raise ValueError("depth must be at least 1")
+
+    buffer = _Buffer(depth)
+    thread = threading.Thread(
+        target=buffer.produce, args=(items,), name="scaleapi-prefetch", daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _Buffer.END:
+                return
+            yield item
+    finally:
+        buffer.stopped.set()
+
+
+async def async_iterated(items: Iterable[T]) -> AsyncGenerator[T, None]:
+    """asyncio counterpart of iterating `items`, a blocking iterable
+    (i.e. a generator of pages), in a worker thread, so that the event
+    loop keeps running while the next item is produced.
+
+    Closing the async generator closes the iterable, once a pending
+    `next()` call has returned.
+
+    Yields:
+        Items of the given iterable, in order
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    iterator = iter(items)
+    end = object()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scaleapi-iter")
+    future = None
+    try:
+        while True:
+            future = executor.submit(next, iterator, end)
+            item = await asyncio.wrap_future(future)
+            if item is end:
+                return
+            yield item
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            if future is not None and not future.done():
+                future.add_done_callback(lambda _: close())
+            else:
+                close()
+        executor.shutdown(wait=False)
+
+
+def interleaved(
+    iterables: Iterable[Iterable[T]],
+    concurrency: int,
+    depth: int = None,
+) -> Generator[T, None, None]:
+    """Iterates several iterables at the same time, each one in a
+    worker thread, and yields their items as soon as they are
+    produced. Up to `concurrency` iterables are consumed at once and
+    up to `depth` items are buffered, so memory stays bounded.
+
+    Items of the same iterable keep their order, items of different
+    iterables are interleaved. An exception raised by any iterable
+    stops the iteration and is re-raised to the consumer.
+
+    Args:
+        iterables (Iterable[Iterable]):
+            Iterables to consume, typically page generators
+        concurrency (int):
+            Number of iterables to consume in parallel
+        depth (int, optional):
+            Maximum number of buffered items,
+            defaults to twice the concurrency
+
+    Yields:
+        Items of all iterables
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    buffer = _Buffer(depth or 2 * concurrency)
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    futures = [executor.submit(buffer.produce, items) for items in iterables]
+    remaining = len(futures)
+    try:
+        while remaining:
+            item = buffer.get()
+            if item is _Buffer.END:
+                remaining -= 1
+            else:
+                yield item
+    finally:
+        buffer.stopped.set()
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
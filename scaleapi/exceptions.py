@@ -42,6 +42,14 @@ class ScaleNotEnabled(ScaleException):
     code = 402
 
 
+class ScaleForbidden(ScaleException):
+    """403 - Forbidden -- The API key is not allowed to access the
+    requested resource.
+    """
+
+    code = 403
+
+
 class ScaleResourceNotFound(ScaleException):
     """404 - Not Found -- The requested resource doesn't exist."""
 
@@ -88,6 +96,7 @@ ExceptionMap: Dict[int, ScaleException] = {
     ScaleInvalidRequest.code: ScaleInvalidRequest,
     ScaleUnauthorized.code: ScaleUnauthorized,
     ScaleNotEnabled.code: ScaleNotEnabled,
+    ScaleForbidden.code: ScaleForbidden,
     ScaleResourceNotFound.code: ScaleResourceNotFound,
     ScaleDuplicateResource.code: ScaleDuplicateResource,
     ScaleTooManyRequests.code: ScaleTooManyRequests,
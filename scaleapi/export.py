@@ -0,0 +1,179 @@
+"""Columnar export of tasks to Apache Arrow record batches, and
+incrementally to Parquet or Feather files. Requires `pyarrow`:
+
+    $ pip install scaleapi[arrow]
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Union
+
+from dateutil import parser as date_parser
+
+from scaleapi import json_codec
+from scaleapi.exceptions import ScaleException
+from scaleapi.tasks import CompactTask, Task
+
+STRING_FIELDS = (
+    "task_id",
+    "type",
+    "status",
+    "project",
+    "batch",
+    "unique_id",
+    "callback_url",
+)
+TIMESTAMP_FIELDS = ("created_at", "updated_at", "completed_at")
+# Free form fields, stored as JSON encoded strings
+JSON_FIELDS = ("metadata", "params", "response")
+
+EXPORT_FORMATS = ("parquet", "feather")
+DEFAULT_BATCH_SIZE = 10000
+
+
+def _pyarrow():
+    try:
+        # pylint: disable=import-outside-toplevel
+        import pyarrow
+    except ImportError as err:
+        raise ScaleException(
+            "Exporting tasks requires pyarrow, "
+            "install it with `pip install scaleapi[arrow]`"
+        ) from err
+    return pyarrow
+
+
+def task_schema():
+    """Returns the Arrow schema of exported tasks. Timestamps are in
+    milliseconds, UTC, and `metadata`, `params` and `response` are
+    JSON encoded strings.
+
+    Returns:
+        pyarrow.Schema
+    """
+    pa = _pyarrow()
+    return pa.schema(
+        [pa.field("task_id", pa.string(), nullable=False)]
+        + [pa.field(name, pa.string()) for name in STRING_FIELDS[1:]]
+        + [pa.field(name, pa.timestamp("ms", tz="UTC")) for name in TIMESTAMP_FIELDS]
+        + [pa.field("tags", pa.list_(pa.string()))]
+        + [pa.field(name, pa.string()) for name in JSON_FIELDS]
+    )
+
+
+def _timestamps(pa, values: List[Any]):
+    array_type = pa.timestamp("ms", tz="UTC")
+    try:
+        return pa.array(values, pa.string()).cast(array_type)
+    except pa.ArrowInvalid:
+        # Not ISO 8601 with a zone offset, parse values one by one
+        return pa.array(
+            [date_parser.parse(value) if value else None for value in values],
+            array_type,
+        )
+
+
+def _record_batch(pa, schema, rows: List[Dict]):
+    columns = [
+        pa.array([row.get(name) for row in rows], pa.string()) for name in STRING_FIELDS
+    ]
+    columns += [
+        _timestamps(pa, [row.get(name) for row in rows]) for name in TIMESTAMP_FIELDS
+    ]
+    columns.append(pa.array([row.get("tags") for row in rows], pa.list_(pa.string())))
+    columns += [
+        pa.array(
+            [
+                None if row.get(name) is None else json_codec.dumps(row[name])
+                for row in rows
+            ],
+            pa.string(),
+        )
+        for name in JSON_FIELDS
+    ]
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def task_record_batches(
+    tasks: Iterable[Union[Task, CompactTask, Dict]],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[Any]:
+    """Converts tasks to Arrow record batches of up to `batch_size`
+    rows, consuming `tasks` lazily so that memory usage is bounded by
+    one batch, i.e. `task_record_batches(client.get_tasks(...))`.
+
+    Args:
+        tasks (Iterable[Task | CompactTask | Dict]):
+            Tasks, or task payloads, to convert
+
+        batch_size (int):
+            Maximum number of rows per record batch
+
+    Yields:
+        pyarrow.RecordBatch with the `task_schema()` schema
+    """
+    pa = _pyarrow()
+    schema = task_schema()
+    rows = []
+    for task in tasks:
+        rows.append(task if isinstance(task, dict) else task.as_dict())
+        if len(rows) == batch_size:
+            yield _record_batch(pa, schema, rows)
+            rows = []
+    if rows:
+        yield _record_batch(pa, schema, rows)
+
+
+def write_tasks(
+    tasks: Iterable[Union[Task, CompactTask, Dict]],
+    path: str,
+    export_format: str = "parquet",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    compression: str = None,
+) -> int:
+    """Writes tasks to a Parquet or Feather file, one record batch
+    (Parquet row group) at a time, so that exports of millions of
+    tasks run in bounded memory.
+
+    `write_tasks(client.get_tasks(project_name="p"), "tasks.parquet")`
+
+    Args:
+        tasks (Iterable[Task | CompactTask | Dict]):
+            Tasks, or task payloads, to write
+
+        path (str):
+            Destination file
+
+        export_format (str):
+            `parquet` or `feather`. Defaults to `parquet`.
+
+        batch_size (int):
+            Number of rows per record batch
+
+        compression (str, optional):
+            Compression codec, defaults to `snappy` for Parquet and
+            `lz4` for Feather
+
+    Returns:
+        Number of tasks written
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"export_format must be one of {EXPORT_FORMATS}")
+
+    pa = _pyarrow()
+    schema = task_schema()
+    if export_format == "parquet":
+        # pylint: disable=import-outside-toplevel
+        from pyarrow import parquet
+
+        writer = parquet.ParquetWriter(
+            path, schema, compression=compression or "snappy"
+        )
+    else:
+        options = pa.ipc.IpcWriteOptions(compression=compression or "lz4")
+        writer = pa.ipc.new_file(path, schema, options=options)
+
+    count = 0
+    with writer:
+        for batch in task_record_batches(tasks, batch_size):
+            writer.write_batch(batch)
+            count += batch.num_rows
+    return count
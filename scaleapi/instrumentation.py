@@ -0,0 +1,479 @@
+import math
+import re
+import threading
+import time
+import urllib.parse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from ._version import __package_name__, __version__
+from .exceptions import ScaleException
+from .tasks import TaskType
+
+_TASK_TYPES = "|".join(re.escape(task_type.value) for task_type in TaskType)
+
+# Maps request paths of each API version, relative to its prefix, to
+# endpoint templates so that metrics are not split by resource ids.
+# The first matching pattern wins, unmatched paths are kept as is.
+ENDPOINT_TEMPLATES: Dict[str, List[Tuple[str, str]]] = {
+    "v1": [
+        (
+            r"task/[^/]+/(cancel|audit|unique_id|setMetadata|tags)",
+            r"task/{task_id}/\1",
+        ),
+        (
+            rf"(task|evaluation_tasks|training_tasks)/(?:{_TASK_TYPES})",
+            r"\1/{task_type}",
+        ),
+        (r"task/[^/]+", "task/{task_id}"),
+        (r"batches/[^/]+/(finalize|status|setMetadata)", r"batches/{batch_name}/\1"),
+        (r"batches/[^/]+", "batches/{batch_name}"),
+        (r"projects/[^/]+/(setParams|taskTemplates)", r"projects/{project_name}/\1"),
+        (r"projects/[^/]+", "projects/{project_name}"),
+        (
+            r"studio/projects/[^/]+/groups/[^/]+",
+            "studio/projects/{project}/groups/{project_group}",
+        ),
+        (r"studio/projects/[^/]+/groups", "studio/projects/{project}/groups"),
+        (r"studio/batches/(?!(?:set|reset)_priorities$)[^/]+", "studio/batches/{name}"),
+    ],
+    "v2": [
+        (
+            r"datasets/task/[^/]+/response_url/[^/]+",
+            "datasets/task/{taskId}/response_url/{attachmentId}",
+        ),
+    ],
+}
+
+_ENDPOINT_PATTERNS = {
+    version: [(re.compile(pattern), template) for pattern, template in templates]
+    for version, templates in ENDPOINT_TEMPLATES.items()
+}
+_VERSION_PREFIX = re.compile(r"(.*/(v[0-9]+)/)(.*)")
+
+
+def endpoint_template(url: str) -> str:
+    """Returns the endpoint template of a request URL, with resource
+    identifiers replaced by placeholders.
+
+    `endpoint_template('https://api.scale.com/v1/task/abc/cancel')`
+    -> `/v1/task/{task_id}/cancel`
+
+    Args:
+        url (str):
+            Request URL or path, query parameters are ignored
+
+    Returns:
+        str: Endpoint template
+    """
+    path = urllib.parse.urlsplit(url).path
+    match = _VERSION_PREFIX.fullmatch(path)
+    if not match:
+        return path
+
+    prefix, version, endpoint = match.groups()
+    for pattern, template in _ENDPOINT_PATTERNS.get(version, []):
+        endpoint_match = pattern.fullmatch(endpoint)
+        if endpoint_match:
+            return prefix + endpoint_match.expand(template)
+    return path
+
+
+class RequestInfo:
+    """Details of a request to Scale API, passed to `RequestHooks`.
+
+    Response fields are only set in `on_request_end`, `duration` is
+    the total time in seconds including retries, and `attempt` the
+    number of the attempt (1 for the first one).
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "endpoint",
+        "attempt",
+        "request_bytes",
+        "response_bytes",
+        "status_code",
+        "duration",
+        "error",
+        "started_at",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        attempt: int = 1,
+        request_bytes: int = None,
+        status_code: int = None,
+        error: Exception = None,
+    ):
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = endpoint_template(url)
+        self.attempt = attempt
+        self.request_bytes = request_bytes
+        self.response_bytes = None
+        self.status_code = status_code
+        self.duration = None
+        self.error = error
+        self.started_at = time.perf_counter()
+
+    def __repr__(self):
+        return (
+            f"RequestInfo({self.method} {self.endpoint}, attempt={self.attempt}, "
+            f"status_code={self.status_code}, duration={self.duration})"
+        )
+
+
+class RequestHooks:
+    """Base class for request instrumentation, every callback is a
+    no-op by default. Override the ones you need and pass instances
+    to `ScaleClient(hooks=[...])`.
+
+    Callbacks run synchronously in the thread (or event loop) making
+    the request, so they should be fast and thread-safe. Exceptions
+    raised by callbacks propagate to the caller.
+    """
+
+    def on_request_start(self, request: RequestInfo):
+        """Called before a request is sent"""
+
+    def on_request_end(self, request: RequestInfo):
+        """Called once a request completed, after all its retries,
+        with either a `status_code` or an `error`"""
+
+    def on_retry(self, request: RequestInfo):
+        """Called for every attempt that failed and is retried, with
+        its `status_code` or `error` and `attempt` number"""
+
+
+class Instrumentation:
+    """Dispatches request events to a list of hooks, shared by the
+    HTTP layers of a client. Does nothing if no hooks are set."""
+
+    def __init__(self, hooks: Iterable[RequestHooks] = None):
+        self.hooks = list(hooks or [])
+
+    def __bool__(self):
+        return bool(self.hooks)
+
+    def request_start(
+        self, method: str, url: str, request_bytes: int = None
+    ) -> Optional[RequestInfo]:
+        """Notifies hooks of a new request, returns its info to be
+        passed to `request_end`, or None without hooks"""
+        if not self.hooks:
+            return None
+        request = RequestInfo(method, url, request_bytes=request_bytes)
+        for hook in self.hooks:
+            hook.on_request_start(request)
+        return request
+
+    def request_end(
+        self,
+        request: Optional[RequestInfo],
+        status_code: int = None,
+        response_bytes: int = None,
+        attempt: int = 1,
+        error: Exception = None,
+    ):
+        """Notifies hooks that a request started with `request_start`
+        completed"""
+        if request is None:
+            return
+        request.duration = time.perf_counter() - request.started_at
+        request.status_code = status_code
+        request.response_bytes = response_bytes
+        request.attempt = attempt
+        request.error = error
+        for hook in self.hooks:
+            hook.on_request_end(request)
+
+    def retry(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        status_code: int = None,
+        error: Exception = None,
+    ):
+        """Notifies hooks that an attempt is going to be retried"""
+        if not self.hooks:
+            return
+        request = RequestInfo(
+            method, url, attempt=attempt, status_code=status_code, error=error
+        )
+        for hook in self.hooks:
+            hook.on_retry(request)
+
+
+class _EndpointStats:
+    """Latency histogram and counters of a single endpoint"""
+
+    def __init__(self):
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.errors = 0
+        self.retries = 0
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+    def percentile(self, quantile: float, bucket_bound) -> float:
+        """Upper bound of the bucket containing the given quantile"""
+        rank = quantile * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(bucket_bound(index), self.max)
+        return self.max
+
+
+class LatencyHistogram(RequestHooks):
+    """In-memory latency histogram per endpoint, to find which calls
+    dominate the time spent in the API.
+
+    Durations are counted in exponential buckets, so memory does not
+    grow with the number of requests and percentiles are accurate to
+    `precision` (10% by default).
+
+    ```
+    histogram = LatencyHistogram()
+    client = ScaleClient(api_key, hooks=[histogram])
+    ...
+    print(histogram.report())
+    ```
+
+    Args:
+        precision (float):
+            Relative width of a bucket
+    """
+
+    # Durations under this many seconds share the first bucket
+    MIN_DURATION = 1e-4
+
+    def __init__(self, precision: float = 0.1):
+        self._log_growth = math.log1p(precision)
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _EndpointStats] = {}
+
+    def _get_stats(self, request: RequestInfo) -> _EndpointStats:
+        key = (request.method, request.endpoint)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _EndpointStats()
+        return stats
+
+    def _bucket(self, duration: float) -> int:
+        if duration <= self.MIN_DURATION:
+            return 0
+        return math.ceil(math.log(duration / self.MIN_DURATION) / self._log_growth)
+
+    def _bucket_bound(self, index: int) -> float:
+        return self.MIN_DURATION * math.exp(index * self._log_growth)
+
+    def on_request_end(self, request: RequestInfo):
+        bucket = self._bucket(request.duration)
+        with self._lock:
+            stats = self._get_stats(request)
+            stats.buckets[bucket] = stats.buckets.get(bucket, 0) + 1
+            stats.count += 1
+            stats.total += request.duration
+            stats.max = max(stats.max, request.duration)
+            stats.request_bytes += request.request_bytes or 0
+            stats.response_bytes += request.response_bytes or 0
+            if request.error is not None or (request.status_code or 0) >= 400:
+                stats.errors += 1
+
+    def on_retry(self, request: RequestInfo):
+        with self._lock:
+            self._get_stats(request).retries += 1
+
+    def reset(self):
+        """Clears all recorded requests"""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self) -> List[Dict]:
+        """Returns statistics of every endpoint, sorted by total time
+        spent, in seconds.
+
+        Returns:
+            List[Dict]: method, endpoint, count, total, mean, p50,
+            p95, p99, max, errors, retries, request_bytes and
+            response_bytes of each endpoint
+        """
+        with self._lock:
+            rows = [
+                {
+                    "method": method,
+                    "endpoint": endpoint,
+                    "count": stats.count,
+                    "total": stats.total,
+                    "mean": stats.total / stats.count if stats.count else 0.0,
+                    "p50": stats.percentile(0.50, self._bucket_bound),
+                    "p95": stats.percentile(0.95, self._bucket_bound),
+                    "p99": stats.percentile(0.99, self._bucket_bound),
+                    "max": stats.max,
+                    "errors": stats.errors,
+                    "retries": stats.retries,
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                }
+                for (method, endpoint), stats in self._stats.items()
+            ]
+        return sorted(rows, key=lambda row: row["total"], reverse=True)
+
+    def report(self) -> str:
+        """Returns the summary formatted as a text table, durations
+        in milliseconds"""
+        header = (
+            f"{'endpoint':<48} {'count':>7} {'total s':>9} "
+            f"{'p50':>8} {'p95':>8} {'p99':>8} {'errors':>6} {'retries':>7}"
+        )
+        lines = [header]
+        for row in self.summary():
+            name = f"{row['method']} {row['endpoint']}"
+            lines.append(
+                f"{name:<48} {row['count']:>7} {row['total']:>9.2f} "
+                f"{row['p50'] * 1000:>8.1f} {row['p95'] * 1000:>8.1f} "
+                f"{row['p99'] * 1000:>8.1f} {row['errors']:>6} {row['retries']:>7}"
+            )
+        return "\n".join(lines)
+
+
+def _status_label(request: RequestInfo) -> str:
+    if request.status_code is not None:
+        return str(request.status_code)
+    return type(request.error).__name__ if request.error else ""
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """Records request durations, payload sizes and retries as
+    OpenTelemetry metrics. Requires `opentelemetry-api`:
+    `pip install scaleapi[otel]`
+
+    Args:
+        meter (opentelemetry.metrics.Meter, optional):
+            Meter to create instruments with, defaults to the meter
+            of the global meter provider
+    """
+
+    def __init__(self, meter=None):
+        try:
+            # pylint: disable=import-outside-toplevel
+            from opentelemetry import metrics
+        except ImportError as err:
+            raise ScaleException(
+                "OpenTelemetryHooks requires opentelemetry-api, "
+                "please install it with `pip install scaleapi[otel]`"
+            ) from err
+
+        meter = meter or metrics.get_meter(__package_name__, __version__)
+        self._duration = meter.create_histogram(
+            "http.client.request.duration",
+            unit="s",
+            description="Duration of Scale API requests, including retries",
+        )
+        self._request_size = meter.create_histogram(
+            "http.client.request.body.size",
+            unit="By",
+            description="Size of Scale API request bodies",
+        )
+        self._response_size = meter.create_histogram(
+            "http.client.response.body.size",
+            unit="By",
+            description="Size of Scale API response bodies",
+        )
+        self._retries = meter.create_counter(
+            "scaleapi.client.retries",
+            description="Number of retried Scale API requests",
+        )
+
+    @staticmethod
+    def _attributes(request: RequestInfo) -> Dict[str, str]:
+        return {
+            "http.request.method": request.method,
+            "url.template": request.endpoint,
+            "http.response.status_code": _status_label(request),
+        }
+
+    def on_request_end(self, request: RequestInfo):
+        attributes = self._attributes(request)
+        self._duration.record(request.duration, attributes)
+        if request.request_bytes is not None:
+            self._request_size.record(request.request_bytes, attributes)
+        if request.response_bytes is not None:
+            self._response_size.record(request.response_bytes, attributes)
+
+    def on_retry(self, request: RequestInfo):
+        self._retries.add(1, self._attributes(request))
+
+
+class PrometheusHooks(RequestHooks):
+    """Records request durations, payload sizes and retries as
+    Prometheus metrics. Requires `prometheus-client`:
+    `pip install scaleapi[prometheus]`
+
+    Args:
+        registry (prometheus_client.CollectorRegistry, optional):
+            Registry to register metrics in,
+            defaults to the global registry
+        namespace (str):
+            Prefix of the metric names
+    """
+
+    def __init__(self, registry=None, namespace: str = "scaleapi"):
+        try:
+            # pylint: disable=import-outside-toplevel
+            import prometheus_client
+        except ImportError as err:
+            raise ScaleException(
+                "PrometheusHooks requires prometheus-client, "
+                "please install it with `pip install scaleapi[prometheus]`"
+            ) from err
+
+        registry = registry or prometheus_client.REGISTRY
+        labels = ["method", "endpoint", "status"]
+        self._duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of Scale API requests, including retries",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+        self._bytes = prometheus_client.Counter(
+            "transferred_bytes",
+            "Size of Scale API request and response bodies",
+            ["method", "endpoint", "direction"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self._retries = prometheus_client.Counter(
+            "retries",
+            "Number of retried Scale API requests",
+            labels,
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def on_request_end(self, request: RequestInfo):
+        self._duration.labels(
+            request.method, request.endpoint, _status_label(request)
+        ).observe(request.duration)
+        for direction, size in (
+            ("request", request.request_bytes),
+            ("response", request.response_bytes),
+        ):
+            if size:
+                self._bytes.labels(request.method, request.endpoint, direction).inc(
+                    size
+                )
+
+    def on_retry(self, request: RequestInfo):
+        self._retries.labels(
+            request.method, request.endpoint, _status_label(request)
+        ).inc()
@@ -0,0 +1,140 @@
+import json
+import os
+import warnings
+from typing import Any, Callable, Union
+
+# Environment variable forcing a codec, i.e. SCALEAPI_JSON_CODEC=json
+CODEC_ENV_VAR = "SCALEAPI_JSON_CODEC"
+
+
+class JsonCodec:
+    """Pair of functions encoding objects to JSON bytes and decoding
+    JSON bytes (or str) to objects. Decoding errors must be raised as
+    `ValueError` subclasses, like `json.JSONDecodeError`.
+
+    Args:
+        name (str):
+            Name of the backend
+        encoder (Callable[[Any], bytes]):
+            Encodes an object to JSON bytes
+        decoder (Callable[[Union[bytes, str]], Any]):
+            Decodes JSON bytes or str
+    """
+
+    def __init__(
+        self,
+        name: str,
+        encoder: Callable[[Any], bytes],
+        decoder: Callable[[Union[bytes, str]], Any],
+    ):
+        self.name = name
+        self.dumps = encoder
+        self.loads = decoder
+
+    def __repr__(self):
+        return f"JsonCodec({self.name})"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _stdlib_codec() -> JsonCodec:
+    return JsonCodec("json", _stdlib_dumps, json.loads)
+
+
+def _orjson_codec() -> JsonCodec:
+    # pylint: disable=import-outside-toplevel,import-error,no-member
+    import orjson
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def encode(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # i.e. integers over 64 bits, which orjson does not support
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("orjson", encode, orjson.loads)
+
+
+def _ujson_codec() -> JsonCodec:
+    # pylint: disable=import-outside-toplevel,import-error
+    import ujson
+
+    def encode(obj: Any) -> bytes:
+        try:
+            return ujson.dumps(obj, ensure_ascii=False).encode("utf-8")
+        except (TypeError, OverflowError):
+            return _stdlib_dumps(obj)
+
+    return JsonCodec("ujson", encode, ujson.loads)
+
+
+_CODECS = {
+    "orjson": _orjson_codec,
+    "ujson": _ujson_codec,
+    "json": _stdlib_codec,
+}
+
+
+def _default_codec() -> JsonCodec:
+    name = os.environ.get(CODEC_ENV_VAR)
+    if name:
+        # An invalid setting must not make `import scaleapi` fail
+        if name not in _CODECS:
+            warnings.warn(
+                f"Unknown JSON codec {name} in {CODEC_ENV_VAR}, use one of "
+                f"{list(_CODECS)}. Using the fastest installed codec instead."
+            )
+        else:
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                warnings.warn(
+                    f"JSON codec {name} of {CODEC_ENV_VAR} is not installed. "
+                    "Using the fastest installed codec instead."
+                )
+    for factory in _CODECS.values():
+        try:
+            return factory()
+        except ImportError:
+            pass
+    return _stdlib_codec()
+
+
+_codec = _default_codec()
+
+
+def get_codec() -> JsonCodec:
+    """Returns the JSON codec in use. Defaults to the fastest
+    installed backend: `orjson`, then `ujson`, then the standard
+    library, unless set by the `SCALEAPI_JSON_CODEC` environment
+    variable."""
+    return _codec
+
+
+def set_codec(codec: Union[str, JsonCodec]):
+    """Sets the JSON codec used by all clients.
+
+    Args:
+        codec (Union[str, JsonCodec]):
+            `orjson`, `ujson`, `json` or a custom `JsonCodec`
+    """
+    global _codec  # pylint: disable=global-statement
+    if isinstance(codec, str):
+        if codec not in _CODECS:
+            raise ValueError(f"Unknown JSON codec {codec}, use one of {list(_CODECS)}")
+        codec = _CODECS[codec]()
+    _codec = codec
+
+
+def dumps(obj: Any) -> bytes:
+    """Encodes an object to JSON bytes with the current codec"""
+    return _codec.dumps(obj)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decodes JSON bytes or str with the current codec"""
+    return _codec.loads(data)
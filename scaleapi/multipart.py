@@ -0,0 +1,225 @@
+"""Streaming `multipart/form-data` encoding of file uploads, so that
+uploading a file of any size uses a constant amount of memory."""
+
+import bisect
+import io
+import mmap
+import os
+import uuid
+from typing import IO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Size of the chunks yielded when iterating over an encoder
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+FileSource = Union[str, "os.PathLike", bytes, IO]
+ProgressCallback = Callable[[int, int], None]
+
+
+def _header_param(value: str) -> str:
+    """Escapes a Content-Disposition parameter like browsers do"""
+    return value.translate({10: "%0A", 13: "%0D", 34: "%22"})
+
+
+def _file_size(file: IO) -> Optional[int]:
+    """Bytes left to read in a seekable file, None otherwise"""
+    if not getattr(file, "seekable", lambda: False)():
+        return None
+    start = file.tell()
+    size = file.seek(0, os.SEEK_END) - start
+    file.seek(start)
+    return size
+
+
+class _Part:
+    """A byte range of the encoded body: bytes, a memory map, or a
+    file object read from its position at creation"""
+
+    def __init__(self, data: Union[bytes, mmap.mmap, IO], size: int = None):
+        self.data = data
+        self.offset = 0 if isinstance(data, (bytes, mmap.mmap)) else data.tell()
+        self.size = len(data) if size is None else size
+
+    def read(self, position: int, size: int) -> bytes:
+        """Reads up to `size` bytes from `position` in the part"""
+        if isinstance(self.data, (bytes, mmap.mmap)):
+            return self.data[position : position + size]
+        self.data.seek(self.offset + position)
+        return self.data.read(min(size, self.size - position))
+
+
+class MultipartEncoder:
+    """Encodes form fields and files as a `multipart/form-data` body,
+    read on demand in chunks while the request is sent instead of
+    being built in memory. Files given as a path are memory-mapped.
+
+    The encoder is a seekable, sized file-like object, so `requests`
+    sends it with a `Content-Length` and retried attempts rewind it.
+
+    `requests.post(url, data=encoder, headers={"Content-Type":
+    encoder.content_type})`
+
+    Args:
+        fields (Dict, optional):
+            Form fields, a list value is sent as repeated fields and
+            None values are skipped
+        files (Dict[str, Any], optional):
+            Files by field name, as a path, bytes, a file object, or a
+            `(filename, content)`, `(filename, content, content_type)`
+            or `(filename, content, content_type, headers)` tuple,
+            where a string content is sent as text
+        progress_callback (Callable[[int, int], None], optional):
+            Called with the bytes read so far and the total size
+    """
+
+    def __init__(
+        self,
+        fields: Dict = None,
+        files: Dict[str, Union[FileSource, Tuple]] = None,
+        progress_callback: ProgressCallback = None,
+    ):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress_callback = progress_callback
+        self._opened: List[IO] = []
+        self._parts: List[_Part] = []
+
+        for name, values in (fields or {}).items():
+            if not isinstance(values, (list, tuple)):
+                values = [values]
+            for value in values:
+                if value is None:
+                    continue
+                if not isinstance(value, bytes):
+                    value = str(value).encode("utf-8")
+                self._add_part(name, value)
+
+        try:
+            for name, file in (files or {}).items():
+                self._add_file(name, file)
+        except BaseException:
+            self.close()
+            raise
+        self._parts.append(_Part(f"--{self.boundary}--\r\n".encode("ascii")))
+
+        # Offset of each part in the body
+        self._offsets = []
+        self._length = 0
+        for part in self._parts:
+            self._offsets.append(self._length)
+            self._length += part.size
+        self._position = 0
+
+    def _add_part(
+        self,
+        name: str,
+        data: Union[bytes, _Part],
+        filename: str = None,
+        content_type: str = None,
+        headers: Dict[str, str] = None,
+    ):
+        header = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{_header_param(name)}"'
+        )
+        if filename is not None:
+            header += f'; filename="{_header_param(filename)}"'
+        if content_type:
+            header += f"\r\nContent-Type: {content_type}"
+        for key, value in (headers or {}).items():
+            header += f"\r\n{key}: {value}"
+        self._parts.append(_Part(f"{header}\r\n\r\n".encode("utf-8")))
+        self._parts.append(data if isinstance(data, _Part) else _Part(data))
+        self._parts.append(_Part(b"\r\n"))
+
+    def _add_file(self, name: str, file: Union[FileSource, Tuple]):
+        filename, content_type, headers = None, None, None
+        if isinstance(file, tuple):
+            filename, file, content_type, headers = (file + (None, None))[:4]
+            if isinstance(file, str):
+                file = file.encode("utf-8")
+
+        if isinstance(file, (str, os.PathLike)):
+            filename = filename or os.path.basename(file)
+            file = open(file, "rb")  # pylint: disable=consider-using-with
+            self._opened.append(file)
+            if os.fstat(file.fileno()).st_size:
+                data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._opened.append(data)
+            else:
+                # Empty files cannot be memory-mapped
+                data = b""
+            part = _Part(data)
+        elif isinstance(file, (bytes, bytearray)):
+            part = _Part(bytes(file))
+        else:
+            file_name = getattr(file, "name", None)
+            if filename is None and isinstance(file_name, str):
+                if not file_name.startswith("<"):
+                    filename = os.path.basename(file_name)
+            size = None if isinstance(file, io.TextIOBase) else _file_size(file)
+            if size is None:
+                # Text streams and streams which cannot be rewound are
+                # read in memory
+                data = file.read()
+                part = _Part(data.encode("utf-8") if isinstance(data, str) else data)
+            else:
+                part = _Part(file, size)
+
+        self._add_part(name, part, filename or name, content_type, headers)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def tell(self) -> int:
+        """Current position in the body"""
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """Moves to a position of the body, i.e. to rewind a retry"""
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        self._position = max(0, min(offset, self._length))
+        return self._position
+
+    def read(self, size: int = -1) -> bytes:
+        """Reads up to `size` bytes of the body, the rest if negative"""
+        if size is None or size < 0:
+            size = self._length - self._position
+        chunks = []
+        index = bisect.bisect_right(self._offsets, self._position) - 1
+        while size > 0 and self._position < self._length:
+            part = self._parts[index]
+            chunk = part.read(self._position - self._offsets[index], size)
+            if not chunk and part.size:
+                raise IOError("File changed size during upload")
+            chunks.append(chunk)
+            self._position += len(chunk)
+            size -= len(chunk)
+            if self._position >= self._offsets[index] + part.size:
+                index += 1
+
+        data = b"".join(chunks)
+        if data and self.progress_callback:
+            self.progress_callback(self._position, self._length)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(DEFAULT_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def close(self):
+        """Closes the files opened from a path"""
+        for file in reversed(self._opened):
+            file.close()
+        self._opened = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
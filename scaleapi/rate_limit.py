@@ -0,0 +1,196 @@
+import email.utils
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+# Status code returned by Scale API when requests are throttled
+HTTP_TOO_MANY_REQUESTS = 429
+
+RATE_LIMIT_REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RATE_LIMIT_RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+# Reset header values above this are epoch timestamps, not seconds
+_EPOCH_THRESHOLD = 10**9
+
+
+class RateLimiter:
+    """Client-side adaptive rate limiter, shared by all requests of a
+    client across threads and event loops.
+
+    Requests take a token from a token bucket refilled at `rate`
+    requests per second. The rate adapts with AIMD (additive
+    increase, multiplicative decrease): every successful response
+    raises it by `increase_step`, every throttled (429) response
+    multiplies it by `decrease_factor`. `Retry-After` and rate limit
+    headers pause all requests until the API accepts them again.
+
+    `client = ScaleClient(api_key, rate_limiter=RateLimiter(rate=20))`
+
+    Args:
+        rate (float):
+            Initial number of requests per second
+        min_rate (float):
+            Lower bound of the adaptive rate
+        max_rate (float):
+            Upper bound of the adaptive rate
+        burst (int, optional):
+            Max number of requests sent at once after idle time,
+            defaults to one second worth of requests at `rate`
+        increase_step (float):
+            Requests per second added after each success
+        decrease_factor (float):
+            Multiplier applied to the rate after each 429
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        min_rate: float = 0.5,
+        max_rate: float = 100.0,
+        burst: int = None,
+        increase_step: float = 0.1,
+        decrease_factor: float = 0.5,
+    ):
+        if not 0 < min_rate <= rate <= max_rate:
+            raise ValueError("Rates must satisfy 0 < min_rate <= rate <= max_rate")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst or max(1, int(rate))
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+
+        self._rate = rate
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self._requests = 0
+        self._throttled = 0
+
+    @property
+    def rate(self) -> float:
+        """Current number of allowed requests per second"""
+        return self._rate
+
+    def stats(self) -> Dict:
+        """Returns the current state of the limiter, to be exported
+        as metrics.
+
+        Returns:
+            Dict {
+                rate: Current allowed requests per second
+                requests: Number of requests sent through the limiter
+                throttled: Number of 429 responses received
+                paused_for: Seconds until requests are allowed again
+            }
+        """
+        with self._lock:
+            return {
+                "rate": self._rate,
+                "requests": self._requests,
+                "throttled": self._throttled,
+                "paused_for": max(self._paused_until - time.monotonic(), 0),
+            }
+
+    def _reserve(self) -> float:
+        """Takes a token and returns how long to wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self.burst, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+            self._requests += 1
+
+            wait = max(self._paused_until - now, 0)
+            if self._tokens < 1:
+                wait = max(wait, (1 - self._tokens) / self._rate)
+            self._tokens -= 1
+            return wait
+
+    def acquire(self):
+        """Blocks until a request is allowed"""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self):
+        """Waits, without blocking the event loop, until a request is
+        allowed"""
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_response(self, status_code: int, headers: Optional[Mapping] = None):
+        """Adapts the rate to a response received from the API.
+
+        Args:
+            status_code (int):
+                HTTP status code of the response
+            headers (Mapping, optional):
+                Response headers
+        """
+        headers = headers or {}
+        pause = self._pause_from_headers(status_code, headers)
+
+        with self._lock:
+            if status_code == HTTP_TOO_MANY_REQUESTS:
+                self._throttled += 1
+                self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+                self._tokens = min(self._tokens, 0)
+            elif status_code < 400:
+                self._rate = min(self.max_rate, self._rate + self.increase_step)
+
+            if pause:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+
+    @staticmethod
+    def _pause_from_headers(status_code: int, headers: Mapping) -> Optional[float]:
+        """Seconds to pause all requests for, based on `Retry-After` or
+        on an exhausted rate limit quota"""
+        if status_code == HTTP_TOO_MANY_REQUESTS:
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+
+        remaining = _first_header(headers, RATE_LIMIT_REMAINING_HEADERS)
+        reset = _first_header(headers, RATE_LIMIT_RESET_HEADERS)
+        try:
+            if remaining is None or reset is None or float(remaining) > 0:
+                return None
+            reset = float(reset)
+        except ValueError:
+            return None
+
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        return max(reset, 0)
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Parses a `Retry-After` header, given either in seconds or as an
+    HTTP date, into seconds to wait. Returns None if not parseable."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_date.timestamp() - time.time(), 0)
+
+
+def _first_header(headers: Mapping, names) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
@@ -0,0 +1,391 @@
+import json
+import re
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from dateutil import parser as date_parser
+
+from scaleapi import json_codec
+from scaleapi.checkpoint import CheckpointStore
+from scaleapi.sync import DEFAULT_OVERLAP, TaskSync
+from scaleapi.tasks import CompactTask, Task, TaskStatus
+
+if TYPE_CHECKING:
+    import sqlite3
+
+    from scaleapi import ScaleClient
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    task_id TEXT PRIMARY KEY,
+    unique_id TEXT,
+    type TEXT,
+    status TEXT,
+    project TEXT,
+    batch TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    completed_at TEXT,
+    data BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS tasks_unique_id ON tasks (unique_id);
+CREATE INDEX IF NOT EXISTS tasks_project_status ON tasks (project, status);
+CREATE INDEX IF NOT EXISTS tasks_batch_status ON tasks (batch, status);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status);
+CREATE INDEX IF NOT EXISTS tasks_created_at ON tasks (created_at);
+CREATE INDEX IF NOT EXISTS tasks_updated_at ON tasks (updated_at);
+CREATE INDEX IF NOT EXISTS tasks_completed_at ON tasks (completed_at);
+CREATE TABLE IF NOT EXISTS task_tags (
+    task_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, task_id)
+);
+CREATE INDEX IF NOT EXISTS task_tags_task_id ON task_tags (task_id);
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+# Columns which can be filtered on, and grouped by in `count_by()`
+COLUMNS = ("unique_id", "type", "status", "project", "batch")
+TIME_COLUMNS = ("created_at", "updated_at", "completed_at")
+# Keyword arguments accepted by `query()`, `count()` and `count_by()`
+FILTERS = (
+    COLUMNS
+    + ("tags",)
+    + tuple(
+        f"{column[: -len('_at')]}_{suffix}"
+        for column in TIME_COLUMNS
+        for suffix in ("after", "before")
+    )
+)
+
+# Timestamps of the API, i.e. 2021-06-17T21:46:36.359Z
+_API_TIME = re.compile(r"(\d{4}-\d\d-\d\d)T(\d\d:\d\d:\d\d)(?:\.(\d{1,6}))?Z")
+
+
+def _normalize_time(value: Union[str, datetime, None]) -> Optional[str]:
+    """Formats a timestamp as 'YYYY-MM-DD HH:MM:SS.mmmmmm' in UTC, so
+    that timestamps compare as strings"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        match = _API_TIME.fullmatch(value)
+        if match:
+            day, time, fraction = match.groups()
+            return f"{day} {time}.{(fraction or '').ljust(6, '0')}"
+        value = date_parser.parse(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class _SyncState(CheckpointStore):
+    """`TaskSync` state kept in the `sync_state` table"""
+
+    def __init__(self, connection: "sqlite3.Connection", scope: str):
+        self.connection = connection
+        self.scope = scope
+
+    def load(self) -> Optional[Dict]:
+        row = self.connection.execute(
+            "SELECT state FROM sync_state WHERE scope = ?", (self.scope,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, state: Dict):
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                (self.scope, json.dumps(state)),
+            )
+
+    def clear(self):
+        with self.connection:
+            self.connection.execute(
+                "DELETE FROM sync_state WHERE scope = ?", (self.scope,)
+            )
+
+
+class TaskStore:
+    """Local SQLite store of tasks, indexed by `task_id`,
+    `unique_id`, status, project, batch, tags and timestamps, to
+    query and count tasks offline.
+
+    `sync()` fills the store with the tasks of a project or batch,
+    then `refresh()` pulls only the tasks updated since, see
+    `TaskSync`. The store can be used as a context manager.
+
+    Args:
+        path (str):
+            Path of the SQLite database, defaults to an in-memory
+            database
+        client (ScaleClient, optional):
+            Client used by `sync()` and `refresh()`, and by the
+            helper methods of the returned `Task` objects
+    """
+
+    def __init__(self, path: str = ":memory:", client: "ScaleClient" = None):
+        # Imported on use, as most users of the package never need it
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self.client = client
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        """Closes the database"""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add(self, tasks: Iterable[Union[Task, Dict]], batch_size: int = 1000) -> int:
+        """Inserts or replaces tasks, committing every `batch_size`
+        tasks.
+
+        Args:
+            tasks (Iterable[Task | Dict]):
+                Tasks, or task payloads, i.e. `client.get_tasks(...)`
+            batch_size (int):
+                Number of tasks per transaction
+
+        Returns:
+            Number of tasks stored
+        """
+        count = 0
+        rows = []
+        for task in tasks:
+            if isinstance(task, CompactTask):
+                raise ValueError("CompactTask does not hold the full task")
+            rows.append(task if isinstance(task, dict) else task.as_dict())
+            if len(rows) == batch_size:
+                count += self._commit(rows)
+                rows = []
+        if rows:
+            count += self._commit(rows)
+        return count
+
+    def _commit(self, rows: List[Dict]) -> int:
+        with self.connection:
+            self._insert(rows)
+        return len(rows)
+
+    def _insert(self, rows: List[Dict]):
+        """Inserts rows in the current transaction, without commit"""
+        tasks = [
+            (
+                row["task_id"],
+                row.get("unique_id"),
+                row.get("type"),
+                row.get("status"),
+                row.get("project"),
+                row.get("batch"),
+                _normalize_time(row.get("created_at")),
+                _normalize_time(row.get("updated_at")),
+                _normalize_time(row.get("completed_at")),
+                json_codec.dumps(row),
+            )
+            for row in rows
+        ]
+        tags = [(row["task_id"], tag) for row in rows for tag in row.get("tags") or []]
+        self.connection.executemany(
+            "DELETE FROM task_tags WHERE task_id = ?", [(t[0],) for t in tasks]
+        )
+        self.connection.executemany(
+            "INSERT OR REPLACE INTO tasks VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            tasks,
+        )
+        self.connection.executemany("INSERT INTO task_tags VALUES (?, ?)", tags)
+
+    def sync(
+        self,
+        project_name: str = None,
+        batch_name: str = None,
+        overlap: timedelta = DEFAULT_OVERLAP,
+    ) -> int:
+        """Stores the tasks of a project or batch updated since its
+        last sync, all of its tasks on the first sync.
+
+        Args:
+            project_name (str, optional):
+                Project Name
+            batch_name (str, optional):
+                Batch Name
+            overlap (timedelta):
+                See `TaskSync`
+
+        Returns:
+            Number of new or updated tasks
+        """
+        scope = json.dumps([project_name, batch_name])
+        sync = TaskSync(
+            self.client,
+            _SyncState(self.connection, scope),
+            project_name=project_name,
+            batch_name=batch_name,
+            overlap=overlap,
+        )
+        count = 0
+        try:
+            for task in sync.changes():
+                # Committed with the new sync state, once all changes
+                # were stored, so that they are never half applied
+                self._insert([task.as_dict()])
+                count += 1
+        except BaseException:
+            self.connection.rollback()
+            raise
+        return count
+
+    def refresh(self, overlap: timedelta = DEFAULT_OVERLAP) -> int:
+        """Pulls the tasks updated since the last sync of every
+        project and batch synced so far.
+
+        Returns:
+            Number of new or updated tasks
+        """
+        scopes = [
+            json.loads(row[0])
+            for row in self.connection.execute("SELECT scope FROM sync_state")
+        ]
+        return sum(
+            self.sync(project_name, batch_name, overlap)
+            for project_name, batch_name in scopes
+        )
+
+    @staticmethod
+    def _where(filters: Dict) -> Tuple[str, List]:
+        unknown = sorted(set(filters).difference(FILTERS))
+        if unknown:
+            raise ValueError(f"Unknown filters {unknown}, must be in {FILTERS}")
+        clauses, params = [], []
+        for column in COLUMNS:
+            value = filters.get(column)
+            if value is None:
+                continue
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            values = [item.value if isinstance(item, Enum) else item for item in values]
+            clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        for column in TIME_COLUMNS:
+            prefix = column[: -len("_at")]
+            for suffix, operator in (("after", ">="), ("before", "<=")):
+                value = filters.get(f"{prefix}_{suffix}")
+                if value is not None:
+                    clauses.append(f"{column} {operator} ?")
+                    params.append(_normalize_time(value))
+        tags = filters.get("tags")
+        if tags:
+            tags = [tags] if isinstance(tags, str) else list(tags)
+            clauses.append(
+                "task_id IN (SELECT task_id FROM task_tags "
+                f"WHERE tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Returns a stored task, or None"""
+        row = self.connection.execute(
+            "SELECT data FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        return Task(json_codec.loads(row[0]), self.client) if row else None
+
+    def query(
+        self,
+        project: str = None,
+        batch: str = None,
+        status: Union[TaskStatus, str, List] = None,
+        unique_id: Union[str, List[str]] = None,
+        tags: Union[str, List[str]] = None,
+        limit: int = None,
+        order_by: str = "created_at",
+        **filters,
+    ) -> Generator[Task, None, None]:
+        """Yields stored tasks matching all given filters. A list
+        matches any of its values.
+
+        `store.query(project="p", status=TaskStatus.Completed,
+        completed_after="2024-01-01")`
+
+        Args:
+            project (str | List[str], optional):
+                Project name
+            batch (str | List[str], optional):
+                Batch name
+            status (TaskStatus | str | List, optional):
+                Task status
+            unique_id (str | List[str], optional):
+                Unique ID of the task
+            tags (str | List[str], optional):
+                Tasks with any of the tags
+            limit (int, optional):
+                Maximum number of tasks
+            order_by (str):
+                Column to order by, defaults to `created_at`
+            **filters:
+                `type`, and `created_after`, `created_before`,
+                `updated_after`, `updated_before`, `completed_after`,
+                `completed_before` as datetimes or strings
+
+        Yields:
+            Generator[Task]:
+                Stored tasks
+        """
+        if order_by not in COLUMNS + TIME_COLUMNS + ("task_id",):
+            raise ValueError(f"Cannot order by {order_by}")
+        where, params = self._where(
+            dict(
+                filters,
+                project=project,
+                batch=batch,
+                status=status,
+                unique_id=unique_id,
+                tags=tags,
+            )
+        )
+        sql = f"SELECT data FROM tasks{where} ORDER BY {order_by}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for (data,) in self.connection.execute(sql, params):
+            yield Task(json_codec.loads(data), self.client)
+
+    def count(self, **filters) -> int:
+        """Number of stored tasks matching the filters of `query()`"""
+        where, params = self._where(filters)
+        sql = f"SELECT COUNT(*) FROM tasks{where}"
+        return self.connection.execute(sql, params).fetchone()[0]
+
+    def count_by(self, column: str, **filters) -> Dict[Optional[str], int]:
+        """Number of stored tasks matching the filters of `query()`,
+        grouped by `column`, i.e. `store.count_by("status", batch="b")`
+
+        Args:
+            column (str):
+                One of `unique_id`, `type`, `status`, `project`, `batch`
+
+        Returns:
+            Dict of the column values to their task counts
+        """
+        if column not in COLUMNS:
+            raise ValueError(f"column must be one of {COLUMNS}")
+        where, params = self._where(filters)
+        sql = f"SELECT {column}, COUNT(*) FROM tasks{where} GROUP BY {column}"
+        return dict(self.connection.execute(sql, params).fetchall())
@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Generator, Optional, Union
+
+from dateutil import parser as date_parser
+
+from scaleapi.checkpoint import CheckpointStore, FileCheckpoint
+from scaleapi.tasks import Task
+
+if TYPE_CHECKING:
+    from scaleapi import ScaleClient
+
+DEFAULT_OVERLAP = timedelta(minutes=10)
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = date_parser.parse(value)
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+class TaskSync:
+    """Incrementally mirrors the tasks of a project or batch, listing
+    only tasks updated since the previous sync with
+    `get_tasks(updated_after=...)`.
+
+    The high-water mark is the latest `updated_at` seen, a server
+    timestamp, so the local clock does not matter. Each sync starts
+    `overlap` before the mark, to catch tasks whose update became
+    visible late or that share the timestamp of the mark, and tasks
+    already synced at the same `updated_at` are skipped. The mark and
+    the recently synced tasks are persisted in a `CheckpointStore`
+    once a sync completes, so an interrupted sync is simply retried.
+
+    Args:
+        client (ScaleClient):
+            Client used to list the tasks
+        state (CheckpointStore | str):
+            Store of the sync state, or path of a JSON state file
+        project_name (str, optional):
+            Project to sync
+        batch_name (str, optional):
+            Batch to sync
+        overlap (timedelta):
+            Window synced again before the high-water mark to absorb
+            clock skew and replication lag. Defaults to 10 minutes.
+        limit (int, optional):
+            Task count per request (1-100)
+    """
+
+    def __init__(
+        self,
+        client: "ScaleClient",
+        state: Union[CheckpointStore, str],
+        project_name: str = None,
+        batch_name: str = None,
+        overlap: timedelta = DEFAULT_OVERLAP,
+        limit: int = None,
+    ):
+        if not project_name and not batch_name:
+            raise ValueError(
+                "At least one of project_name or batch_name must be provided."
+            )
+        self.client = client
+        self.store = FileCheckpoint(state) if isinstance(state, str) else state
+        self.scope = {"project_name": project_name, "batch_name": batch_name}
+        self.overlap = overlap
+        self.limit = limit
+
+    def _load(self) -> Dict:
+        state = self.store.load()
+        if not state:
+            return {"watermark": None, "seen": {}}
+        if state.get("scope") != self.scope:
+            raise ValueError(
+                f"Sync state of {state.get('scope')} does not match {self.scope}"
+            )
+        return state
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """Latest `updated_at` of the synced tasks, None before the
+        first sync"""
+        watermark = self._load()["watermark"]
+        return _parse_time(watermark) if watermark else None
+
+    def changes(self) -> Generator[Task, None, None]:
+        """Yields the tasks created or updated since the last sync.
+        The new state is saved once all tasks were consumed.
+
+        Yields:
+            Generator[Task]:
+                Changed tasks, each `task_id` and `updated_at` at most
+                once
+        """
+        state = self._load()
+        watermark = _parse_time(state["watermark"]) if state["watermark"] else None
+        # task_id: updated_at of tasks synced in the overlap window
+        seen = dict(state["seen"])
+
+        updated_after = None
+        if watermark:
+            start = (watermark - self.overlap).astimezone(timezone.utc)
+            updated_after = start.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+        tasks = self.client.get_tasks(
+            **self.scope, updated_after=updated_after, limit=self.limit
+        )
+        for task in tasks:
+            updated_at = task.as_dict().get("updated_at")
+            if not updated_at or seen.get(task.id) == updated_at:
+                continue
+            seen[task.id] = updated_at
+            updated = _parse_time(updated_at)
+            if watermark is None or updated > watermark:
+                watermark = updated
+            yield task
+
+        if watermark is None:
+            return
+        horizon = watermark - self.overlap
+        self.store.save(
+            {
+                "scope": self.scope,
+                "watermark": watermark.isoformat(),
+                "seen": {
+                    task_id: updated_at
+                    for task_id, updated_at in seen.items()
+                    if _parse_time(updated_at) >= horizon
+                },
+            }
+        )
+
+    def run(self, callback: Callable[[Task], None]) -> int:
+        """Syncs changed tasks into `callback`, i.e. to upsert them
+        into a local database.
+
+        Args:
+            callback (Callable[[Task], None]):
+                Called with each changed task
+
+        Returns:
+            Number of changed tasks
+        """
+        count = 0
+        for task in self.changes():
+            callback(task)
+            count += 1
+        return count
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 from typing import List
 
@@ -123,3 +124,78 @@ class Task:
     def delete_tags(self, tags: List[str]):
         """Sets tags for a task"""
         self._client.delete_task_tags(self.id, tags)
+
+
+class CompactTask:
+    """Memory efficient, read-only task record returned by
+    `get_tasks(compact=True)`. Only the commonly used fields are kept,
+    the rest of the task payload is dropped. Use `fetch()` to retrieve
+    the full `Task`."""
+
+    __slots__ = (
+        "_client",
+        "id",
+        "status",
+        "project",
+        "batch",
+        "created_at",
+        "completed_at",
+        "unique_id",
+        "metadata",
+    )
+
+    def __init__(self, json, client):
+        self._client = client
+        self.id = json["task_id"]
+        # Interned, as many tasks share the same status and project
+        self.status = _intern(json.get("status"))
+        self.project = _intern(json.get("project"))
+        self.batch = _intern(json.get("batch"))
+        self.created_at = json.get("created_at")
+        self.completed_at = json.get("completed_at")
+        self.unique_id = json.get("unique_id")
+        self.metadata = json.get("metadata")
+
+    @property
+    def task_id(self) -> str:
+        """Task ID, same as `id`"""
+        return self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+    def __eq__(self, other):
+        if not isinstance(other, CompactTask):
+            return NotImplemented
+        return self.id == other.id
+
+    def __str__(self):
+        return f"CompactTask(id={self.id})"
+
+    def __repr__(self):
+        return f"CompactTask({self.as_dict()})"
+
+    def as_dict(self):
+        """Returns the kept fields as a dictionary
+
+        Returns:
+            Dict with object content
+        """
+        return {
+            "task_id": self.id,
+            "status": self.status,
+            "project": self.project,
+            "batch": self.batch,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
+            "unique_id": self.unique_id,
+            "metadata": self.metadata,
+        }
+
+    def fetch(self) -> Task:
+        """Retrieves the full task, with all of its fields"""
+        return self._client.get_task(self.id)
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
@@ -45,6 +45,13 @@ setup(
         "annotation",
     ],
     install_requires=install_requires,
+    extras_require={
+        "arrow": ["pyarrow>=8.0.0"],
+        "async": ["httpx>=0.23.0"],
+        "orjson": ["orjson>=3.6.0"],
+        "otel": ["opentelemetry-api>=1.12.0"],
+        "prometheus": ["prometheus-client>=0.14.0"],
+    },
     python_requires=">=3.8",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
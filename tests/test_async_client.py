@@ -0,0 +1,150 @@
+# pylint: disable=missing-function-docstring
+import asyncio
+import json
+
+import pytest
+
+from scaleapi.exceptions import ScaleDuplicateResource, ScaleResourceNotFound
+from scaleapi.rate_limit import RateLimiter
+from scaleapi.tasks import TaskType
+
+httpx = pytest.importorskip("httpx")
+
+from scaleapi.async_client import AsyncScaleClient  # noqa: E402
+
+
+def make_client(handler):
+    client = AsyncScaleClient("test_key", api_instance_url="http://stub/v1")
+    client.api._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return client
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_get_task():
+    def handler(request):
+        assert request.url.path == "/v1/task/task_1"
+        return httpx.Response(200, json={"task_id": "task_1", "status": "pending"})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.get_task("task_1")
+
+    task = run(main())
+    assert task.id == "task_1"
+    assert task.status == "pending"
+
+
+def test_error_mapping():
+    def handler(_):
+        return httpx.Response(404, json={"error": "Task not found"})
+
+    async def main():
+        async with make_client(handler) as client:
+            await client.get_task("missing")
+
+    with pytest.raises(ScaleResourceNotFound):
+        run(main())
+
+
+def test_get_tasks_paginates():
+    def handler(request):
+        token = request.url.params.get("next_token")
+        start = int(token or 0)
+        docs = [{"task_id": f"task_{i}"} for i in range(start, start + 2)]
+        has_more = start == 0
+        return httpx.Response(
+            200,
+            json={
+                "docs": docs,
+                "total": 4,
+                "limit": 2,
+                "offset": start,
+                "has_more": has_more,
+                "next_token": "2" if has_more else None,
+            },
+        )
+
+    async def main():
+        async with make_client(handler) as client:
+            return [task.id async for task in client.get_tasks(project_name="p")]
+
+    assert run(main()) == ["task_0", "task_1", "task_2", "task_3"]
+
+
+def test_create_task_recovers_after_server_error():
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "GET":
+            return httpx.Response(
+                200, json={"docs": [{"task_id": "created", "unique_id": "u1"}]}
+            )
+        if len(calls) == 1:
+            return httpx.Response(500, json={"error": "Internal error"})
+        assert json.loads(request.content)["unique_id"] == "u1"
+        return httpx.Response(409, json={"error": "Duplicate unique_id"})
+
+    async def main():
+        async with make_client(handler) as client:
+            return await client.create_task(TaskType.ImageAnnotation, unique_id="u1")
+
+    assert run(main()).id == "created"
+    assert calls == ["POST", "POST", "GET"]
+
+
+def test_create_tasks():
+    def handler(request):
+        unique_id = json.loads(request.content)["unique_id"]
+        if unique_id == "dup":
+            return httpx.Response(409, json={"error": "Duplicate unique_id"})
+        return httpx.Response(200, json={"task_id": f"task_{unique_id}"})
+
+    async def main():
+        async with make_client(handler) as client:
+            payloads = [{"unique_id": uid} for uid in ["a", "dup", "b"]]
+            return [
+                result
+                async for result in client.create_tasks(
+                    TaskType.ImageAnnotation, payloads, concurrency=2
+                )
+            ]
+
+    results = run(main())
+    assert [index for index, _ in results] == [0, 1, 2]
+    assert results[0][1].id == "task_a"
+    assert isinstance(results[1][1], ScaleDuplicateResource)
+    assert results[2][1].id == "task_b"
+
+
+def test_rate_limiter_observes_throttling():
+    calls = []
+
+    def handler(_):
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"task_id": "task_1"})
+
+    limiter = RateLimiter(rate=10)
+
+    async def main():
+        async with make_client(handler) as client:
+            client.api.rate_limiter = limiter
+            return await client.get_task("task_1")
+
+    assert run(main()).id == "task_1"
+    assert limiter.stats()["throttled"] == 1
+    assert limiter.stats()["requests"] == 2
+
+
+def test_proxies_are_mounted():
+    client = AsyncScaleClient("test_key", proxies={"https": "http://proxy.local:3128"})
+    transport = client.api._client._transport_for_url(
+        httpx.URL("https://api.scale.com/v1/tasks")
+    )
+    assert transport is not client.api._client._transport
+    run(client.close())
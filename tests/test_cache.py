@@ -0,0 +1,70 @@
+# pylint: disable=missing-function-docstring
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.cache import ResourceCache
+
+
+def test_ttl_and_lru(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("scaleapi.cache.time.monotonic", lambda: now[0])
+    cache = ResourceCache(ttl=10, maxsize=2)
+    loads = []
+
+    def load(key):
+        return cache.get_or_load(key, lambda: loads.append(key) or key.upper())
+
+    assert [load("a"), load("a"), load("b")] == ["A", "A", "B"]
+    load("a")
+    load("c")  # evicts b, the least recently used
+    load("a")
+    load("b")
+    assert loads == ["a", "b", "c", "b"]
+    assert cache.stats() == {"hits": 3, "misses": 4, "evictions": 2, "size": 2}
+
+    now[0] = 11
+    load("b")
+    assert loads[-1] == "b"
+
+
+def test_errors_are_not_cached():
+    cache = ResourceCache()
+
+    def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("key", fail)
+    assert cache.get_or_load("key", lambda: 1) == 1
+
+
+def test_invalidation_during_load():
+    cache = ResourceCache()
+
+    def load():
+        cache.invalidate("key")
+        return "stale"
+
+    assert cache.get_or_load("key", load) == "stale"
+    assert cache.stats()["size"] == 0
+
+
+def test_client_cache():
+    cache = ResourceCache()
+    with StubServer() as server:
+        with ScaleClient("key", api_instance_url=server.url, cache=cache) as client:
+            for _ in range(3):
+                assert client.get_project("p").name == "p"
+                client.get_batch("b")
+                client.projects()
+            assert server.requests["GET /v1/projects/p"] == 1
+            assert server.requests["GET /v1/batches/b"] == 1
+
+            client.update_project("p", instruction="new")
+            client.get_project("p")
+            client.finalize_batch("b")
+            client.get_batch("b")
+            assert server.requests["GET /v1/projects/p"] == 2
+            assert server.requests["GET /v1/batches/b"] == 2
+    assert cache.stats()["hits"] == 6
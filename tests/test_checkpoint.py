@@ -0,0 +1,79 @@
+# pylint: disable=missing-function-docstring
+import itertools
+import os
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.checkpoint import CheckpointStore, FileCheckpoint
+from scaleapi.tasks import TaskStatus
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    with StubServer(total_tasks=250) as server:
+        client = ScaleClient("test_key", api_instance_url=server.url)
+        client.v2.api_client.configuration.host = server.v2_url
+        with client:
+            yield client
+
+
+def test_file_checkpoint(tmp_path):
+    store = FileCheckpoint(str(tmp_path / "state.json"))
+    assert store.load() is None
+    store.save({"next_token": "100"})
+    assert store.load() == {"next_token": "100"}
+    store.clear()
+    store.clear()
+    assert store.load() is None
+
+
+def test_checkpoint_store_is_abstract():
+    class Incomplete(CheckpointStore):
+        def load(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()  # pylint: disable=abstract-class-instantiated
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_get_tasks_resumes(client, tmp_path, prefetch):
+    path = str(tmp_path / "state.json")
+    tasks = client.get_tasks(project_name="p", checkpoint=path, prefetch=prefetch)
+    # Interrupted in the second page, only the first page is saved
+    first = [task.id for task in itertools.islice(tasks, 150)]
+    tasks.close()
+    assert FileCheckpoint(path).load()["next_token"] == "100"
+
+    rest = [task.id for task in client.get_tasks(project_name="p", checkpoint=path)]
+    assert rest[0] == "task_100"
+    assert first[:100] + rest == [f"task_{i}" for i in range(250)]
+    assert not os.path.exists(path)
+
+
+def test_checkpoint_of_another_export(client, tmp_path):
+    path = str(tmp_path / "state.json")
+    tasks = client.get_tasks(project_name="p", checkpoint=path)
+    list(itertools.islice(tasks, 101))
+    with pytest.raises(ValueError):
+        next(client.get_tasks(project_name="other", checkpoint=path))
+
+
+def test_v2_get_tasks_resumes(client, tmp_path):
+    store = FileCheckpoint(str(tmp_path / "state.json"))
+    args = {"project_id": "p", "status": TaskStatus.Completed, "limit": 50}
+    tasks = client.v2_get_tasks(**args, checkpoint=store)
+    list(itertools.islice(tasks, 120))
+    assert store.load()["args"]["status"] == "completed"
+
+    rest = [task.task_id for task in client.v2_get_tasks(**args, checkpoint=store)]
+    assert rest[0] == "task_100" and len(rest) == 150
+    assert store.load() is None
+
+
+def test_v2_get_delivered_tasks(client, tmp_path):
+    path = str(tmp_path / "state.json")
+    tasks = client.v2_get_delivered_tasks(delivery_id="d", checkpoint=path)
+    assert len(list(tasks)) == 250
@@ -0,0 +1,303 @@
+# pylint: disable=missing-function-docstring
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+import scaleapi
+from scaleapi.concurrency import bounded_map, prefetched
+from scaleapi.exceptions import (
+    ExceptionMap,
+    ScaleDuplicateResource,
+    ScaleException,
+    ScaleForbidden,
+    ScaleResourceNotFound,
+    ScaleUnauthorized,
+)
+from scaleapi.tasks import Task, TaskType
+
+
+def test_bounded_map_ordered():
+    def slow_square(value):
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    results = list(bounded_map(slow_square, range(5), concurrency=5))
+    assert results == [(i, i * i) for i in range(5)]
+
+
+def test_bounded_map_unordered_and_errors():
+    def check(value):
+        if value == 2:
+            raise ValueError("bad item")
+        return value
+
+    results = dict(bounded_map(check, range(4), concurrency=2, ordered=False))
+    assert sorted(results) == [0, 1, 2, 3]
+    assert isinstance(results[2], ValueError)
+    assert results[3] == 3
+
+
+def test_bounded_map_consumes_lazily():
+    consumed = []
+    lock = threading.Lock()
+
+    def items():
+        for i in range(100):
+            with lock:
+                consumed.append(i)
+            yield i
+
+    results = bounded_map(lambda x: x, items(), concurrency=4)
+    next(results)
+    assert len(consumed) <= 5
+    results.close()
+
+
+def test_create_tasks():
+    client = scaleapi.ScaleClient("test_key")
+
+    def post_request(endpoint, body=None, **_):
+        assert endpoint == "task/imageannotation"
+        if body["unique_id"] == "dup":
+            raise ScaleDuplicateResource("Duplicate unique_id", 409)
+        return {"task_id": f"task_{body['unique_id']}"}
+
+    client.api.post_request = post_request
+    payloads = ({"unique_id": uid} for uid in ["a", "dup", "b"])
+
+    results = list(client.create_tasks(TaskType.ImageAnnotation, payloads, 2))
+    assert [index for index, _ in results] == [0, 1, 2]
+    assert isinstance(results[0][1], Task) and results[0][1].id == "task_a"
+    assert isinstance(results[1][1], ScaleException)
+    assert results[2][1].id == "task_b"
+
+
+def test_get_tasks_by_ids():
+    client = scaleapi.ScaleClient("test_key")
+    requested = []
+
+    def get_request(endpoint, **_):
+        task_id = endpoint.split("/")[-1]
+        requested.append(task_id)
+        if task_id == "missing":
+            raise ScaleResourceNotFound("Task not found", 404)
+        if task_id == "forbidden":
+            raise ScaleUnauthorized("Not allowed", 401)
+        return {"task_id": task_id}
+
+    client.api.get_request = get_request
+    task_ids = iter(["a", "missing", "a", "forbidden", "b", "b"])
+
+    results = list(client.get_tasks_by_ids(task_ids, concurrency=3, ordered=True))
+    assert sorted(requested) == ["a", "b", "forbidden", "missing"]
+    assert [task_id for task_id, _ in results] == ["a", "missing", "forbidden", "b"]
+    assert isinstance(results[0][1], Task) and results[0][1].id == "a"
+    assert isinstance(results[1][1], ScaleResourceNotFound)
+    assert isinstance(results[2][1], ScaleUnauthorized)
+    assert results[3][1].id == "b"
+
+
+def test_get_tasks_by_ids_yields_forbidden_tasks():
+    client = scaleapi.ScaleClient("test_key")
+
+    def get_request(endpoint, **_):
+        task_id = endpoint.split("/")[-1]
+        if task_id == "denied":
+            raise ExceptionMap[403]("Forbidden", 403)
+        return {"task_id": task_id}
+
+    client.api.get_request = get_request
+    results = dict(client.get_tasks_by_ids(["a", "denied", "b"], concurrency=1))
+    assert isinstance(results["denied"], ScaleForbidden)
+    assert results["denied"].code == 403
+    assert results["a"].id == "a" and results["b"].id == "b"
+
+
+def test_get_tasks_by_ids_raises_other_errors():
+    client = scaleapi.ScaleClient("test_key")
+
+    def get_request(endpoint, **_):
+        raise ScaleException(f"Server error for {endpoint}", 500)
+
+    client.api.get_request = get_request
+    with pytest.raises(ScaleException):
+        list(client.get_tasks_by_ids(["a", "b"], concurrency=2))
+
+
+def test_resolve_unique_ids():
+    client = scaleapi.ScaleClient("test_key")
+    existing = {f"{'x' * 200}{i}" for i in range(0, 150, 3)}
+    requests = []
+    lock = threading.Lock()
+
+    def get_request(endpoint, params=None):
+        assert endpoint == "tasks" and params["project"] == "p"
+        with lock:
+            requests.append(params["unique_id"])
+        docs = [
+            {"task_id": f"task_{uid}", "unique_id": uid}
+            for uid in params["unique_id"]
+            if uid in existing
+        ]
+        return {
+            "docs": docs,
+            "total": len(docs),
+            "limit": 100,
+            "offset": 0,
+            "has_more": False,
+        }
+
+    client.api.get_request = get_request
+    unique_ids = [f"{'x' * 200}{i}" for i in range(150)] * 2
+
+    found, missing = client.resolve_unique_ids(unique_ids, project_name="p")
+    assert set(found) == existing
+    assert found[f"{'x' * 200}3"].id == f"task_{'x' * 200}3"
+    assert missing == [uid for uid in unique_ids[:150] if uid not in existing]
+    # Long IDs are split by query length, each ID requested once
+    assert len(requests) == 6
+    assert sorted(uid for chunk in requests for uid in chunk) == sorted(
+        unique_ids[:150]
+    )
+
+
+def test_prefetched_keeps_order_and_raises():
+    def pages():
+        yield from range(5)
+        raise ScaleException("page failed")
+
+    results = []
+    with pytest.raises(ScaleException):
+        for page in prefetched(pages(), depth=2):
+            results.append(page)
+    assert results == list(range(5))
+
+
+def test_prefetched_bounded_and_stops():
+    produced = []
+
+    def pages():
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    iterator = prefetched(pages(), depth=2)
+    assert next(iterator) == 0
+    time.sleep(0.1)
+    assert len(produced) <= 4
+    iterator.close()
+    time.sleep(0.3)
+    stopped_at = len(produced)
+    time.sleep(0.2)
+    assert len(produced) == stopped_at
+
+
+def test_get_tasks_prefetch():
+    client = scaleapi.ScaleClient("test_key")
+
+    def get_request(endpoint, params=None):
+        assert endpoint == "tasks"
+        start = int(params["next_token"] or 0)
+        return {
+            "docs": [{"task_id": f"task_{start}"}, {"task_id": f"task_{start + 1}"}],
+            "total": 6,
+            "limit": 2,
+            "offset": start,
+            "has_more": start < 4,
+            "next_token": str(start + 2),
+        }
+
+    client.api.get_request = get_request
+    tasks = client.get_tasks(project_name="p", prefetch=2)
+    assert [task.id for task in tasks] == [f"task_{i}" for i in range(6)]
+
+
+def make_tasks_endpoint(tasks, page_size=10):
+    """Returns a fake `tasks` endpoint filtering by created time,
+    with inclusive bounds on both ends"""
+
+    def get_request(endpoint, params=None):
+        assert endpoint == "tasks"
+        docs = [
+            task
+            for task in tasks
+            if params.get("start_time", "") <= task["created_at"]
+            and task["created_at"] <= params.get("end_time", "9999")
+        ]
+        start = int(params.get("next_token") or 0)
+        limit = params.get("limit", page_size)
+        return {
+            "docs": docs[start : start + limit],
+            "total": len(docs),
+            "limit": limit,
+            "offset": start,
+            "has_more": start + limit < len(docs),
+            "next_token": str(start + limit),
+        }
+
+    return get_request
+
+
+def test_get_tasks_parallel():
+    tasks = [
+        {"task_id": f"task_{i}", "created_at": f"2024-01-01 00:{i:02d}:00.000000"}
+        for i in range(60)
+    ]
+    client = scaleapi.ScaleClient("test_key")
+    client.api.get_request = make_tasks_endpoint(tasks)
+
+    results = list(
+        client.get_tasks_parallel(
+            "2024-01-01 00:00:00",
+            "2024-01-01 01:00:00",
+            project_name="p",
+            shards=4,
+            max_shard_size=5,
+        )
+    )
+    assert sorted(task.id for task in results) == sorted(t["task_id"] for t in tasks)
+
+
+def test_get_tasks_parallel_tracks_edge_tasks_only():
+    edges = [datetime(2024, 1, 1, 0, 15), datetime(2024, 1, 1, 0, 30)]
+
+    def on_edge(created_at):
+        task = Task({"task_id": "t", "created_at": created_at}, None)
+        return scaleapi.ScaleClient._on_time_edge(task, "created", edges)
+
+    assert on_edge("2024-01-01T00:15:00.000Z")
+    assert on_edge("2024-01-01 00:30:00.000500")
+    assert not on_edge("2024-01-01T00:20:00.000Z")
+    assert not on_edge("2024-01-01T00:14:59.990Z")
+    assert on_edge(None)
+
+
+def test_get_batches_concurrent_in_order():
+    names = [f"batch_{i}" for i in range(45)]
+    client = scaleapi.ScaleClient("test_key")
+
+    def get_request(endpoint, params=None):
+        assert endpoint == "batches"
+        offset = params["offset"]
+        return {
+            "docs": [
+                {
+                    "name": name,
+                    "status": "staging",
+                    "project": "p",
+                    "created_at": "2024-01-01",
+                    "metadata": {},
+                }
+                for name in names[offset : offset + 10]
+            ],
+            "totalDocs": len(names),
+            "limit": 10,
+            "offset": offset,
+            "has_more": offset + 10 < len(names),
+        }
+
+    client.api.get_request = get_request
+    batches = client.get_batches(project_name="p", concurrency=4)
+    assert [batch.name for batch in batches] == names
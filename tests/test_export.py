@@ -0,0 +1,46 @@
+# pylint: disable=missing-function-docstring
+import json
+
+import pytest
+
+from benchmarks.stub_server import StubServer, make_task
+from scaleapi import ScaleClient
+from scaleapi.export import task_record_batches, task_schema, write_tasks
+
+pa = pytest.importorskip("pyarrow")
+
+
+def test_record_batches_are_bounded():
+    tasks = [make_task(f"task_{i}", metadata={"i": i}) for i in range(25)]
+    batches = list(task_record_batches(tasks, batch_size=10))
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+    assert all(batch.schema == task_schema() for batch in batches)
+
+    row = batches[2].to_pylist()[0]
+    assert row["task_id"] == "task_20"
+    assert json.loads(row["metadata"]) == {"i": 20}
+    assert row["created_at"].isoformat() == "2021-06-17T21:46:36.359000+00:00"
+    assert row["completed_at"] is None and row["response"] is None
+
+
+@pytest.mark.parametrize("export_format", ["parquet", "feather"])
+def test_write_tasks(tmp_path, export_format):
+    path = str(tmp_path / f"tasks.{export_format}")
+    with StubServer(total_tasks=120) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            tasks = client.get_tasks(project_name="p")
+            assert write_tasks(tasks, path, export_format, batch_size=50) == 120
+
+    if export_format == "parquet":
+        parquet = pytest.importorskip("pyarrow.parquet")
+        assert parquet.ParquetFile(path).num_row_groups == 3
+        table = parquet.read_table(path)
+    else:
+        table = pa.ipc.open_file(path).read_all()
+    assert table.schema == task_schema()
+    assert table.column("task_id").to_pylist() == [f"task_{i}" for i in range(120)]
+
+
+def test_write_tasks_unknown_format(tmp_path):
+    with pytest.raises(ValueError):
+        write_tasks([], str(tmp_path / "tasks.csv"), "csv")
@@ -0,0 +1,151 @@
+# pylint: disable=missing-function-docstring,missing-class-docstring
+import asyncio
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.instrumentation import (
+    LatencyHistogram,
+    RequestHooks,
+    RequestInfo,
+    endpoint_template,
+)
+from scaleapi.tasks import TaskType
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, request):
+        self.events.append(("start", request.method, request.endpoint))
+
+    def on_request_end(self, request):
+        self.events.append(
+            ("end", request.endpoint, request.status_code, request.attempt)
+        )
+        self.last = request  # pylint: disable=attribute-defined-outside-init
+
+    def on_retry(self, request):
+        self.events.append(("retry", request.status_code, request.attempt))
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        ("https://api.scale.com/v1/task/abc123", "/v1/task/{task_id}"),
+        ("https://api.scale.com/v1/task/abc/cancel?x=1", "/v1/task/{task_id}/cancel"),
+        ("https://api.scale.com/v1/task/imageannotation", "/v1/task/{task_type}"),
+        ("/v1/batches/my%2Fbatch/finalize", "/v1/batches/{batch_name}/finalize"),
+        ("/v1/studio/batches/set_priorities", "/v1/studio/batches/set_priorities"),
+        ("/v1/studio/batches/b1", "/v1/studio/batches/{name}"),
+        ("http://stub/api/v1/tasks", "/api/v1/tasks"),
+        ("https://api.scale.com/v2/task?task_id=abc", "/v2/task"),
+        (
+            "https://api.scale.com/v2/datasets/task/t1/response_url/a1",
+            "/v2/datasets/task/{taskId}/response_url/{attachmentId}",
+        ),
+    ],
+)
+def test_endpoint_template(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for duration in [0.01] * 90 + [0.1] * 9 + [1.0]:
+        request = RequestInfo("GET", "/v1/task/abc")
+        request.duration = duration
+        request.status_code = 200
+        histogram.on_request_end(request)
+    histogram.on_retry(RequestInfo("GET", "/v1/task/abc", attempt=1))
+
+    (row,) = histogram.summary()
+    assert row["endpoint"] == "/v1/task/{task_id}"
+    assert row["count"] == 100
+    assert row["retries"] == 1
+    assert row["p50"] == pytest.approx(0.01, rel=0.1)
+    assert row["p95"] == pytest.approx(0.1, rel=0.1)
+    assert row["p99"] == pytest.approx(0.1, rel=0.1)
+    assert row["max"] == 1.0
+    assert "GET /v1/task/{task_id}" in histogram.report()
+
+    histogram.reset()
+    assert not histogram.summary()
+
+
+def test_client_hooks():
+    hooks = RecordingHooks()
+    with StubServer() as server:
+        with ScaleClient("test_key", api_instance_url=server.url, hooks=[hooks]) as c:
+            c.get_task("task_1")
+            c.create_task(TaskType.ImageAnnotation, instruction="Draw boxes")
+
+    assert hooks.events == [
+        ("start", "GET", "/v1/task/{task_id}"),
+        ("end", "/v1/task/{task_id}", 200, 1),
+        ("start", "POST", "/v1/task/{task_type}"),
+        ("end", "/v1/task/{task_type}", 200, 1),
+    ]
+    assert hooks.last.request_bytes > 0
+    assert hooks.last.response_bytes > 0
+    assert hooks.last.duration > 0
+
+
+def test_async_client_retry_hooks():
+    httpx = pytest.importorskip("httpx")
+    from scaleapi.async_client import (  # pylint: disable=import-outside-toplevel
+        AsyncScaleClient,
+    )
+
+    calls = []
+
+    def handler(_):
+        calls.append(1)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={"Retry-After": "0"})
+        return httpx.Response(200, json={"task_id": "task_1"})
+
+    hooks = RecordingHooks()
+
+    async def main():
+        client = AsyncScaleClient("test_key", api_instance_url="http://stub/v1")
+        client.api.instrumentation.hooks.append(hooks)
+        client.api._client = httpx.AsyncClient(  # pylint: disable=protected-access
+            transport=httpx.MockTransport(handler)
+        )
+        async with client:
+            await client.get_task("task_1")
+
+    asyncio.run(main())
+    assert hooks.events == [
+        ("start", "GET", "/v1/task/{task_id}"),
+        ("retry", 503, 1),
+        ("end", "/v1/task/{task_id}", 200, 2),
+    ]
+
+
+class FakeResponse:
+    status = 200
+    data = b'{"ok": true}'
+
+    @staticmethod
+    def getheader(_, default=None):
+        return default
+
+
+def test_v2_client_hooks():
+    hooks = RecordingHooks()
+    client = ScaleClient("test_key", hooks=[hooks])
+    api_client = client.v2.api_client
+    api_client.rest_client.request = lambda *args, **kwargs: FakeResponse()
+
+    api_client.call_api("POST", "https://api.scale.com/v2/task/metadata", body={})
+
+    assert hooks.events == [
+        ("start", "POST", "/v2/task/metadata"),
+        ("end", "/v2/task/metadata", 200, 1),
+    ]
+    assert hooks.last.request_bytes == 2
+    assert hooks.last.response_bytes == len(FakeResponse.data)
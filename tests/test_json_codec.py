@@ -0,0 +1,64 @@
+# pylint: disable=missing-function-docstring,protected-access
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient, json_codec
+from scaleapi.tasks import TaskType
+
+CODECS = ["json", "orjson", "ujson"]
+
+
+@pytest.fixture(name="codec", params=CODECS)
+def fixture_codec(request):
+    pytest.importorskip(request.param)
+    previous = json_codec.get_codec()
+    json_codec.set_codec(request.param)
+    yield json_codec.get_codec()
+    json_codec.set_codec(previous)
+
+
+def test_round_trip(codec):
+    payload = {"task_id": "t1", "tags": ["é", "漢"], "count": 3, "score": 0.5}
+    encoded = codec.dumps(payload)
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == payload
+    assert codec.loads(encoded.decode("utf-8")) == payload
+
+
+def test_large_integers(codec):
+    assert codec.loads(codec.dumps({"id": 2**70})) == {"id": 2**70}
+
+
+def test_invalid_json_raises_value_error(codec):
+    with pytest.raises(ValueError):
+        codec.loads(b"OK")
+
+
+def test_unknown_codec():
+    with pytest.raises(ValueError):
+        json_codec.set_codec("simplejson")
+
+
+@pytest.mark.parametrize("name", ["jsn", "not_installed"])
+def test_invalid_codec_environment_variable(monkeypatch, name):
+    monkeypatch.setenv(json_codec.CODEC_ENV_VAR, name)
+    monkeypatch.setitem(
+        json_codec._CODECS, "not_installed", lambda: __import__("not_installed")
+    )
+    with pytest.warns(UserWarning, match=name):
+        codec = json_codec._default_codec()
+    assert codec.name in json_codec._CODECS
+
+
+def test_client_round_trip(codec):  # pylint: disable=unused-argument
+    with StubServer(total_tasks=120) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            client.v2.api_client.configuration.host = server.v2_url
+            task = client.create_task(TaskType.ImageAnnotation, unique_id="ü1")
+            assert task.as_dict()["unique_id"] == "ü1"
+            assert len(list(client.get_tasks(project_name="p"))) == 120
+
+            page = client.v2.get_tasks(project_id="p")
+            assert page.tasks[0].threads[0].turns[0].id == "task_0_0"
+            meta = client.v2.set_task_metadata({"task_id": "t", "metadata": {"a": 1}})
+            assert meta.metadata == {"a": 1}
@@ -0,0 +1,49 @@
+# pylint: disable=missing-function-docstring
+import subprocess
+import sys
+
+import scaleapi
+from scaleapi.api_client import v2
+
+CHECK_MODULES = """
+import sys
+import scaleapi
+client = scaleapi.ScaleClient("test_key")
+print(any(name.startswith("scaleapi.api_client.v2") for name in sys.modules))
+print("asyncio" in sys.modules or "sqlite3" in sys.modules)
+client.v2
+print("scaleapi.api_client.v2.api.v2_api" in sys.modules)
+"""
+
+
+def test_import_does_not_load_v2():
+    result = subprocess.run(
+        [sys.executable, "-c", CHECK_MODULES],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.split() == ["False", "False", "True"]
+
+
+def test_v2_names_resolve_lazily():
+    assert v2.Task.__name__ == "Task"
+    assert v2.models.AnnotationInteger is v2.AnnotationInteger
+    assert "GetTasksResponse" in dir(v2.models)
+    assert set(v2.models.__all__) <= set(v2.__all__)
+    assert all(getattr(v2.models, name) for name in v2.models.__all__)
+
+
+def test_client_v2_is_created_once():
+    client = scaleapi.ScaleClient("test_key", source="pytest")
+    assert client.v2 is client.v2
+    assert "pytest" in client.v2.api_client.user_agent
+    client.close()
+
+
+def test_client_v2_can_be_replaced():
+    client = scaleapi.ScaleClient("test_key")
+    api = v2.V2Api(v2.ApiClient(v2.Configuration(access_token="other_key")))
+    client.v2 = api
+    assert client.v2 is api
+    client.close()
@@ -0,0 +1,123 @@
+# pylint: disable=missing-function-docstring
+import email.parser
+import io
+import tracemalloc
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.multipart import MultipartEncoder
+
+
+def parse(encoder):
+    message = email.parser.BytesParser().parsebytes(
+        f"Content-Type: {encoder.content_type}\r\n\r\n".encode() + encoder.read()
+    )
+    return [
+        (part.get_param("name", header="content-disposition"), part)
+        for part in message.get_payload()
+    ]
+
+
+def test_encoder_fields_and_files(tmp_path):
+    path = tmp_path / "frame.bin"
+    path.write_bytes(b"\x00\x01" * 1000)
+    fields = {"project_name": "p", "tags": ["a", "b"], "skipped": None}
+    files = {
+        "file": str(path),
+        "buffer": io.BytesIO(b"buffer data"),
+        "typed": ("scan.pcd", b"points", "application/octet-stream"),
+    }
+
+    with MultipartEncoder(fields, files) as encoder:
+        parts = parse(encoder)
+        assert len(encoder) == encoder.tell()
+
+    assert [name for name, _ in parts] == [
+        "project_name",
+        "tags",
+        "tags",
+        "file",
+        "buffer",
+        "typed",
+    ]
+    assert parts[0][1].get_payload() == "p"
+    assert parts[3][1].get_filename() == "frame.bin"
+    assert parts[3][1].get_payload(decode=True) == b"\x00\x01" * 1000
+    assert parts[4][1].get_filename() == "buffer"
+    assert parts[4][1].get_payload(decode=True) == b"buffer data"
+    assert parts[5][1].get_filename() == "scan.pcd"
+    assert parts[5][1].get_content_type() == "application/octet-stream"
+
+
+def test_encoder_text_content(tmp_path):
+    path = tmp_path / "labels.txt"
+    path.write_text("caf\u00e9\n" * 100, encoding="utf-8")
+    with open(path, encoding="utf-8") as text_file:
+        files = {
+            "text_file": text_file,
+            "text": ("notes.txt", "some text"),
+            "headers": ("a.csv", "x,y", "text/csv", {"X-Row-Count": "1"}),
+        }
+        with MultipartEncoder(files=files) as encoder:
+            parts = dict(parse(encoder))
+
+    assert parts["text_file"].get_filename() == "labels.txt"
+    assert parts["text_file"].get_payload(decode=True) == path.read_bytes()
+    assert parts["text"].get_filename() == "notes.txt"
+    assert parts["text"].get_payload(decode=True) == b"some text"
+    assert parts["headers"].get_content_type() == "text/csv"
+    assert parts["headers"]["X-Row-Count"] == "1"
+    assert parts["headers"].get_payload(decode=True) == b"x,y"
+
+
+def test_encoder_seek_and_progress():
+    progress = []
+    encoder = MultipartEncoder(
+        files={"file": io.BytesIO(b"x" * 5000)},
+        progress_callback=lambda sent, total: progress.append((sent, total)),
+    )
+    chunks = list(iter(lambda: encoder.read(1000), b""))
+    body = b"".join(chunks)
+    assert len(body) == len(encoder)
+    assert progress[-1] == (len(encoder), len(encoder))
+    assert [sent for sent, _ in progress] == sorted(sent for sent, _ in progress)
+
+    # Retried requests rewind the body
+    encoder.seek(0)
+    assert encoder.read() == body
+    encoder.seek(-10, 2)
+    assert encoder.read() == body[-10:]
+
+
+def test_encoder_memory_is_bounded(tmp_path):
+    path = tmp_path / "large.bin"
+    with open(path, "wb") as file:
+        for _ in range(32):
+            file.write(b"\xff" * 1024 * 1024)
+
+    tracemalloc.start()
+    with MultipartEncoder(files={"file": str(path)}) as encoder:
+        total = sum(len(chunk) for chunk in iter(lambda: encoder.read(65536), b""))
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert total == len(encoder) > 32 * 1024 * 1024
+    assert peak < 1024 * 1024
+
+
+def test_upload_file_streams(tmp_path):
+    path = tmp_path / "video.mp4"
+    path.write_bytes(b"v" * 300000)
+    progress = []
+
+    with StubServer() as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            uploaded = client.upload_file(
+                str(path),
+                progress_callback=lambda sent, total: progress.append(sent),
+                project_name="p",
+            )
+            assert client.upload_file(io.BytesIO(b"data")).id
+
+    assert uploaded.as_dict()["size"] > 300000
+    assert progress[-1] == uploaded.as_dict()["size"]
@@ -0,0 +1,121 @@
+# pylint: disable=missing-function-docstring,protected-access
+import time
+
+import pytest
+from urllib3.response import HTTPResponse
+
+from scaleapi import ScaleClient
+from scaleapi.api import _ObservedRetry
+from scaleapi.rate_limit import RateLimiter, parse_retry_after
+
+
+def test_rate_adapts_to_responses():
+    limiter = RateLimiter(rate=10, min_rate=1, max_rate=12, increase_step=1)
+
+    limiter.on_response(200)
+    assert limiter.rate == 11
+    limiter.on_response(200)
+    limiter.on_response(200)
+    assert limiter.rate == 12
+
+    limiter.on_response(429)
+    assert limiter.rate == 6
+    for _ in range(5):
+        limiter.on_response(429)
+    assert limiter.rate == 1
+
+    limiter.on_response(404)
+    assert limiter.rate == 1
+    assert limiter.stats()["throttled"] == 6
+
+
+def test_acquire_is_bounded_by_rate():
+    limiter = RateLimiter(rate=50, burst=1)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.09
+    assert limiter.stats()["requests"] == 6
+
+
+def test_retry_after_pauses_requests():
+    limiter = RateLimiter(rate=100)
+    limiter.on_response(429, {"Retry-After": "0.2"})
+    assert limiter.stats()["paused_for"] > 0.1
+
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.15
+
+
+@pytest.mark.parametrize(
+    "headers, paused",
+    [
+        ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "5"}, True),
+        ({"RateLimit-Remaining": "0", "RateLimit-Reset": "5"}, True),
+        ({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "5"}, False),
+        ({"X-RateLimit-Remaining": "0"}, False),
+    ],
+)
+def test_rate_limit_headers(headers, paused):
+    limiter = RateLimiter()
+    limiter.on_response(200, headers)
+    assert (limiter.stats()["paused_for"] > 0) is paused
+
+
+def test_retried_responses_are_observed():
+    observed = []
+    retry = _ObservedRetry(
+        total=3,
+        status_forcelist=[429],
+        on_retry=lambda history, res: observed.append((len(history), res)),
+    )
+    response = HTTPResponse(status=429, headers={"Retry-After": "1"})
+
+    retry = retry.increment("GET", "/v1/tasks", response=response)
+    retry = retry.increment("GET", "/v1/tasks", response=response)
+    assert observed == [(1, response), (2, response)]
+    assert retry.on_retry is not None
+
+
+def test_retries_acquire_from_the_limiter():
+    limiter = RateLimiter(rate=100)
+    client = ScaleClient("test_key", rate_limiter=limiter)
+    retry = client.api._session.adapters["https://"].max_retries
+    response = HTTPResponse(status=429)
+
+    retry.increment("GET", "/v1/tasks", response=response)
+    stats = limiter.stats()
+    assert stats["throttled"] == 1 and stats["requests"] == 1
+
+
+def test_retry_after_is_waited_once_with_a_limiter():
+    client = ScaleClient("test_key", rate_limiter=RateLimiter(rate=100))
+    retry = client.api._session.adapters["https://"].max_retries
+    response = HTTPResponse(status=429, headers={"Retry-After": "1"})
+
+    start = time.monotonic()
+    retry = retry.increment("GET", "/v1/tasks", response=response)
+    retry.sleep(response)
+    assert 0.9 <= time.monotonic() - start < 1.5
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("2") == 2
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+
+
+def test_client_shares_limiter():
+    limiter = RateLimiter()
+    client = ScaleClient("test_key", rate_limiter=limiter)
+    assert client.api.rate_limiter is limiter
+    assert client.v2.api_client.rate_limiter is limiter
+    assert client.api._session.adapters["https://"].max_retries.on_retry
+
+
+def test_invalid_rates():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=10, max_rate=5)
+    with pytest.raises(ValueError):
+        RateLimiter(decrease_factor=1)
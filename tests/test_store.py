@@ -0,0 +1,100 @@
+# pylint: disable=missing-function-docstring
+from datetime import datetime, timezone
+
+import pytest
+
+import scaleapi
+from benchmarks.stub_server import make_task
+from scaleapi.store import TaskStore
+from scaleapi.tasks import TaskStatus
+
+
+def make_tasks():
+    return [
+        make_task(
+            f"task_{i}",
+            status="completed" if i % 3 == 0 else "pending",
+            batch=f"batch_{i % 2}",
+            unique_id=f"u{i}",
+            tags=["even"] if i % 2 == 0 else ["odd", "x"],
+            created_at=f"2024-01-{i + 1:02d}T12:00:00.000Z",
+            updated_at=f"2024-02-{i + 1:02d}T12:00:00.5Z",
+        )
+        for i in range(10)
+    ]
+
+
+@pytest.fixture(name="store")
+def fixture_store():
+    with TaskStore() as store:
+        assert store.add(make_tasks(), batch_size=4) == 10
+        yield store
+
+
+def test_query(store):
+    assert store.get("task_3").unique_id == "u3"
+    assert store.get("missing") is None
+
+    completed = store.query(status=TaskStatus.Completed, batch="batch_1")
+    assert [task.id for task in completed] == ["task_3", "task_9"]
+    assert [t.id for t in store.query(unique_id=["u1", "u2"])] == ["task_1", "task_2"]
+    assert store.count(tags="x") == 5
+    assert store.count(tags=["even", "x"]) == 10
+
+    assert store.count(created_after="2024-01-05", created_before="2024-01-07") == 2
+    after = datetime(2024, 2, 10, 12, tzinfo=timezone.utc)
+    assert [task.id for task in store.query(updated_after=after)] == ["task_9"]
+    assert store.count_by("status") == {"completed": 4, "pending": 6}
+
+
+def test_unknown_filters(store):
+    with pytest.raises(ValueError):
+        list(store.query(stauts="completed"))
+    with pytest.raises(ValueError):
+        store.count(created_since="2024-01-05")
+    with pytest.raises(ValueError):
+        store.count_by("status", batch_name="batch_1")
+
+
+def test_add_replaces_tasks_and_tags(store):
+    store.add([make_task("task_0", status="canceled", tags=["new"])])
+    assert store.count() == 10
+    assert store.get("task_0").status == "canceled"
+    assert store.count(tags="even") == 4
+    assert store.count(tags="new") == 1
+
+
+def test_sync_and_refresh():
+    tasks = {task["task_id"]: task for task in make_tasks()}
+    requests = []
+
+    def get_request(endpoint, params=None):
+        assert endpoint == "tasks"
+        requests.append(params)
+        after = params["updated_after"]
+        docs = [
+            task
+            for task in tasks.values()
+            if not after or task["updated_at"].replace("T", " ") >= after
+        ]
+        return {
+            "docs": docs,
+            "total": len(docs),
+            "limit": 100,
+            "offset": 0,
+            "has_more": False,
+        }
+
+    client = scaleapi.ScaleClient("test_key")
+    client.api.get_request = get_request
+    with TaskStore(client=client) as store:
+        assert store.sync(project_name="benchmark_project") == 10
+        assert store.refresh() == 0
+
+        tasks["task_4"] = dict(
+            tasks["task_4"], status="completed", updated_at="2024-03-01T00:00:00.000Z"
+        )
+        assert store.refresh() == 1
+        assert requests[-1]["updated_after"].startswith("2024-02-10 11:50:00")
+        assert store.get("task_4").status == "completed"
+        assert store.count(status="completed") == 5
@@ -0,0 +1,62 @@
+# pylint: disable=missing-function-docstring
+import io
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.tasks import TaskType
+
+
+@pytest.fixture(name="client")
+def fixture_client():
+    with StubServer(total_tasks=150, total_batches=30) as server:
+        client = ScaleClient("test_key", api_instance_url=server.url)
+        client.v2.api_client.configuration.host = server.v2_url
+        with client:
+            yield client
+
+
+def test_v1_endpoints(client):
+    assert client.get_task("task_1").id == "task_1"
+    assert client.create_task(TaskType.ImageAnnotation).type == "imageannotation"
+    assert client.cancel_task("task_1").status == "canceled"
+    assert len(list(client.get_tasks(project_name="p"))) == 150
+    assert len(list(client.get_batches(project_name="p"))) == 30
+    assert client.finalize_batch("b").status == "in_progress"
+    assert client.get_project("p").name == "p"
+    assert client.upload_file(io.BytesIO(b"data")).as_dict()["size"] > 0
+
+
+def test_v2_endpoints(client):
+    page = client.v2.get_tasks(project_id="p")
+    assert len(page.tasks) == 100
+    assert page.next_token == "100"
+    assert client.v2.get_tasks(next_token=page.next_token).next_token is None
+
+    task = client.v2.get_task(task_id="task_1")
+    assert task.threads[0].turns[0].annotations[0].actual_instance.value == 4
+    assert client.v2.get_batch(batch_id="b").id == "b"
+    assert len(client.v2.get_projects().projects) == 10
+
+
+def test_task_overrides():
+    response = {"annotations": [{"label": "car"}] * 3}
+    with StubServer(total_tasks=5, task_overrides={"response": response}) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            tasks = list(client.get_tasks(project_name="p"))
+    assert [task.response for task in tasks] == [response] * 5
+
+
+def test_failure_injection_is_reproducible():
+    def draws(seed):
+        server = StubServer(error_rate=0.2, throttle_rate=0.2, seed=seed)
+        # pylint: disable=protected-access
+        failures = [server._httpd.inject_failure() for _ in range(200)]
+        server.stop()
+        return [failure and failure[1] for failure in failures]
+
+    statuses = draws(seed=1)
+    assert statuses == draws(seed=1)
+    assert 20 < statuses.count(429) < 60
+    assert 20 < statuses.count(500) < 60
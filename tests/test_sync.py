@@ -0,0 +1,96 @@
+# pylint: disable=missing-function-docstring
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import scaleapi
+from scaleapi.checkpoint import FileCheckpoint
+from scaleapi.sync import TaskSync
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeProject:
+    """`tasks` endpoint of a project filtering by `updated_after`"""
+
+    def __init__(self, count):
+        self.tasks = {}
+        self.requests = []
+        for i in range(count):
+            self.update(f"task_{i}", START + timedelta(seconds=i))
+
+    def update(self, task_id, updated_at):
+        self.tasks[task_id] = {
+            "task_id": task_id,
+            "updated_at": updated_at.isoformat().replace("+00:00", "Z"),
+        }
+
+    def get_request(self, endpoint, params=None):
+        assert endpoint == "tasks"
+        self.requests.append(params)
+        after = params.get("updated_after")
+        docs = [
+            task
+            for task in self.tasks.values()
+            if not after
+            or datetime.fromisoformat(task["updated_at"][:-1])
+            >= datetime.fromisoformat(after)
+        ]
+        start = int(params.get("next_token") or 0)
+        return {
+            "docs": docs[start : start + 10],
+            "total": len(docs),
+            "limit": 10,
+            "offset": start,
+            "has_more": start + 10 < len(docs),
+            "next_token": str(start + 10),
+        }
+
+
+@pytest.fixture(name="project")
+def fixture_project():
+    return FakeProject(25)
+
+
+@pytest.fixture(name="client")
+def fixture_client(project):
+    client = scaleapi.ScaleClient("test_key")
+    client.api.get_request = project.get_request
+    return client
+
+
+def test_sync_only_changed_tasks(client, project, tmp_path):
+    path = str(tmp_path / "sync.json")
+    sync = TaskSync(client, path, project_name="p", overlap=timedelta(seconds=5))
+    synced = []
+
+    assert sync.run(synced.append) == 25
+    assert sync.watermark == START + timedelta(seconds=24)
+    assert project.requests[0]["updated_after"] is None
+
+    # Tasks in the overlap window are listed again but not synced
+    assert sync.run(synced.append) == 0
+    assert project.requests[-1]["updated_after"] == "2024-01-01 00:00:19.000000"
+
+    project.update("task_3", START + timedelta(seconds=30))
+    project.update("task_25", START + timedelta(seconds=22))  # late arrival
+    changed = [task.id for task in sync.changes()]
+    assert sorted(changed) == ["task_25", "task_3"]
+    assert sync.watermark == START + timedelta(seconds=30)
+
+
+def test_interrupted_sync_is_retried(client, tmp_path):
+    store = FileCheckpoint(str(tmp_path / "sync.json"))
+    sync = TaskSync(client, store, project_name="p")
+    changes = sync.changes()
+    next(changes)
+    changes.close()
+    assert store.load() is None
+    assert sync.run(lambda task: None) == 25
+
+
+def test_sync_state_of_another_scope(client, tmp_path):
+    path = str(tmp_path / "sync.json")
+    TaskSync(client, path, project_name="p").run(lambda task: None)
+    with pytest.raises(ValueError):
+        TaskSync(client, path, batch_name="b").run(lambda task: None)
@@ -0,0 +1,48 @@
+# pylint: disable=missing-function-docstring
+import pytest
+
+from benchmarks.stub_server import StubServer, make_task
+from scaleapi import ScaleClient
+from scaleapi.tasks import CompactTask, Task
+
+
+def test_compact_task_fields():
+    payload = make_task("task_1", unique_id="u1", metadata={"key": "value"})
+    task = CompactTask(payload, None)
+    assert task.id == task.task_id == "task_1"
+    assert task.as_dict() == {
+        key: payload[key]
+        for key in (
+            "task_id",
+            "status",
+            "project",
+            "batch",
+            "created_at",
+            "completed_at",
+            "unique_id",
+            "metadata",
+        )
+    }
+    assert not hasattr(task, "__dict__")
+    with pytest.raises(AttributeError):
+        task.params  # pylint: disable=pointless-statement
+
+
+def test_compact_task_equality():
+    task = CompactTask(make_task("task_1"), None)
+    assert task == CompactTask(make_task("task_1", status="pending"), None)
+    assert task != CompactTask(make_task("task_2"), None)
+    assert len({task, CompactTask(make_task("task_1"), None)}) == 1
+
+
+def test_get_tasks_compact():
+    with StubServer(total_tasks=120) as server:
+        with ScaleClient("test_key", api_instance_url=server.url) as client:
+            tasks = list(client.get_tasks(project_name="p", compact=True))
+            assert len(tasks) == 120
+            assert all(isinstance(task, CompactTask) for task in tasks)
+            assert tasks[0].project is tasks[1].project
+
+            full = tasks[5].fetch()
+            assert isinstance(full, Task)
+            assert full.id == tasks[5].id
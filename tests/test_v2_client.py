@@ -71,6 +71,63 @@ def test_v2_create_batch_request_creation():
         pytest.fail(f"Failed to import CreateBatchRequest: {e}")
 
 
+def test_v2_annotation_dispatch_on_type():
+    """Test Annotation deserialization dispatched on its type."""
+    from scaleapi.api_client.v2.models import (
+        Annotation,
+        AnnotationCategoryMultiple,
+        AnnotationInteger,
+    )
+
+    annotation = Annotation.from_dict(
+        {"id": "a1", "key": "rating", "type": "integer", "value": 4}
+    )
+    assert isinstance(annotation.actual_instance, AnnotationInteger)
+    assert annotation.to_dict()["value"] == 4
+
+    annotation = Annotation.from_json(
+        '{"id": "a2", "key": "tags", "type": "category_multiple", "value": ["x"]}'
+    )
+    assert isinstance(annotation.actual_instance, AnnotationCategoryMultiple)
+
+    with pytest.raises(ValueError, match="Can't discriminate"):
+        Annotation.from_dict({"id": "a3", "key": "k", "type": "integer", "value": "x"})
+
+
+def test_v2_annotation_unknown_type_falls_back():
+    """Test Annotation deserialization of an unknown type."""
+    from scaleapi.api_client.v2.models import Annotation
+
+    with pytest.raises(ValueError, match="Multiple matches"):
+        Annotation.from_dict({"id": "a1", "key": "k", "type": "new", "value": "x"})
+    with pytest.raises(ValueError, match="No match"):
+        Annotation.from_dict({"id": "a1", "type": "new"})
+
+
+def test_v2_deserializer_plans_are_cached():
+    """Test response types resolved once by the ApiClient."""
+    from scaleapi.api_client.v2 import ApiClient
+    from scaleapi.api_client.v2.models import Project, TaskStatus
+
+    api_client = ApiClient()
+    project = b'{"id": "p1", "name": "p1", "created_at": "2021-06-17T21:46:36Z"}'
+    body = b'{"a": [' + project + b', null], "b": null}'
+    for _ in range(2):
+        projects = api_client.deserialize(
+            body, "Dict[str, List[Project]]", "application/json"
+        )
+        assert isinstance(projects["a"][0], Project)
+        assert projects["a"][1] is None and projects["b"] is None
+    assert list(api_client._deserializers) == ["Dict[str, List[Project]]"]
+
+    statuses = api_client.deserialize(
+        b'["completed", "pending"]', "List[TaskStatus]", "application/json"
+    )
+    assert statuses == [TaskStatus.COMPLETED, TaskStatus.PENDING]
+    assert api_client.deserialize(b"12", "int", "application/json") == 12
+    assert api_client.deserialize(b"null", "GetTasksResponse", None) is None
+
+
 def test_v2_imports_basic():
     """Test basic v2 API imports work."""
     if not HAS_TEST_API_KEY:
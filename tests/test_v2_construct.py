@@ -0,0 +1,74 @@
+# pylint: disable=missing-function-docstring
+from datetime import datetime
+
+from benchmarks.stub_server import (
+    StubServer,
+    make_v2_batch,
+    make_v2_project,
+    make_v2_task,
+)
+from scaleapi import ScaleClient
+from scaleapi.api_client.v2 import ApiClient
+from scaleapi.api_client.v2.construct import construct
+from scaleapi.api_client.v2.models import (
+    AnnotationInteger,
+    Batch,
+    GetTasksResponse,
+    Project,
+    Task,
+)
+
+
+def test_construct_matches_validated_models():
+    page = {
+        "tasks": [
+            make_v2_task("task_1", turns=3),
+            make_v2_task(
+                "task_2",
+                project=make_v2_project("project_0"),
+                batch=make_v2_batch("batch_0"),
+            ),
+        ],
+        "next_token": "2",
+    }
+
+    constructed = construct(GetTasksResponse, page)
+    validated = GetTasksResponse.from_dict(page)
+
+    assert constructed == validated
+    assert constructed.to_json() == validated.to_json()
+    task = constructed.tasks[0]
+    assert isinstance(task.created_at, datetime)
+    annotation = task.threads[0].turns[0].annotations[0].actual_instance
+    assert isinstance(annotation, AnnotationInteger) and annotation.value == 4
+    assert isinstance(constructed.tasks[1].project.actual_instance, Project)
+    assert isinstance(constructed.tasks[1].batch.actual_instance, Batch)
+
+
+def test_construct_keeps_unknown_enum_values():
+    task = construct(Task, make_v2_task("task_1", status="new_status"))
+    assert task.status == "new_status"
+
+
+def test_api_client_validate_responses():
+    api_client = ApiClient()
+    api_client.validate_responses = False
+    body = b'{"task_id": "task_1", "status": "completed", "threads": []}'
+
+    task = api_client.deserialize(body, "Task", "application/json")
+    assert isinstance(task, Task)
+    assert task.task_id == "task_1" and task.threads == []
+
+
+def test_client_validate_responses():
+    with StubServer(total_tasks=150) as server:
+        client = ScaleClient(
+            "test_key", api_instance_url=server.url, validate_responses=False
+        )
+        client.v2.api_client.configuration.host = server.v2_url
+        with client:
+            assert client.v2.api_client.validate_responses is False
+            tasks = list(client.v2_get_tasks(project_name="p"))
+
+    assert len(tasks) == 150
+    assert tasks[0] == Task.from_dict(make_v2_task(tasks[0].task_id))
@@ -0,0 +1,54 @@
+# pylint: disable=missing-function-docstring
+import pytest
+
+from benchmarks.stub_server import StubServer, make_v2_task
+from scaleapi import ScaleClient
+from scaleapi.api_client.v2.lazy import LazyTask, deserialize, lazy_task
+from scaleapi.api_client.v2.models import GetTasksResponse, Task
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_lazy_tasks_match_eager_tasks(validate):
+    page = {
+        "tasks": [make_v2_task("task_1", turns=3), make_v2_task("task_2")],
+        "next_token": "2",
+    }
+    eager = GetTasksResponse.from_dict(page)
+
+    response = deserialize(GetTasksResponse, page, validate)
+    task = response.tasks[0]
+    assert isinstance(task, LazyTask) and isinstance(task, Task)
+    assert "threads" not in task.__dict__
+    assert task.task_id == "task_1"
+    # Nested lazy tasks are parsed when the response is serialized
+    assert response.to_json() == eager.to_json()
+    assert "threads" in task.__dict__
+
+    response = deserialize(GetTasksResponse, page, validate)
+    assert response == eager and eager == response
+    assert response.to_dict() == eager.to_dict()
+    turn = response.tasks[0].threads[0].turns[0]
+    assert turn == eager.tasks[0].threads[0].turns[0]
+
+
+def test_lazy_task_assignment():
+    task = lazy_task(make_v2_task("task_1"))
+    task.status = "pending"
+    assert "threads" not in task.__dict__
+    assert len(task.threads) == 1
+
+    task = lazy_task(make_v2_task("task_1"))
+    task.threads = []
+    assert task.threads == [] and task.to_dict()["threads"] == []
+
+
+def test_client_lazy_threads():
+    with StubServer(total_tasks=150) as server:
+        client = ScaleClient("test_key", api_instance_url=server.url, lazy_threads=True)
+        client.v2.api_client.configuration.host = server.v2_url
+        with client:
+            tasks = list(client.v2_get_tasks(project_name="p"))
+
+    assert len(tasks) == 150
+    assert all(isinstance(task, LazyTask) for task in tasks)
+    assert tasks[0] == Task.from_dict(make_v2_task(tasks[0].task_id))
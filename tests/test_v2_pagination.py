@@ -0,0 +1,128 @@
+# pylint: disable=missing-function-docstring
+import asyncio
+import itertools
+
+import pytest
+
+from benchmarks.stub_server import StubServer
+from scaleapi import ScaleClient
+from scaleapi.api_client.v2 import GetTasksResponse
+from scaleapi.checkpoint import FileCheckpoint
+from scaleapi.concurrency import async_iterated
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    with StubServer(total_tasks=250, total_batches=120) as server:
+        yield server
+
+
+@pytest.fixture(name="client")
+def fixture_client(server):
+    client = ScaleClient("test_key", api_instance_url=server.url)
+    client.v2.api_client.configuration.host = server.v2_url
+    with client:
+        yield client
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_v2_list_helpers(client, server, prefetch):
+    batches = [b.id for b in client.v2_get_batches(project_id="p", prefetch=prefetch)]
+    assert batches == [f"batch_{i}" for i in range(120)]
+    tasks = list(client.v2_get_delivered_responses(delivery_id="d", prefetch=prefetch))
+    assert [task.task_id for task in tasks] == [f"task_{i}" for i in range(250)]
+    assert tasks[0].delivery_id == "d"
+    tasks = client.v2_get_dataset_tasks(dataset_id="s", limit=50, prefetch=prefetch)
+    assert len(list(tasks)) == 250
+
+    # Endpoints without pagination are requested once
+    assert [d.id for d in client.v2_get_deliveries(project_id="p")] == ["delivery_0"]
+    assert [d.id for d in client.v2_get_datasets()] == ["dataset_0"]
+    assert server.requests["GET /v2/datasets"] == 1
+
+
+def test_v2_async_helpers(client):
+    async def collect(items):
+        return [item async for item in items]
+
+    async def main():
+        return (
+            await collect(client.v2_get_batches_async(project_id="p", prefetch=2)),
+            await collect(client.v2_get_delivered_responses_async(delivery_id="d")),
+            await collect(client.v2_get_tasks_async(project_id="p", limit=50)),
+            await collect(client.v2_get_datasets_async()),
+        )
+
+    batches, responses, tasks, datasets = asyncio.run(main())
+    assert batches == list(client.v2_get_batches(project_id="p"))
+    assert responses == list(client.v2_get_delivered_responses(delivery_id="d"))
+    assert [task.task_id for task in tasks] == [f"task_{i}" for i in range(250)]
+    assert [dataset.id for dataset in datasets] == ["dataset_0"]
+
+
+def test_v2_paginate_requires_a_list_response(client):
+    with pytest.raises(TypeError):
+        list(client.v2_paginate("get_task", task_id="task_0"))
+
+
+def test_v2_paginate_stops_on_empty_token(tmp_path):
+    store = FileCheckpoint(str(tmp_path / "state.json"))
+    calls = []
+
+    class Api:
+        def get_tasks(self, **kwargs):
+            calls.append(kwargs)
+            return GetTasksResponse(tasks=[], next_token="")
+
+    client = ScaleClient("test_key")
+    client.v2 = Api()
+    assert not list(client.v2_paginate("get_tasks", checkpoint=store, limit=10))
+    assert calls == [{"limit": 10}]
+    assert store.load() is None
+
+
+def test_v2_paginate_async_resumes(client, tmp_path):
+    store = FileCheckpoint(str(tmp_path / "state.json"))
+
+    async def main():
+        tasks = client.v2_paginate_async(
+            "get_tasks", project_id="p", limit=50, checkpoint=store, prefetch=1
+        )
+        first = [task.task_id async for task in _islice(tasks, 120)]
+        await tasks.aclose()
+        assert store.load()["next_token"] == "100"
+
+        tasks = client.v2_paginate_async(
+            "get_tasks", project_id="p", limit=50, checkpoint=store
+        )
+        return first, [task.task_id async for task in tasks]
+
+    first, rest = asyncio.run(main())
+    assert first[:100] + rest == [f"task_{i}" for i in range(250)]
+    assert store.load() is None
+
+
+def test_async_iterated_closes_the_iterable():
+    closed = []
+
+    def pages():
+        try:
+            yield from itertools.count()
+        finally:
+            closed.append(True)
+
+    async def main():
+        items = async_iterated(pages())
+        assert [item async for item in _islice(items, 3)] == [0, 1, 2]
+        await items.aclose()
+
+    asyncio.run(main())
+    assert closed == [True]
+
+
+async def _islice(items, count):
+    async for item in items:
+        yield item
+        count -= 1
+        if not count:
+            return